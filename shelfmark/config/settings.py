@@ -1232,6 +1232,12 @@ def advanced_settings():
             ],
             default="absolute",
         ),
+        CheckboxField(
+            key="PREFER_ZERO_COPY",
+            label="Kernel Copy Offload",
+            description="Copy files with copy_file_range when hardlinking or renaming isn't possible, allowing reflinks and server-side copies. Disable if copies to a network share fail.",
+            default=True,
+        ),
         HeadingField(
             key="remote_path_mappings_heading",
             title="Remote Path Mappings",
@@ -111,6 +111,7 @@ class Config:
         with self._cache_lock:
             self._loaded = False
             self._load_settings()
+        _get_registry().bump_config_version()
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -7,6 +7,8 @@ from enum import Enum
 import re
 import time
 
+from shelfmark.core.utils import is_audiobook
+
 
 def build_filename(
     title: str,
@@ -102,6 +104,11 @@ class DownloadTask:
             return self.priority < other.priority
         return self.added_time < other.added_time
 
+    @property
+    def is_audiobook(self) -> bool:
+        """Whether content_type marks this task as an audiobook."""
+        return is_audiobook(self.content_type)
+
     def get_filename(self) -> str:
         """Build sanitized filename from task metadata."""
         if self.download_path:
@@ -2,10 +2,12 @@
 
 import os
 import re
-from pathlib import Path
+from functools import lru_cache
+from pathlib import Path, PurePath
 from typing import Dict, Optional, Union, Mapping
 
 from shelfmark.core.logger import setup_logger
+from shelfmark.core.settings_registry import get_config_version
 
 logger = setup_logger(__name__)
 
@@ -18,7 +20,13 @@ KNOWN_TOKENS = ['seriesposition', 'partnumber', 'subtitle', 'author', 'series',
 BRACE_PATTERN = re.compile(r'\{([^}]+)\}')
 
 # Characters that are invalid in filenames on various filesystems
-INVALID_CHARS = re.compile(r'[\\/:*?"<>|]')
+_INVALID_TABLE = str.maketrans(dict.fromkeys('\\/:*?"<>|', '_'))
+
+# Whitespace and dots trimmed from both ends of a sanitized name
+_SANITIZE_STRIP_CHARS = ' \t\n\r\f\v.'
+
+# Runs of underscores left after replacing invalid characters
+UNDERSCORE_RUN_PATTERN = re.compile(r'_+')
 
 
 def _sanitize(name: Optional[str], max_length: int = 245) -> str:
@@ -26,9 +34,10 @@ def _sanitize(name: Optional[str], max_length: int = 245) -> str:
     if not name:
         return ""
 
-    sanitized = INVALID_CHARS.sub('_', name)
-    sanitized = re.sub(r'^[\s.]+|[\s.]+$', '', sanitized)  # Strip whitespace and dots
-    sanitized = re.sub(r'_+', '_', sanitized)  # Collapse underscores
+    sanitized = name.translate(_INVALID_TABLE)
+    sanitized = sanitized.strip(_SANITIZE_STRIP_CHARS)  # Strip whitespace and dots
+    if '__' in sanitized:  # Most names have no runs; skip the regex pass
+        sanitized = UNDERSCORE_RUN_PATTERN.sub('_', sanitized)  # Collapse underscores
     return sanitized[:max_length]
 
 
@@ -52,14 +61,26 @@ def format_series_position(position: Optional[Union[str, int, float]]) -> str:
     return str(position)
 
 
-# Pads numbers to 9 digits for natural sorting (e.g., "Part 2" -> "Part 000000002")
-PAD_NUMBERS_PATTERN = re.compile(r'\d+')
+# Splits digit runs out of a filename for natural sorting
+# (e.g., "Part 10.mp3" -> ["part ", "10", ".mp3"])
+SPLIT_NUMBERS_PATTERN = re.compile(r'(\d+)')
+_split_numbers = SPLIT_NUMBERS_PATTERN.split
+
 
+def natural_sort_key(path: Union[str, Path]) -> tuple[Union[str, int], ...]:
+    """Generate a sort key that orders embedded numbers numerically.
 
-def natural_sort_key(path: Union[str, Path]) -> str:
-    """Generate a sort key with padded numbers for natural sorting."""
-    filename = Path(path).name.lower()
-    return PAD_NUMBERS_PATTERN.sub(lambda m: m.group().zfill(9), filename)
+    re.split with a capturing group always alternates text and digit runs,
+    so text and int parts line up at the same positions across keys.
+    """
+    if isinstance(path, PurePath):
+        filename = path.name
+    else:
+        filename = os.path.basename(os.fspath(path).rstrip(os.sep))
+    parts: list = _split_numbers(filename.lower())
+    # Digit runs sit at the odd indexes; convert them in one C-level pass
+    parts[1::2] = map(int, parts[1::2])
+    return tuple(parts)
 
 
 def assign_part_numbers(
@@ -71,84 +92,198 @@ def assign_part_numbers(
         return []
 
     sorted_files = sorted(files, key=natural_sort_key)
+    format_part = f"{{:0{zero_pad_width}d}}".format
     return [
-        (file_path, str(part_num).zfill(zero_pad_width))
+        (file_path, format_part(part_num))
         for part_num, file_path in enumerate(sorted_files, start=1)
     ]
 
 
+# A compiled template is a sequence of (literal, token, prefix, suffix) segments.
+# The literal is emitted as-is, followed by the token's value wrapped in its
+# prefix/suffix (or nothing when the value is empty). The last segment carries
+# the trailing literal and has no token.
+TemplateSegment = tuple[str, Optional[str], str, str]
+
+
+@lru_cache(maxsize=128)
+def _compile_template(template: str) -> tuple[TemplateSegment, ...]:
+    """Split a template into literal text and token blocks (cached per template)."""
+    segments: list[TemplateSegment] = []
+    literal: list[str] = []
+    pos = 0
+
+    for match in BRACE_PATTERN.finditer(template):
+        literal.append(template[pos:match.start()])
+        pos = match.end()
+
+        content = match.group(1)
+        content_lower = content.lower()
+
+        # The first known token in KNOWN_TOKENS order wins, wherever it sits in
+        # the block; this runs once per template, so a scan per token is fine
+        for token in KNOWN_TOKENS:
+            idx = content_lower.find(token)
+            if idx != -1:
+                break
+        else:
+            # No known token found → keep original block unchanged
+            literal.append(match.group(0))
+            continue
+
+        segments.append((
+            _collapse_slashes("".join(literal)),
+            _CANONICAL_TOKENS[token],
+            _collapse_slashes(content[:idx]),
+            _collapse_slashes(content[idx + len(token):]),
+        ))
+        literal = []
+
+    literal.append(template[pos:])
+    segments.append((_collapse_slashes("".join(literal)), None, "", ""))
+    return tuple(segments)
+
+
+def _collapse_slashes(text: str) -> str:
+    while '//' in text:
+        text = text.replace('//', '/')
+    return text
+
+
+def _append_chunk(parts: list[str], chunk: str) -> None:
+    """Append a rendered chunk, never producing '//' at the seam."""
+    if not chunk:
+        return
+    if chunk[0] == '/' and parts and parts[-1][-1] == '/':
+        chunk = chunk[1:]
+        if not chunk:
+            return
+    parts.append(chunk)
+
+
+# One shared string object per token: compiled segments and normalized
+# metadata keys both use these, so lookups match on identity
+_CANONICAL_TOKENS = {token: token for token in KNOWN_TOKENS}
+
+
+def normalize_metadata(
+    metadata: Mapping[str, Optional[Union[str, int, float]]],
+) -> Dict[str, Optional[Union[str, int, float]]]:
+    """Lowercase metadata keys for token lookup, dropping keys no token uses."""
+    normalized = {}
+    for key, value in metadata.items():
+        token = _CANONICAL_TOKENS.get(key.lower())
+        if token is not None:
+            normalized[token] = value
+    return normalized
+
+
 def parse_naming_template(
     template: str,
     metadata: Mapping[str, Optional[Union[str, int, float]]],
     *,
     allow_path_separators: bool = True,
+    normalized: Optional[Mapping[str, Optional[Union[str, int, float]]]] = None,
 ) -> str:
     if not template:
         return ""
 
-    # Normalize metadata keys to lowercase for case-insensitive matching
-    normalized = {k.lower(): v for k, v in metadata.items()}
+    # Purely literal templates never need compiling (or a cache slot)
+    if '{' not in template:
+        return _clean_rendered(_collapse_slashes(template))
 
-    def replace_block(match: re.Match) -> str:
-        content = match.group(1)
-        content_lower = content.lower()
+    segments = _compile_template(template)
 
-        # Find which known token appears in this block (longest first)
-        for token in KNOWN_TOKENS:
-            idx = content_lower.find(token)
-            if idx != -1:
-                prefix = content[:idx]
-                suffix = content[idx + len(token):]
+    # Nothing to substitute: skip metadata normalization and the segment walk
+    if len(segments) == 1:
+        return _clean_rendered(segments[0][0])
+
+    # Normalize metadata keys to lowercase for case-insensitive matching,
+    # unless the caller already did (see normalize_metadata)
+    if normalized is None:
+        normalized = normalize_metadata(metadata)
+
+    # Literals are slash-collapsed at compile time and values never contain
+    # '/', so only the seams between chunks can produce a double slash
+    parts: list[str] = []
+    for literal, token, prefix, suffix in segments:
+        _append_chunk(parts, literal)
+        if token is None:
+            continue
 
-                # Get the value for this token
-                value = normalized.get(token)
+        value = normalized.get(token)
 
-                # Special handling for series position
-                if token == 'seriesposition':
-                    value = format_series_position(value)
+        # Special handling for series position
+        if token == 'seriesposition':
+            value = format_series_position(value)
 
-                # Convert to string
-                if value is None:
-                    value = ""
-                else:
-                    value = str(value).strip()
+        # Convert to string
+        value = "" if value is None else str(value).strip()
 
-                # If value is empty, return empty string (no prefix/suffix)
-                if not value:
-                    return ""
+        # If value is empty, skip the block entirely (no prefix/suffix)
+        if not value:
+            continue
 
-                if not allow_path_separators:
-                    value = value.replace("/", "_")
-                # Sanitize the value
-                value = sanitize_filename(value)
+        if not allow_path_separators:
+            value = value.replace("/", "_")
 
-                return f"{prefix}{value}{suffix}"
+        _append_chunk(parts, prefix)
+        _append_chunk(parts, sanitize_filename(value))
+        _append_chunk(parts, suffix)
 
-        # No known token found → return original block unchanged
-        return match.group(0)
+    return _clean_rendered("".join(parts))
 
-    # Replace all tokens
-    result = BRACE_PATTERN.sub(replace_block, template)
 
-    # Clean up any double slashes that might result from empty tokens
-    result = re.sub(r'/+', '/', result)
+# Orphaned separators trimmed from both ends of a rendered template
+_STRIP_CHARS = ' \t\n\r\f\v-_./'
 
-    # Remove leading/trailing slashes
-    result = result.strip('/')
 
-    # Clean up any orphaned separators (e.g., " - " at start/end, or " -  - ")
-    result = re.sub(r'^[\s\-_.]+', '', result)
-    result = re.sub(r'[\s\-_.]+$', '', result)
-    result = re.sub(r'(\s*-\s*){2,}', ' - ', result)
+def _clean_rendered(text: str) -> str:
+    """Tidy up a rendered template in a single pass.
 
-    # Clean up empty parentheses/brackets
-    result = re.sub(r'\(\s*\)', '', result)
-    result = re.sub(r'\[\s*\]', '', result)
+    Folds runs of two or more dash separators into a single " - ", drops
+    empty ()/[] pairs left by empty tokens and trims orphaned separators from
+    both ends. Slashes are already de-duplicated while rendering.
+    """
+    out: list[str] = []
+    i = 0
+    n = len(text)
 
-    # Final trim of any trailing separators left after cleanup
-    result = re.sub(r'[\s\-_.]+$', '', result)
+    while i < n:
+        ch = text[i]
 
-    return result
+        if ch == '-' or ch.isspace():
+            # Consume the whole whitespace/dash run (e.g. " -  - ")
+            j = i
+            dashes = 0
+            while j < n and (text[j] == '-' or text[j].isspace()):
+                if text[j] == '-':
+                    dashes += 1
+                j += 1
+            out.append(' - ' if dashes >= 2 else text[i:j])
+            i = j
+            continue
+
+        if ch == '(' or ch == '[':
+            close = ')' if ch == '(' else ']'
+            j = i + 1
+            while j < n and text[j].isspace():
+                j += 1
+            if j < n and text[j] == close:
+                # Empty brackets, e.g. "()" from an empty {Year}
+                i = j + 1
+                continue
+
+        out.append(ch)
+        i += 1
+
+    # Trim orphaned separators (e.g. " - " or "/") from both ends
+    return ''.join(out).strip(_STRIP_CHARS)
+
+
+@lru_cache(maxsize=16)
+def _resolved_base(base_path: str) -> str:
+    return str(Path(base_path).resolve())
 
 
 def build_library_path(
@@ -157,49 +292,72 @@ def build_library_path(
     metadata: Mapping[str, Optional[Union[str, int, float]]],
     extension: Optional[str] = None,
 ) -> Path:
-    relative = parse_naming_template(template, metadata, allow_path_separators=True)
+    normalized = normalize_metadata(metadata)
+    relative = parse_naming_template(
+        template,
+        metadata,
+        allow_path_separators=True,
+        normalized=normalized,
+    )
 
     if not relative:
         # Fallback to title if template produces empty result
-        title = metadata.get('Title') or metadata.get('title') or 'Unknown'
+        title = normalized.get('title') or 'Unknown'
         relative = sanitize_filename(str(title))
 
     # Remove any path traversal attempts
-    relative = relative.replace('..', '')
-
-    base = Path(base_path).resolve()
-    full_path = (base / relative).resolve()
+    relative = os.path.normpath(relative.replace('..', ''))
 
-    # Verify the path is within the base directory
-    try:
-        full_path.relative_to(base)
-    except ValueError:
+    # Verify the path stays within the base directory (checked in-memory,
+    # so only the base itself needs to touch the filesystem)
+    if os.path.isabs(relative) or relative == '..' or relative.startswith('../'):
         raise ValueError(f"Path traversal detected: template would escape library directory")
 
+    # Join as strings and build a single Path at the end; each Path "/"
+    # re-parses its operands and allocates an intermediate object
+    base = _resolved_base(base_path)
+    full_path = base if relative == '.' else os.path.join(base, relative)
+
     if extension:
         ext = extension.lstrip('.')
         # Don't use with_suffix() - it replaces everything after the first dot
         # e.g., "2.5 - Title" would become "2.epub" instead of "2.5 - Title.epub"
-        full_path = Path(f"{full_path}.{ext}")
+        full_path = f"{full_path}.{ext}"
+
+    return Path(full_path)
+
 
-    return full_path
+@lru_cache(maxsize=512)
+def _device_for_existing(path: str, config_version: int) -> int:
+    """Return st_dev for an existing path (raises OSError if missing).
+
+    Cached per config version, so changing the download or library paths (or
+    refreshing config after remounting them) drops stale devices.
+    """
+    return os.stat(path).st_dev
 
 
 def same_filesystem(path1: Union[str, Path], path2: Union[str, Path]) -> bool:
     """Check if two paths are on the same filesystem."""
-    path1 = Path(path1)
-    path2 = Path(path2)
-
-    def get_device(p: Path) -> Optional[int]:
-        try:
-            while not p.exists():
-                p = p.parent
-                if p == p.parent:
-                    break
-            return os.stat(p).st_dev
-        except (OSError, PermissionError) as e:
-            logger.debug(f"Cannot stat {p}: {e}")
-            return None
+
+    config_version = get_config_version()
+
+    def get_device(path: Union[str, Path]) -> Optional[int]:
+        p = os.path.abspath(path)
+        # Walk up to the nearest existing ancestor; devices of paths already
+        # seen are cached, so repeated checks skip the stat entirely
+        while True:
+            try:
+                return _device_for_existing(p, config_version)
+            except (FileNotFoundError, NotADirectoryError):
+                parent = os.path.dirname(p)
+                if parent == p:
+                    logger.debug(f"Cannot stat {p}: no existing ancestor")
+                    return None
+                p = parent
+            except OSError as e:
+                logger.debug(f"Cannot stat {p}: {e}")
+                return None
 
     dev1 = get_device(path1)
     dev2 = get_device(path2)
@@ -6,9 +6,12 @@ Reuses field definitions from the settings registry where possible.
 """
 
 import json
+import os
+import time
 from dataclasses import replace
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from shelfmark.core.logger import setup_logger
 from shelfmark.core.settings_registry import (
@@ -17,7 +20,10 @@ from shelfmark.core.settings_registry import (
     get_settings_tab,
     serialize_field,
     save_config_file,
+    save_config_files,
     get_setting_value,
+    get_registry_version,
+    get_config_version,
 )
 
 logger = setup_logger(__name__)
@@ -32,29 +38,61 @@ def _get_config_dir() -> Path:
     return Path(CONFIG_DIR)
 
 
+# (path, mtime_ns, size) of settings.json -> onboarding flag read from it
+_onboarding_status_cache: Optional[Tuple[Tuple[str, int, int], bool]] = None
+
+
+def _settings_file_signature(config_file: Path) -> Optional[Tuple[str, int, int]]:
+    try:
+        stat = os.stat(config_file)
+    except OSError:
+        return None
+    return (str(config_file), stat.st_mtime_ns, stat.st_size)
+
+
 def is_onboarding_complete() -> bool:
-    """Check if onboarding has been completed."""
+    """Check if onboarding has been completed.
+
+    The parsed flag is cached against settings.json's mtime and size, so
+    repeated checks only cost a stat until the file changes.
+    """
+    global _onboarding_status_cache
+
     config_file = _get_config_dir() / "settings.json"
-    if not config_file.exists():
+    signature = _settings_file_signature(config_file)
+    if signature is None:
         return False
 
+    cached = _onboarding_status_cache
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
     try:
         with open(config_file, 'r') as f:
             config = json.load(f)
-            return config.get(ONBOARDING_STORAGE_KEY, False)
+            complete = config.get(ONBOARDING_STORAGE_KEY, False)
     except (json.JSONDecodeError, OSError) as e:
         logger.warning(f"Could not read onboarding status from settings.json: {e}")
         return False
 
+    _onboarding_status_cache = (signature, complete)
+    return complete
+
 
 def mark_onboarding_complete() -> bool:
     """Mark onboarding as complete."""
+    global _onboarding_status_cache
+
     try:
-        return save_config_file("general", {ONBOARDING_STORAGE_KEY: True})
+        saved = save_config_file("general", {ONBOARDING_STORAGE_KEY: True})
     except Exception as e:
         logger.error(f"Failed to mark onboarding complete: {e}")
         return False
 
+    # Drop the cached flag; the next check re-reads the file we just wrote
+    _onboarding_status_cache = None
+    return saved
+
 
 def _get_field_from_tab(tab_name: str, field_key: str) -> Optional[SettingsField]:
     """
@@ -72,9 +110,9 @@ def _get_field_from_tab(tab_name: str, field_key: str) -> Optional[SettingsField
         logger.warning(f"Settings tab not found: {tab_name}")
         return None
 
-    for field in tab.fields:
-        if hasattr(field, 'key') and field.key == field_key:
-            return field
+    field = tab.fields_by_key.get(field_key)
+    if field is not None:
+        return field
 
     logger.warning(f"Field {field_key} not found in tab {tab_name}")
     return None
@@ -310,15 +348,79 @@ ONBOARDING_STEPS = [
 ]
 
 
+@lru_cache(maxsize=32)
+def _build_step_fields(step_id: str, registry_version: int) -> Tuple[SettingsField, ...]:
+    for step_config in ONBOARDING_STEPS:
+        if step_config["id"] == step_id:
+            return tuple(step_config["get_fields"]())
+    return ()
+
+
+def _fields_for_step(step_id: str) -> Tuple[SettingsField, ...]:
+    """
+    Get a step's fields, building them once per settings registry version.
+
+    Settings tabs are registered as their modules are imported and don't change
+    afterwards, so the fields pulled from them (and their onboarding clones)
+    can be reused until another tab is registered.
+    """
+    return _build_step_fields(step_id, get_registry_version())
+
+
+@lru_cache(maxsize=4)
+def _build_key_to_tab(registry_version: int) -> Dict[str, str]:
+    key_to_tab: Dict[str, str] = {}
+    for step_config in ONBOARDING_STEPS:
+        for field in _build_step_fields(step_config["id"], registry_version):
+            if isinstance(field, HeadingField):
+                continue
+            key_to_tab.setdefault(field.key, step_config["tab"])
+    return key_to_tab
+
+
+def _key_to_tab() -> Dict[str, str]:
+    """Map each onboarding field key to the settings tab it is saved to."""
+    return _build_key_to_tab(get_registry_version())
+
+
+def clear_onboarding_cache() -> None:
+    """Forget cached step fields and the serialized onboarding config."""
+    global _onboarding_config_cache
+    _build_step_fields.cache_clear()
+    _build_key_to_tab.cache_clear()
+    _onboarding_config_cache = None
+
+
+# Serialized steps/values, keyed on (registry version, config version).
+# The TTL covers what those counters can't see: the PROWLARR_INDEXERS options
+# are fetched live from Prowlarr, so indexers added or removed there would
+# otherwise not show up until the next settings write.
+_ONBOARDING_CONFIG_TTL = 30.0
+_onboarding_config_cache: Optional[Tuple[Tuple[int, int], float, Dict[str, Any]]] = None
+
+
 def get_onboarding_config() -> Dict[str, Any]:
     """
     Get the full onboarding configuration including steps and current values.
+
+    The serialized steps and values are reused until a config file is written
+    or a settings tab is registered. A short TTL bounds staleness of options
+    that are fetched live (e.g. Prowlarr indexers). Only the top-level dict is
+    new per call; "steps" and "values" are shared with the cache and must be
+    treated as read-only.
     """
+    global _onboarding_config_cache
+
+    version = (get_registry_version(), get_config_version())
+    cached = _onboarding_config_cache
+    if cached is not None and cached[0] == version and time.monotonic() < cached[1]:
+        return {**cached[2], "complete": is_onboarding_complete()}
+
     steps = []
     all_values = {}
 
     for step_config in ONBOARDING_STEPS:
-        fields = step_config["get_fields"]()
+        fields = _fields_for_step(step_config["id"])
         tab_name = step_config["tab"]
 
         # Serialize fields with current values
@@ -346,11 +448,13 @@ def get_onboarding_config() -> Dict[str, Any]:
 
         steps.append(step)
 
-    return {
+    result = {
         "steps": steps,
         "values": all_values,
-        "complete": is_onboarding_complete(),
     }
+    _onboarding_config_cache = (version, time.monotonic() + _ONBOARDING_CONFIG_TTL, result)
+
+    return {**result, "complete": is_onboarding_complete()}
 
 
 def save_onboarding_settings(values: Dict[str, Any]) -> Dict[str, Any]:
@@ -363,29 +467,20 @@ def save_onboarding_settings(values: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Dict with success status and message
     """
+    global _onboarding_status_cache
+
     try:
         # Group values by their target tab
         tab_values: Dict[str, Dict[str, Any]] = {}
+        key_to_tab = _key_to_tab()
 
-        for step_config in ONBOARDING_STEPS:
-            tab_name = step_config["tab"]
-            fields = step_config["get_fields"]()
-
-            for field in fields:
-                if isinstance(field, HeadingField):
-                    continue
-
-                key = field.key
-                if key in values:
-                    if tab_name not in tab_values:
-                        tab_values[tab_name] = {}
-                    tab_values[tab_name][key] = values[key]
+        for key, value in values.items():
+            tab_name = key_to_tab.get(key)
+            if tab_name is not None:
+                tab_values.setdefault(tab_name, {})[key] = value
 
-        # Save each tab's values
         for tab_name, tab_data in tab_values.items():
-            if tab_data:
-                save_config_file(tab_name, tab_data)
-                logger.info(f"Saved onboarding settings to {tab_name}: {list(tab_data.keys())}")
+            logger.info(f"Saving onboarding settings to {tab_name}: {list(tab_data.keys())}")
 
         # Enable the selected metadata provider
         search_mode = values.get("SEARCH_MODE", "direct")
@@ -409,11 +504,14 @@ def save_onboarding_settings(values: Dict[str, Any]) -> Dict[str, Any]:
                 elif provider == "googlebooks" and values.get("GOOGLEBOOKS_API_KEY"):
                     provider_config["GOOGLEBOOKS_API_KEY"] = values["GOOGLEBOOKS_API_KEY"]
 
-                save_config_file(provider, provider_config)
-                logger.info(f"Enabled metadata provider: {provider} with keys: {list(provider_config.keys())}")
+                tab_values.setdefault(provider, {}).update(provider_config)
+                logger.info(f"Enabling metadata provider: {provider} with keys: {list(provider_config.keys())}")
 
-        # Mark onboarding as complete
-        mark_onboarding_complete()
+        # Mark onboarding as complete in the same batch, so each config file
+        # is written once
+        tab_values.setdefault("general", {})[ONBOARDING_STORAGE_KEY] = True
+        save_config_files(tab_values)
+        _onboarding_status_cache = None
 
         # Refresh config
         try:
@@ -14,13 +14,6 @@ from pathlib import Path
 from typing import Any, Iterable, Optional
 
 
-@dataclass(frozen=True)
-class RemotePathMapping:
-    host: str
-    remote_path: str
-    local_path: str
-
-
 def _normalize_prefix(path: str) -> str:
     normalized = str(path or "").strip()
     if not normalized:
@@ -43,6 +36,19 @@ def _normalize_host(host: str) -> str:
     return str(host or "").strip().lower()
 
 
+@dataclass(slots=True)
+class RemotePathMapping:
+    host: str
+    remote_path: str
+    local_path: str
+
+    def __post_init__(self) -> None:
+        # Normalize once on construction so lookups can compare fields directly
+        self.host = _normalize_host(self.host)
+        self.remote_path = _normalize_prefix(self.remote_path)
+        self.local_path = _normalize_prefix(self.local_path)
+
+
 def parse_remote_path_mappings(value: Any) -> list[RemotePathMapping]:
     if not value or not isinstance(value, list):
         return []
@@ -53,67 +59,154 @@ def parse_remote_path_mappings(value: Any) -> list[RemotePathMapping]:
         if not isinstance(row, dict):
             continue
 
-        host = _normalize_host(row.get("host", ""))
-        remote_path = _normalize_prefix(row.get("remotePath", ""))
-        local_path = _normalize_prefix(row.get("localPath", ""))
+        mapping = RemotePathMapping(
+            host=row.get("host", ""),
+            remote_path=row.get("remotePath", ""),
+            local_path=row.get("localPath", ""),
+        )
 
-        if not host or not remote_path or not local_path:
+        if not mapping.host or not mapping.remote_path or not mapping.local_path:
             continue
 
-        mappings.append(RemotePathMapping(host=host, remote_path=remote_path, local_path=local_path))
+        mappings.append(mapping)
 
     mappings.sort(key=lambda m: len(m.remote_path), reverse=True)
     return mappings
 
 
-def remap_remote_to_local_with_match(
-    *,
-    mappings: Iterable[RemotePathMapping],
-    host: str,
-    remote_path: str | Path,
-) -> tuple[Path, bool]:
-    host_normalized = _normalize_host(host)
-    remote_normalized = _normalize_prefix(str(remote_path))
+class _PrefixNode:
+    __slots__ = ("children", "mapping")
 
-    if not remote_normalized:
-        return Path(str(remote_path)), False
+    def __init__(self) -> None:
+        self.children: dict[str, _PrefixNode] = {}
+        self.mapping: Optional[RemotePathMapping] = None
+
+
+class RemotePathMappingIndex:
+    """Prefix trie over mapping remote paths, keyed per host.
+
+    Lookups walk the "/"-separated segments of the remote path and return the
+    deepest (most specific) mapping, so cost grows with path depth rather than
+    with the number of configured mappings. Windows-style prefixes are also
+    indexed lowercased to keep drive-letter paths case-insensitive.
+    """
 
+    def __init__(self, mappings: Iterable[RemotePathMapping]):
+        self.mappings = list(mappings)
+        self._exact: dict[str, _PrefixNode] = {}
+        self._folded: dict[str, _PrefixNode] = {}
+
+        for mapping in self.mappings:
+            if not mapping.remote_path:
+                continue
+            self._insert(self._exact, mapping.host, mapping.remote_path, mapping)
+            self._insert(self._folded, mapping.host, mapping.remote_path.lower(), mapping)
+
+    def __len__(self) -> int:
+        return len(self.mappings)
+
+    @staticmethod
+    def _insert(
+        roots: dict[str, _PrefixNode],
+        host: str,
+        prefix: str,
+        mapping: RemotePathMapping,
+    ) -> None:
+        node = roots.setdefault(host, _PrefixNode())
+        for segment in prefix.split("/"):
+            node = node.children.setdefault(segment, _PrefixNode())
+        # Keep the first mapping registered for a prefix, like the linear scan
+        if node.mapping is None:
+            node.mapping = mapping
+
+    def find(self, host: str, remote_path: str) -> Optional[RemotePathMapping]:
+        """Return the most specific mapping for a normalized host and path."""
+        if _is_windows_path(remote_path):
+            node = self._folded.get(host)
+            remote_path = remote_path.lower()
+        else:
+            node = self._exact.get(host)
+
+        best: Optional[RemotePathMapping] = None
+        for segment in remote_path.split("/"):
+            if node is None:
+                break
+            node = node.children.get(segment)
+            if node is not None and node.mapping is not None:
+                best = node.mapping
+
+        return best
+
+
+def _find_mapping(
+    mappings: Iterable[RemotePathMapping],
+    host: str,
+    remote_path: str,
+) -> Optional[RemotePathMapping]:
     # Windows paths are case-insensitive, so we need case-insensitive matching
     # for paths that look like Windows paths (e.g., D:/Torrents)
-    is_windows = _is_windows_path(remote_normalized)
+    is_windows = _is_windows_path(remote_path)
 
     for mapping in mappings:
-        if _normalize_host(mapping.host) != host_normalized:
+        if mapping.host != host:
             continue
 
-        remote_prefix = _normalize_prefix(mapping.remote_path)
+        remote_prefix = mapping.remote_path
         if not remote_prefix:
             continue
 
         # For Windows paths, do case-insensitive prefix matching
         if is_windows:
-            remote_lower = remote_normalized.lower()
+            remote_lower = remote_path.lower()
             prefix_lower = remote_prefix.lower()
             matches = remote_lower == prefix_lower or remote_lower.startswith(prefix_lower + "/")
         else:
-            matches = remote_normalized == remote_prefix or remote_normalized.startswith(remote_prefix + "/")
+            matches = remote_path == remote_prefix or remote_path.startswith(remote_prefix + "/")
 
         if matches:
-            # Use the length of the original prefix to extract remainder
-            # This preserves the original case in folder names
-            remainder = remote_normalized[len(remote_prefix):]
-            local_prefix = _normalize_prefix(mapping.local_path)
+            return mapping
+
+    return None
+
+
+def remap_remote_to_local_with_match(
+    *,
+    mappings: Iterable[RemotePathMapping] | RemotePathMappingIndex,
+    host: str,
+    remote_path: str | Path,
+) -> tuple[Path, bool]:
+    host_normalized = _normalize_host(host)
+    remote_normalized = _normalize_prefix(str(remote_path))
 
-            if remainder.startswith("/"):
-                remainder = remainder[1:]
+    if not remote_normalized:
+        return Path(str(remote_path)), False
 
-            remapped = Path(local_prefix) / remainder if remainder else Path(local_prefix)
-            return remapped, True
+    if isinstance(mappings, RemotePathMappingIndex):
+        mapping = mappings.find(host_normalized, remote_normalized)
+    else:
+        mapping = _find_mapping(mappings, host_normalized, remote_normalized)
 
-    return Path(remote_normalized), False
+    if mapping is None:
+        return Path(remote_normalized), False
 
+    # Use the length of the original prefix to extract remainder
+    # This preserves the original case in folder names
+    remainder = remote_normalized[len(mapping.remote_path):]
+    local_prefix = mapping.local_path
 
-def remap_remote_to_local(*, mappings: Iterable[RemotePathMapping], host: str, remote_path: str | Path) -> Path:
+    if remainder.startswith("/"):
+        remainder = remainder[1:]
+
+    remapped = Path(local_prefix) / remainder if remainder else Path(local_prefix)
+    return remapped, True
+
+
+def remap_remote_to_local(
+    *,
+    mappings: Iterable[RemotePathMapping] | RemotePathMappingIndex,
+    host: str,
+    remote_path: str | Path,
+) -> Path:
     remapped, _ = remap_remote_to_local_with_match(
         mappings=mappings,
         host=host,
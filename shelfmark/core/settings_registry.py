@@ -157,6 +157,12 @@ class SettingsTab:
     icon: Optional[str] = None            # Icon name for UI
     order: int = 100                      # Sort order (lower = earlier)
     group: Optional[str] = None           # Group name this tab belongs to
+    fields_by_key: Dict[str, SettingsField] = field(default_factory=dict, init=False, repr=False, compare=False)  # Built from fields
+
+    def __post_init__(self) -> None:
+        # Index fields by key once; the first field wins on duplicate keys
+        for tab_field in self.fields:
+            self.fields_by_key.setdefault(tab_field.key, tab_field)
 
 
 @dataclass
@@ -173,6 +179,13 @@ _GROUPS_REGISTRY: Dict[str, SettingsGroup] = {}
 _ON_SAVE_HANDLERS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {}
 _REGISTRY_LOCK = Lock()
 
+# Bumped whenever a settings tab is (re-)registered, so callers that derive
+# data from registered tabs can tell when their cached copy is stale
+_REGISTRY_VERSION = 0
+
+# Bumped whenever a config file is written through this module
+_CONFIG_VERSION = 0
+
 
 def register_group(
     name: str,
@@ -199,6 +212,7 @@ def register_settings(
     group: Optional[str] = None
 ):
     def decorator(func: Callable[[], List[SettingsField]]):
+        global _REGISTRY_VERSION
         with _REGISTRY_LOCK:
             fields = func()
             tab = SettingsTab(
@@ -210,6 +224,7 @@ def register_settings(
                 group=group,
             )
             _SETTINGS_REGISTRY[name] = tab
+            _REGISTRY_VERSION += 1
             logger.debug(f"Registered settings tab: {name} ({len(fields)} fields)" +
                         (f" in group {group}" if group else ""))
         return func
@@ -240,6 +255,23 @@ def get_all_settings_tabs() -> List[SettingsTab]:
     return sorted(_SETTINGS_REGISTRY.values(), key=lambda t: (t.order, t.name))
 
 
+def get_registry_version() -> int:
+    """Get a counter that changes whenever a settings tab is registered."""
+    return _REGISTRY_VERSION
+
+
+def get_config_version() -> int:
+    """Get a counter that changes whenever a config file is written or config is refreshed."""
+    return _CONFIG_VERSION
+
+
+def bump_config_version() -> None:
+    """Invalidate caches keyed on get_config_version()."""
+    global _CONFIG_VERSION
+    with _REGISTRY_LOCK:
+        _CONFIG_VERSION += 1
+
+
 def list_registered_settings() -> List[str]:
     """List all registered settings tab names."""
     return list(_SETTINGS_REGISTRY.keys())
@@ -281,22 +313,44 @@ def load_config_file(tab_name: str) -> Dict[str, Any]:
 
 
 def save_config_file(tab_name: str, values: Dict[str, Any]) -> bool:
-    try:
-        _ensure_config_dir(tab_name)
+    return save_config_files({tab_name: values})
+
+
+def save_config_files(tab_values: Dict[str, Dict[str, Any]]) -> bool:
+    """
+    Merge values for several tabs into their config files, writing each file once.
+
+    Tabs that share a file (e.g. 'general' and 'search_mode') are combined into
+    a single read-merge-write. Returns False if any file failed to save.
+    """
+    # Group by target file, remembering the first tab name for each file
+    values_by_path: Dict[Path, Dict[str, Any]] = {}
+    tab_by_path: Dict[Path, str] = {}
+    for tab_name, values in tab_values.items():
         config_path = _get_config_file_path(tab_name)
+        values_by_path.setdefault(config_path, {}).update(values)
+        tab_by_path.setdefault(config_path, tab_name)
 
-        # Load existing config and merge
-        existing = load_config_file(tab_name)
-        existing.update(values)
+    success = True
+    for config_path, values in values_by_path.items():
+        tab_name = tab_by_path[config_path]
+        try:
+            _ensure_config_dir(tab_name)
 
-        with open(config_path, 'w') as f:
-            json.dump(existing, f, indent=2)
+            # Load existing config and merge
+            existing = load_config_file(tab_name)
+            existing.update(values)
 
-        logger.info(f"Saved settings to {config_path}")
-        return True
-    except Exception as e:
-        logger.error(f"Error saving config file for {tab_name}: {e}")
-        return False
+            with open(config_path, 'w') as f:
+                json.dump(existing, f, indent=2)
+
+            logger.info(f"Saved settings to {config_path}")
+        except Exception as e:
+            logger.error(f"Error saving config file for {tab_name}: {e}")
+            success = False
+
+    bump_config_version()
+    return success
 
 
 def initialize_default_configs() -> bool:
@@ -358,6 +412,7 @@ def initialize_default_configs() -> bool:
                     logger.error(f"Failed to initialize config for {tab.name}: {e}")
 
         if initialized_tabs:
+            bump_config_version()
             logger.info(f"Initialized default configs for: {initialized_tabs}")
 
         return True
@@ -1,6 +1,7 @@
 """Shared utility functions for the Shelfmark."""
 
 import base64
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from urllib.parse import urlparse
@@ -74,8 +75,12 @@ def normalize_base_path(value: Optional[str]) -> str:
     return path.rstrip("/")
 
 
+@lru_cache(maxsize=64)
 def is_audiobook(content_type: Optional[str]) -> bool:
-    """Check if content type indicates an audiobook."""
+    """Check if content type indicates an audiobook.
+
+    Cached because the same handful of content types is checked several times per task.
+    """
     return bool(content_type and "audiobook" in content_type.lower())
 
 
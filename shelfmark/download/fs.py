@@ -8,12 +8,19 @@ import errno
 import os
 import shutil
 import subprocess
+import sys
 import time
 from pathlib import Path
+from typing import Optional
 
 from shelfmark.core.logger import setup_logger
 from shelfmark.download.permissions_debug import log_transfer_permission_context
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 logger = setup_logger(__name__)
 
 
@@ -88,6 +95,106 @@ def atomic_write(dest_path: Path, data: bytes, max_attempts: int = 100) -> Path:
     raise RuntimeError(f"Could not write file after {max_attempts} attempts: {dest_path}")
 
 
+# Errors from os.copy_file_range that mean "not supported for this file pair", in
+# which case we fall back to shutil.copy2 (sendfile/userspace copy).
+_ZERO_COPY_FALLBACK_ERRNOS = frozenset({errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP})
+_ZERO_COPY_MAX_CHUNK = 1 << 30
+# Files up to this size go straight to shutil.copy2 (a single sendfile on Linux);
+# the extra opens for reflink/copy_file_range probes cost more than they save.
+_ZERO_COPY_MIN_SIZE = 1 << 20
+
+
+def _copy_file_range(source: Path, dest: Path) -> bool:
+    """Copy file data with os.copy_file_range. Returns False if unsupported."""
+    with open(source, "rb") as src, open(dest, "wb") as dst:
+        size = os.fstat(src.fileno()).st_size
+        chunk = min(max(size, 1 << 23), _ZERO_COPY_MAX_CHUNK)
+        total = 0
+        while True:
+            try:
+                sent = os.copy_file_range(src.fileno(), dst.fileno(), chunk)
+            except OSError as e:
+                if not total and e.errno in _ZERO_COPY_FALLBACK_ERRNOS:
+                    return False
+                raise
+            if sent == 0:
+                break
+            total += sent
+
+    if total == 0 and size > 0:
+        # Some FUSE/NFS mounts and older kernels report EOF straight away
+        # instead of failing; let the caller copy through userspace
+        return False
+    if total != size:
+        raise OSError(errno.EIO, f"copy_file_range copied {total} of {size} bytes", str(source))
+    return True
+
+
+# FICLONE from linux/fs.h: share the source's extents (btrfs, XFS, bcachefs).
+_FICLONE = 0x40049409
+_REFLINK_FALLBACK_ERRNOS = _ZERO_COPY_FALLBACK_ERRNOS | {errno.ENOTTY, errno.EBADF, errno.ETXTBSY}
+
+
+def _reflink_file(source: Path, dest: Path) -> bool:
+    """Clone file data with the FICLONE ioctl. Returns False if unsupported."""
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+    with open(source, "rb") as src, open(dest, "wb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        except OSError as e:
+            if e.errno in _REFLINK_FALLBACK_ERRNOS:
+                return False
+            raise
+    return True
+
+
+def _offload_copy(source: Path, dest: Path, size: Optional[int] = None) -> bool:
+    """Copy file data with FICLONE or os.copy_file_range.
+
+    Returns False without touching dest for files up to _ZERO_COPY_MIN_SIZE or when
+    the kernel can't offload the copy.
+    """
+    if size is None:
+        size = os.stat(source).st_size
+    if size <= _ZERO_COPY_MIN_SIZE:
+        return False
+    if _reflink_file(source, dest):
+        logger.debug("Reflinked %s -> %s", source, dest)
+        return True
+    return hasattr(os, "copy_file_range") and _copy_file_range(source, dest)
+
+
+def copy_file(source: Path, dest: Path, prefer_zero_copy: bool = True) -> None:
+    """Copy file data and metadata like shutil.copy2.
+
+    With prefer_zero_copy, data is first reflinked (copy-on-write clone), then copied
+    with os.copy_file_range where available so the kernel can copy server-side
+    instead of bouncing bytes through a userspace buffer. Small files and anything
+    the kernel can't offload use shutil.copy2, which copies with sendfile on Linux.
+    """
+    if prefer_zero_copy and _offload_copy(source, dest):
+        shutil.copystat(str(source), str(dest))
+        return
+    shutil.copy2(str(source), str(dest))
+
+
+def copy_file_data(
+    source: Path,
+    dest: Path,
+    prefer_zero_copy: bool = True,
+    size: Optional[int] = None,
+) -> None:
+    """Copy file contents only, like shutil.copyfile, with the same kernel offloads.
+
+    Mode, timestamps and extended attributes are left to the caller. Pass the
+    source size when it is already known (e.g. from scandir) to skip a stat.
+    """
+    if prefer_zero_copy and _offload_copy(source, dest, size):
+        return
+    shutil.copyfile(str(source), str(dest))
+
+
 def _is_permission_error(e: Exception) -> bool:
     """Check if exception is a permission error (including NFS/SMB issues)."""
     return isinstance(e, PermissionError) or (isinstance(e, OSError) and e.errno == errno.EPERM)
@@ -155,7 +262,12 @@ def _claim_destination(path: Path) -> bool:
         return True
 
 
-def atomic_move(source_path: Path, dest_path: Path, max_attempts: int = 100) -> Path:
+def atomic_move(
+    source_path: Path,
+    dest_path: Path,
+    max_attempts: int = 100,
+    prefer_zero_copy: bool = True,
+) -> Path:
     """Move a file with collision detection.
 
     Uses os.rename() for same-filesystem moves (atomic, triggers inotify events),
@@ -169,6 +281,7 @@ def atomic_move(source_path: Path, dest_path: Path, max_attempts: int = 100) ->
         source_path: Source file to move
         dest_path: Desired destination path
         max_attempts: Maximum collision retries before raising error
+        prefer_zero_copy: Use os.copy_file_range for cross-filesystem moves when supported
 
     Returns:
         Path where file was actually moved (may differ from dest_path)
@@ -225,7 +338,7 @@ def atomic_move(source_path: Path, dest_path: Path, max_attempts: int = 100) ->
                 temp_path = try_path.parent / f".{try_path.name}.tmp"
                 try:
                     try:
-                        shutil.copy2(str(source_path), str(temp_path))
+                        copy_file(source_path, temp_path, prefer_zero_copy)
                     except (PermissionError, OSError) as copy_error:
                         if _is_permission_error(copy_error):
                             logger.debug(
@@ -285,13 +398,19 @@ def atomic_move(source_path: Path, dest_path: Path, max_attempts: int = 100) ->
     raise RuntimeError(f"Could not move file after {max_attempts} attempts: {dest_path}")
 
 
-def atomic_hardlink(source_path: Path, dest_path: Path, max_attempts: int = 100) -> Path:
+def atomic_hardlink(
+    source_path: Path,
+    dest_path: Path,
+    max_attempts: int = 100,
+    prefer_zero_copy: bool = True,
+) -> Path:
     """Create a hardlink with atomic collision detection.
 
     Args:
         source_path: Source file to link from
         dest_path: Desired destination path for the link
         max_attempts: Maximum collision retries before raising error
+        prefer_zero_copy: Use os.copy_file_range if falling back to a copy
 
     Returns:
         Path where link was actually created (may differ from dest_path)
@@ -327,13 +446,23 @@ def atomic_hardlink(source_path: Path, dest_path: Path, max_attempts: int = 100)
                     source_path,
                     dest_path,
                 )
-                return atomic_copy(source_path, dest_path, max_attempts=max_attempts)
+                return atomic_copy(
+                    source_path,
+                    dest_path,
+                    max_attempts=max_attempts,
+                    prefer_zero_copy=prefer_zero_copy,
+                )
             raise
 
     raise RuntimeError(f"Could not create hardlink after {max_attempts} attempts: {dest_path}")
 
 
-def atomic_copy(source_path: Path, dest_path: Path, max_attempts: int = 100) -> Path:
+def atomic_copy(
+    source_path: Path,
+    dest_path: Path,
+    max_attempts: int = 100,
+    prefer_zero_copy: bool = True,
+) -> Path:
     """Copy a file with atomic collision detection.
 
     Uses exclusive create to claim destination, then copies via temp file
@@ -343,6 +472,7 @@ def atomic_copy(source_path: Path, dest_path: Path, max_attempts: int = 100) ->
         source_path: Source file to copy
         dest_path: Desired destination path
         max_attempts: Maximum collision retries before raising error
+        prefer_zero_copy: Use os.copy_file_range when supported
 
     Returns:
         Path where file was actually copied (may differ from dest_path)
@@ -365,7 +495,7 @@ def atomic_copy(source_path: Path, dest_path: Path, max_attempts: int = 100) ->
             temp_path = try_path.parent / f".{try_path.name}.tmp"
             try:
                 try:
-                    shutil.copy2(str(source_path), str(temp_path))
+                    copy_file(source_path, temp_path, prefer_zero_copy)
                 except (PermissionError, OSError) as e:
                     # Handle NFS permission errors immediately here
                     if _is_permission_error(e):
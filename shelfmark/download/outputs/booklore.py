@@ -10,7 +10,6 @@ import requests
 import shelfmark.core.config as core_config
 from shelfmark.core.logger import setup_logger
 from shelfmark.core.models import DownloadTask
-from shelfmark.core.utils import is_audiobook as check_audiobook
 from shelfmark.download.outputs import register_output
 from shelfmark.download.staging import STAGE_MOVE, STAGE_NONE, build_staging_dir
 
@@ -166,7 +165,7 @@ def booklore_refresh_library(booklore_config: BookloreConfig, token: str) -> Non
 
 
 def _supports_booklore(task: DownloadTask) -> bool:
-    if check_audiobook(task.content_type):
+    if task.is_audiobook:
         return False
     return core_config.config.get("BOOKS_OUTPUT_MODE", "folder") == BOOKLORE_OUTPUT_MODE
 
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import logging
 import os
 import subprocess
+import time
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from threading import Event
 from typing import Any, Optional, List
@@ -10,15 +13,98 @@ from typing import Any, Optional, List
 import shelfmark.core.config as core_config
 from shelfmark.core.logger import setup_logger
 from shelfmark.core.models import DownloadTask
+from shelfmark.core.settings_registry import get_config_version
 from shelfmark.core.utils import is_audiobook as check_audiobook
-from shelfmark.download.archive import is_archive
 from shelfmark.download.outputs import register_output
+from shelfmark.download.postprocess.pipeline import (
+    build_output_plan,
+    cleanup_output_staging,
+    get_final_destination,
+    is_torrent_source,
+    log_plan_steps,
+    plan_logging_enabled,
+    prepare_output_files,
+    record_step,
+    transfer_book_files,
+    validate_destination,
+)
+from shelfmark.download.postprocess.policy import get_file_organization
+from shelfmark.download.postprocess.types import OutputPlan
 from shelfmark.download.staging import StageAction, STAGE_NONE
 
 logger = setup_logger(__name__)
 
 FOLDER_OUTPUT_MODE = "folder"
 
+CUSTOM_SCRIPT_TIMEOUT = 300  # 5 minute timeout
+CUSTOM_SCRIPT_POLL_INTERVAL = 0.1
+# Script output is captured as bytes and only this much is decoded for logging.
+CUSTOM_SCRIPT_OUTPUT_LOG_LIMIT = 4096
+
+
+class _CustomScriptCancelled(Exception):
+    """Raised when a task is cancelled while its custom script is running."""
+
+
+class _AbortTask(Exception):
+    """Stops folder processing; carries the error status to report, if any."""
+
+    def __init__(self, status_message: Optional[str] = None):
+        super().__init__(status_message)
+        self.status_message = status_message
+
+
+def _stop_process(proc: subprocess.Popen) -> None:
+    proc.terminate()
+    try:
+        proc.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+
+
+def _decode_script_output(data: Optional[bytes]) -> str:
+    if not data:
+        return ""
+    return data[:CUSTOM_SCRIPT_OUTPUT_LOG_LIMIT].decode("utf-8", "replace").strip()
+
+
+def _run_custom_script_process(
+    args: List[str],
+    env: dict,
+    cancel_flag: Event,
+    timeout: float,
+) -> subprocess.CompletedProcess:
+    """Run a custom script, polling so cancellation is noticed while it runs.
+
+    Mirrors ``subprocess.run(..., check=True, timeout=timeout)`` but raises
+    ``_CustomScriptCancelled`` (after stopping the script) once ``cancel_flag`` is set.
+    Output is drained with ``communicate()`` on each poll so chatty scripts cannot
+    block on a full pipe.
+    """
+    proc = subprocess.Popen(
+        args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=env,
+    )
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            stdout, stderr = proc.communicate(timeout=CUSTOM_SCRIPT_POLL_INTERVAL)
+            break
+        except subprocess.TimeoutExpired:
+            if cancel_flag.is_set():
+                _stop_process(proc)
+                raise _CustomScriptCancelled()
+            if time.monotonic() >= deadline:
+                _stop_process(proc)
+                raise subprocess.TimeoutExpired(args, timeout)
+
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, args, output=stdout, stderr=stderr)
+    return subprocess.CompletedProcess(args, proc.returncode, stdout, stderr)
+
 
 def _resolve_custom_script_target(target_path: Path, destination: Path, path_mode: str) -> Path:
     mode = (path_mode or "absolute").strip().lower()
@@ -33,6 +119,33 @@ def _resolve_custom_script_target(target_path: Path, destination: Path, path_mod
         return target_path
 
 
+# Status label indexed by (hardlink << 2) | (usenet_move << 1) | copy: hardlinking wins,
+# then a usenet move, then a copy of a source that must be kept, else a plain move.
+_TRANSFER_LABELS = (
+    "Moving",
+    "Copying",
+    "Moving",
+    "Moving",
+    "Hardlinking",
+    "Hardlinking",
+    "Hardlinking",
+    "Hardlinking",
+)
+
+
+def _common_parent(paths: List[Path], fallback: Path) -> Path:
+    """Return the deepest folder containing every path, or fallback if there is none."""
+    # Multi-file imports usually land in a single folder; only fall back to
+    # commonpath when the parents actually differ.
+    first_parent = paths[0].parent
+    if all(p.parent == first_parent for p in paths[1:]):
+        return first_parent
+    try:
+        return Path(os.path.commonpath([p.parent.as_posix() for p in paths]))
+    except ValueError:
+        return fallback
+
+
 @dataclass(frozen=True)
 class _ProcessingPlan:
     destination: Path
@@ -42,28 +155,31 @@ class _ProcessingPlan:
     stage_action: StageAction
     staging_dir: Path
     hardlink_source: Optional[Path]
+    output_plan: OutputPlan
+    # Cached string forms for step records, logs and the custom script environment.
+    destination_str: str
+    staging_dir_str: str
+    prefer_zero_copy: bool = True
     output_mode: str = FOLDER_OUTPUT_MODE
 
 
-def _supports_folder_output(task: DownloadTask) -> bool:
-    if check_audiobook(task.content_type):
+@lru_cache(maxsize=32)
+def _folder_output_supported(content_type: Optional[str], config_version: int) -> bool:
+    if check_audiobook(content_type):
         return True
     return core_config.config.get("BOOKS_OUTPUT_MODE", FOLDER_OUTPUT_MODE) == FOLDER_OUTPUT_MODE
 
 
+def _supports_folder_output(task: DownloadTask) -> bool:
+    return _folder_output_supported(task.content_type, get_config_version())
+
+
 def _build_processing_plan(
     temp_file: Path,
     task: DownloadTask,
     status_callback,
 ) -> Optional[_ProcessingPlan]:
-    from shelfmark.download.postprocess.pipeline import (
-        build_output_plan,
-        get_final_destination,
-        validate_destination,
-    )
-    from shelfmark.download.postprocess.policy import get_file_organization
-
-    is_audiobook = check_audiobook(task.content_type)
+    is_audiobook = task.is_audiobook
     organization_mode = get_file_organization(is_audiobook)
     destination = get_final_destination(task)
 
@@ -91,6 +207,10 @@ def _build_processing_plan(
         stage_action=output_plan.stage_action,
         staging_dir=output_plan.staging_dir,
         hardlink_source=hardlink_source,
+        output_plan=output_plan,
+        destination_str=str(destination),
+        staging_dir_str=str(output_plan.staging_dir),
+        prefer_zero_copy=bool(core_config.config.get("PREFER_ZERO_COPY", True)),
     )
 
 
@@ -102,29 +222,20 @@ def process_folder_output(
     status_callback,
 ) -> Optional[str]:
     """Post-process download to the configured folder destination."""
-    from shelfmark.download.postprocess.pipeline import (
-        cleanup_output_staging,
-        is_torrent_source,
-        log_plan_steps,
-        prepare_output_files,
-        record_step,
-        safe_cleanup_path,
-        transfer_book_files,
-    )
-
     plan = _build_processing_plan(temp_file, task, status_callback)
     if not plan:
         return None
 
-    logger.debug(
-        "Processing plan for task %s: mode=%s destination=%s hardlink=%s stage_action=%s extract_archives=%s",
-        task.task_id,
-        plan.organization_mode,
-        plan.destination,
-        plan.use_hardlink,
-        plan.stage_action,
-        plan.allow_archive_extraction,
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Processing plan for task %s: mode=%s destination=%s hardlink=%s stage_action=%s extract_archives=%s",
+            task.task_id,
+            plan.organization_mode,
+            plan.destination_str,
+            plan.use_hardlink,
+            plan.stage_action,
+            plan.allow_archive_extraction,
+        )
 
     prepared = prepare_output_files(
         temp_file,
@@ -132,36 +243,36 @@ def process_folder_output(
         output_mode=plan.output_mode,
         status_callback=status_callback,
         destination=plan.destination,
+        output_plan=plan.output_plan,
     )
     if not prepared:
         return None
 
+    cfg = core_config.config
+    custom_script = cfg.CUSTOM_SCRIPT
+    usenet_action = cfg.get("PROWLARR_USENET_ACTION", "move")
+
+    stage_action = prepared.output_plan.stage_action
+    staging_active = stage_action != STAGE_NONE
+
+    # Steps only feed the debug plan log; skip building them when it is disabled.
+    plan_log_enabled = plan_logging_enabled()
     steps: List[Any] = []
-    if prepared.output_plan.stage_action != STAGE_NONE:
-        step_name = f"stage_{prepared.output_plan.stage_action}"
-        record_step(steps, step_name, source=str(temp_file), dest=str(prepared.output_plan.staging_dir))
+    if plan_log_enabled and staging_active:
+        step_name = f"stage_{stage_action}"
+        record_step(steps, step_name, source=str(temp_file), dest=plan.staging_dir_str)
 
-    def run_custom_script(script_path: str, target_path: Path, phase: str) -> bool:
-        path_mode = core_config.config.get("CUSTOM_SCRIPT_PATH_MODE", "absolute")
+    def run_custom_script(script_path: str, target_path: Path, phase: str) -> None:
+        path_mode = cfg.get("CUSTOM_SCRIPT_PATH_MODE", "absolute")
         script_target = _resolve_custom_script_target(target_path, plan.destination, path_mode)
         env = {
             **os.environ,
             "SHELFMARK_CUSTOM_SCRIPT_TARGET": str(target_path),
             "SHELFMARK_CUSTOM_SCRIPT_RELATIVE": str(_resolve_custom_script_target(target_path, plan.destination, "relative")),
-            "SHELFMARK_CUSTOM_SCRIPT_DESTINATION": str(plan.destination),
+            "SHELFMARK_CUSTOM_SCRIPT_DESTINATION": plan.destination_str,
             "SHELFMARK_CUSTOM_SCRIPT_MODE": str(path_mode),
             "SHELFMARK_CUSTOM_SCRIPT_PHASE": phase,
         }
-        record_step(
-            steps,
-            "custom_script",
-            script=str(script_path),
-            target=str(script_target),
-            target_abs=str(target_path),
-            mode=str(path_mode),
-            phase=phase,
-        )
-        log_plan_steps(task.task_id, steps)
         logger.info(
             "Task %s: running custom script %s on %s (%s)",
             task.task_id,
@@ -170,141 +281,164 @@ def process_folder_output(
             phase,
         )
         try:
-            result = subprocess.run(
+            result = _run_custom_script_process(
                 [script_path, str(script_target)],
-                check=True,
-                timeout=300,  # 5 minute timeout
-                capture_output=True,
-                text=True,
-                env=env,
+                env,
+                cancel_flag,
+                CUSTOM_SCRIPT_TIMEOUT,
             )
-            if result.stdout:
-                logger.debug("Task %s: custom script stdout: %s", task.task_id, result.stdout.strip())
-            return True
+            if result.stdout and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Task %s: custom script stdout: %s", task.task_id, _decode_script_output(result.stdout))
         except FileNotFoundError:
             logger.error("Task %s: custom script not found: %s", task.task_id, script_path)
-            status_callback("error", f"Custom script not found: {script_path}")
-            return False
+            raise _AbortTask(f"Custom script not found: {script_path}")
         except PermissionError:
             logger.error("Task %s: custom script not executable: %s", task.task_id, script_path)
-            status_callback("error", f"Custom script not executable: {script_path}")
-            return False
+            raise _AbortTask(f"Custom script not executable: {script_path}")
+        except _CustomScriptCancelled:
+            logger.info("Task %s: cancelled while running custom script %s", task.task_id, script_path)
+            raise _AbortTask()
         except subprocess.TimeoutExpired:
-            logger.error("Task %s: custom script timed out after 300s: %s", task.task_id, script_path)
-            status_callback("error", "Custom script timed out")
-            return False
+            logger.error(
+                "Task %s: custom script timed out after %ss: %s",
+                task.task_id,
+                CUSTOM_SCRIPT_TIMEOUT,
+                script_path,
+            )
+            raise _AbortTask("Custom script timed out")
         except subprocess.CalledProcessError as e:
-            stderr = e.stderr.strip() if e.stderr else "No error output"
+            stderr = _decode_script_output(e.stderr) or "No error output"
             logger.error(
                 "Task %s: custom script failed (exit code %s): %s",
                 task.task_id,
                 e.returncode,
                 stderr,
             )
-            status_callback("error", f"Custom script failed: {stderr[:100]}")
-            return False
+            raise _AbortTask(f"Custom script failed: {stderr[:100]}")
 
     # Custom script is run post-transfer (see below).
+    cleanup_on_exit = True
+    try:
+        # If we staged a copy into TMP_DIR (e.g. for custom script), transfer from the staged
+        # path and disable hardlinking for this transfer.
+        # Hardlink feasibility (same device as the destination) was already checked against
+        # the hardlink source when the plan was built, so no further stat is needed here.
+        use_hardlink = plan.use_hardlink and not staging_active
+        if plan.use_hardlink and staging_active:
+            logger.info(
+                "Task %s: hardlinking skipped because files were staged in %s; importing the staged copy instead",
+                task.task_id,
+                plan.staging_dir_str,
+            )
+        if use_hardlink and plan.hardlink_source:
+            # The hardlink source is the client's download path, so it is the torrent
+            # source by construction; skip the resolve() calls in is_torrent_source().
+            source_path = plan.hardlink_source
+            is_torrent = True
+        else:
+            source_path = prepared.working_path
+            is_torrent = is_torrent_source(source_path, task)
+
+        is_usenet = task.source == "prowlarr" and not task.original_download_path
+
+        # For external usenet downloads, always copy from the client path.
+        # "Move" is implemented as a client-side cleanup after import.
+        preserve_source = is_usenet
+
+        copy_for_label = is_torrent or preserve_source or staging_active
+
+        if cancel_flag.is_set():
+            logger.info("Task %s: cancelled before final transfer", task.task_id)
+            if plan_log_enabled:
+                record_step(steps, "aborted", reason="cancelled")
+                log_plan_steps(task.task_id, steps)
+            raise _AbortTask()
+
+        # Usenet "move" is presented as a move, but implemented as copy + client cleanup.
+        usenet_move = is_usenet and usenet_action == "move" and not staging_active
+        op_label = _TRANSFER_LABELS[(use_hardlink << 2) | (usenet_move << 1) | copy_for_label]
+
+        status_callback("resolving", f"{op_label} file")
+        if plan_log_enabled:
+            record_step(
+                steps,
+                "transfer",
+                op=op_label.lower(),
+                source=str(source_path),
+                dest=plan.destination_str,
+                hardlink=use_hardlink,
+                torrent=copy_for_label,
+            )
+            if custom_script:
+                record_step(
+                    steps,
+                    "custom_script",
+                    script=str(custom_script),
+                    phase="post_transfer",
+                )
+            if staging_active:
+                record_step(steps, "cleanup_staging", path=str(prepared.working_path))
+            # The plan is logged once, before the transfer; the script's resolved target
+            # is logged when it runs.
+            log_plan_steps(task.task_id, steps)
+
+        final_paths, error = transfer_book_files(
+            prepared.files,
+            destination=plan.destination,
+            task=task,
+            use_hardlink=use_hardlink,
+            is_torrent=is_torrent,
+            preserve_source=preserve_source,
+            organization_mode=plan.organization_mode,
+            prefer_zero_copy=plan.prefer_zero_copy,
+        )
 
-    # If we staged a copy into TMP_DIR (e.g. for custom script), transfer from the staged
-    # path and disable hardlinking for this transfer.
-    use_hardlink = plan.use_hardlink and prepared.output_plan.stage_action == STAGE_NONE
-    source_path = plan.hardlink_source if use_hardlink and plan.hardlink_source else prepared.working_path
-    is_torrent = is_torrent_source(source_path, task)
-
-    usenet_action = core_config.config.get("PROWLARR_USENET_ACTION", "move")
-    is_usenet = task.source == "prowlarr" and not task.original_download_path
+        if error:
+            logger.warning("Task %s: transfer failed: %s", task.task_id, error)
+            # Leave prepared files in place when the transfer itself failed.
+            cleanup_on_exit = False
+            raise _AbortTask(error)
 
-    # For external usenet downloads, always copy from the client path.
-    # "Move" is implemented as a client-side cleanup after import.
-    preserve_source = is_usenet
+        logger.info(
+            "Task %s: transferred %d file(s) to %s (%s)",
+            task.task_id,
+            len(final_paths),
+            plan.destination_str,
+            op_label.lower(),
+        )
 
-    copy_for_label = is_torrent or preserve_source or prepared.output_plan.stage_action != STAGE_NONE
+        # Run custom script once per successful task, after transfer.
+        if custom_script:
+            target_path = final_paths[0] if len(final_paths) == 1 else _common_parent(final_paths, plan.destination)
+            run_custom_script(custom_script, target_path, phase="post_transfer")
 
-    if cancel_flag.is_set():
-        logger.info("Task %s: cancelled before final transfer", task.task_id)
+        # Clean up staging before reporting completion, so the task never shows
+        # as complete while staged files remain (or before a cleanup failure).
+        cleanup_on_exit = False
         cleanup_output_staging(
             prepared.output_plan,
             prepared.working_path,
             task,
             prepared.cleanup_paths,
         )
-        return None
-
-    if use_hardlink:
-        op_label = "Hardlinking"
-    elif is_usenet and usenet_action == "move" and prepared.output_plan.stage_action == STAGE_NONE:
-        # Presented as a move, but implemented as copy + client cleanup.
-        op_label = "Moving"
-    elif copy_for_label:
-        op_label = "Copying"
-    else:
-        op_label = "Moving"
-
-    status_callback("resolving", f"{op_label} file")
-    record_step(
-        steps,
-        "transfer",
-        op=op_label.lower(),
-        source=str(source_path),
-        dest=str(plan.destination),
-        hardlink=use_hardlink,
-        torrent=copy_for_label,
-    )
-    if prepared.output_plan.stage_action != STAGE_NONE:
-        record_step(steps, "cleanup_staging", path=str(prepared.working_path))
-    log_plan_steps(task.task_id, steps)
 
-    final_paths, error = transfer_book_files(
-        prepared.files,
-        destination=plan.destination,
-        task=task,
-        use_hardlink=use_hardlink,
-        is_torrent=is_torrent,
-        preserve_source=preserve_source,
-        organization_mode=plan.organization_mode,
-    )
+        message = "Complete" if len(final_paths) == 1 else f"Complete ({len(final_paths)} files)"
+        status_callback("complete", message)
 
-    if error:
-        logger.warning("Task %s: transfer failed: %s", task.task_id, error)
-        status_callback("error", error)
+        return str(final_paths[0])
+    except _AbortTask as abort:
+        if abort.status_message:
+            status_callback("error", abort.status_message)
         return None
-
-    logger.info(
-        "Task %s: transferred %d file(s) to %s (%s)",
-        task.task_id,
-        len(final_paths),
-        plan.destination,
-        op_label.lower(),
-    )
-
-    # Run custom script once per successful task, after transfer.
-    if core_config.config.CUSTOM_SCRIPT:
-        if len(final_paths) == 1:
-            target_path = final_paths[0]
-        else:
-            try:
-                target_path = Path(os.path.commonpath([str(p.parent) for p in final_paths]))
-            except ValueError:
-                target_path = plan.destination
-
-        if not run_custom_script(core_config.config.CUSTOM_SCRIPT, target_path, phase="post_transfer"):
+    except Exception:
+        # Unexpected failures keep the prepared files, like failed transfers.
+        cleanup_on_exit = False
+        raise
+    finally:
+        if cleanup_on_exit:
             cleanup_output_staging(
                 prepared.output_plan,
                 prepared.working_path,
                 task,
                 prepared.cleanup_paths,
             )
-            return None
-
-    cleanup_output_staging(
-        prepared.output_plan,
-        prepared.working_path,
-        task,
-        prepared.cleanup_paths,
-    )
-
-    message = "Complete" if len(final_paths) == 1 else f"Complete ({len(final_paths)} files)"
-    status_callback("complete", message)
-
-    return str(final_paths[0])
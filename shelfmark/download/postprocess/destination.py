@@ -8,7 +8,6 @@ from shelfmark.core.models import DownloadTask
 from shelfmark.core.utils import (
     get_aa_content_type_dir,
     get_destination,
-    is_audiobook as check_audiobook,
 )
 from shelfmark.download.permissions_debug import log_path_permission_context
 
@@ -59,7 +58,7 @@ def validate_destination(destination: Path, status_callback) -> bool:
 def get_final_destination(task: DownloadTask) -> Path:
     """Get final destination directory, with content-type routing support."""
 
-    is_audiobook = check_audiobook(task.content_type)
+    is_audiobook = task.is_audiobook
 
     if task.source == "direct_download" and not is_audiobook:
         override = get_aa_content_type_dir(task.content_type)
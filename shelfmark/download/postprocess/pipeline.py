@@ -26,7 +26,7 @@ from .scan import (
     get_supported_formats,
     scan_directory_tree,
 )
-from .steps import log_plan_steps, record_step
+from .steps import log_plan_steps, plan_logging_enabled, record_step
 from .transfer import (
     build_metadata_dict,
     is_torrent_source,
@@ -62,6 +62,7 @@ __all__ = [
     "is_torrent_source",
     "is_within_tmp_dir",
     "log_plan_steps",
+    "plan_logging_enabled",
     "prepare_output_files",
     "process_directory",
     "record_step",
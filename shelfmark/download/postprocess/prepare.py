@@ -62,7 +62,12 @@ def prepare_output_files(
     if output_plan.stage_action != STAGE_NONE:
         step_label = "Staging torrent files" if output_plan.stage_action == STAGE_COPY else "Staging files"
         status_callback("resolving", step_label)
-        working_path = stage_path(working_path, output_plan.staging_dir, output_plan.stage_action)
+        working_path = stage_path(
+            working_path,
+            output_plan.staging_dir,
+            output_plan.stage_action,
+            prefer_zero_copy=bool(core_config.config.get("PREFER_ZERO_COPY", True)),
+        )
 
     can_delete_source_archives = output_plan.stage_action != STAGE_NONE or is_managed_workspace_path(working_path)
 
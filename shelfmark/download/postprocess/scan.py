@@ -299,7 +299,7 @@ def collect_staged_files(
     supported_formats = get_supported_formats(task.content_type)
     supported_exts = {f".{fmt}" for fmt in supported_formats}
 
-    is_audiobook = check_audiobook(task.content_type)
+    is_audiobook = task.is_audiobook
     if is_audiobook:
         trackable_exts = {'.m4b', '.mp3', '.m4a', '.flac', '.ogg', '.wma', '.aac', '.wav'}
     else:
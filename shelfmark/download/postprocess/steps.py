@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 from typing import Any, List
 
 from shelfmark.core.logger import setup_logger
@@ -13,6 +14,11 @@ def record_step(steps: List[PlanStep], name: str, **details: Any) -> None:
     steps.append(PlanStep(name=name, details=details))
 
 
+def plan_logging_enabled() -> bool:
+    """Whether log_plan_steps would emit anything; lets callers skip recording steps."""
+    return logger.isEnabledFor(logging.DEBUG)
+
+
 def log_plan_steps(task_id: str, steps: List[PlanStep]) -> None:
     if not steps:
         return
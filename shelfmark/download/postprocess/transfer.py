@@ -14,7 +14,6 @@ from shelfmark.core.naming import (
     same_filesystem,
     sanitize_filename,
 )
-from shelfmark.core.utils import is_audiobook as check_audiobook
 from shelfmark.download.fs import atomic_copy, atomic_hardlink, atomic_move
 from shelfmark.download.postprocess.policy import get_file_organization, get_template
 
@@ -34,7 +33,7 @@ def should_hardlink(task: DownloadTask) -> bool:
     if not task.original_download_path:
         return False
 
-    is_audiobook = check_audiobook(task.content_type)
+    is_audiobook = task.is_audiobook
     key = "HARDLINK_TORRENTS_AUDIOBOOK" if is_audiobook else "HARDLINK_TORRENTS"
 
     hardlink_enabled = core_config.config.get(key)
@@ -105,6 +104,13 @@ def is_torrent_source(source_path: Path, task: DownloadTask) -> bool:
             return False
 
 
+def _prefer_zero_copy(prefer_zero_copy: Optional[bool]) -> bool:
+    """Resolve an explicit prefer_zero_copy argument, else the PREFER_ZERO_COPY setting."""
+    if prefer_zero_copy is None:
+        return bool(core_config.config.get("PREFER_ZERO_COPY", True))
+    return prefer_zero_copy
+
+
 def _max_attempts_for_batch(file_count: int, default: int = 100) -> int:
     if file_count <= 1:
         return default
@@ -118,9 +124,15 @@ def _transfer_single_file(
     is_torrent: bool,
     preserve_source: bool = False,
     max_attempts: int = 100,
+    prefer_zero_copy: bool = True,
 ) -> Tuple[Path, str]:
     if use_hardlink:
-        final_path = atomic_hardlink(source_path, dest_path, max_attempts=max_attempts)
+        final_path = atomic_hardlink(
+            source_path,
+            dest_path,
+            max_attempts=max_attempts,
+            prefer_zero_copy=prefer_zero_copy,
+        )
         try:
             if os.stat(source_path).st_ino == os.stat(final_path).st_ino:
                 return final_path, "hardlink"
@@ -129,9 +141,21 @@ def _transfer_single_file(
         return final_path, "copy"
 
     if is_torrent or preserve_source:
-        return atomic_copy(source_path, dest_path, max_attempts=max_attempts), "copy"
+        final_path = atomic_copy(
+            source_path,
+            dest_path,
+            max_attempts=max_attempts,
+            prefer_zero_copy=prefer_zero_copy,
+        )
+        return final_path, "copy"
 
-    return atomic_move(source_path, dest_path, max_attempts=max_attempts), "move"
+    final_path = atomic_move(
+        source_path,
+        dest_path,
+        max_attempts=max_attempts,
+        prefer_zero_copy=prefer_zero_copy,
+    )
+    return final_path, "move"
 
 
 def transfer_book_files(
@@ -142,11 +166,12 @@ def transfer_book_files(
     is_torrent: bool,
     preserve_source: bool = False,
     organization_mode: Optional[str] = None,
+    prefer_zero_copy: bool = True,
 ) -> Tuple[List[Path], Optional[str]]:
     if not book_files:
         return [], "No book files found"
 
-    is_audiobook = check_audiobook(task.content_type)
+    is_audiobook = task.is_audiobook
     organization_mode = organization_mode or get_file_organization(is_audiobook)
     max_attempts = _max_attempts_for_batch(len(book_files))
 
@@ -169,18 +194,23 @@ def transfer_book_files(
                 is_torrent,
                 preserve_source=preserve_source,
                 max_attempts=max_attempts,
+                prefer_zero_copy=prefer_zero_copy,
             )
             final_paths.append(final_path)
             logger.debug(f"{op.capitalize()} to destination: {final_path.name}")
         else:
             zero_pad_width = max(len(str(len(book_files))), 2)
             files_with_parts = assign_part_numbers(book_files, zero_pad_width)
+            # Parts usually share one folder; only create each folder once
+            created_dirs: set[Path] = set()
 
             for source_file, part_number in files_with_parts:
                 ext = source_file.suffix.lstrip(".") or task.format or ""
                 file_metadata = {**metadata, "PartNumber": part_number}
                 dest_path = build_library_path(str(destination), template, file_metadata, extension=ext or None)
-                dest_path.parent.mkdir(parents=True, exist_ok=True)
+                if dest_path.parent not in created_dirs:
+                    dest_path.parent.mkdir(parents=True, exist_ok=True)
+                    created_dirs.add(dest_path.parent)
 
                 final_path, op = _transfer_single_file(
                     source_file,
@@ -189,6 +219,7 @@ def transfer_book_files(
                     is_torrent,
                     preserve_source=preserve_source,
                     max_attempts=max_attempts,
+                    prefer_zero_copy=prefer_zero_copy,
                 )
                 final_paths.append(final_path)
                 logger.debug(f"{op.capitalize()} to destination: {final_path.name}")
@@ -221,6 +252,7 @@ def transfer_book_files(
             is_torrent,
             preserve_source=preserve_source,
             max_attempts=max_attempts,
+            prefer_zero_copy=prefer_zero_copy,
         )
         final_paths.append(final_path)
         logger.debug(f"{op.capitalize()} to destination: {final_path.name}")
@@ -234,6 +266,7 @@ def process_directory(
     task: DownloadTask,
     allow_archive_extraction: bool = True,
     use_hardlink: Optional[bool] = None,
+    prefer_zero_copy: Optional[bool] = None,
 ) -> Tuple[List[Path], Optional[str]]:
     """Process staged directory: find book files, extract archives, move to ingest."""
 
@@ -263,6 +296,7 @@ def process_directory(
             task=task,
             use_hardlink=use_hardlink,
             is_torrent=is_torrent,
+            prefer_zero_copy=_prefer_zero_copy(prefer_zero_copy),
         )
 
         if error:
@@ -291,6 +325,7 @@ def transfer_file_to_library(
     temp_file: Optional[Path],
     status_callback,
     use_hardlink: bool,
+    prefer_zero_copy: Optional[bool] = None,
 ) -> Optional[str]:
     extension = source_path.suffix.lstrip(".") or task.format
     dest_path = build_library_path(library_base, template, metadata, extension)
@@ -303,6 +338,7 @@ def transfer_file_to_library(
         use_hardlink,
         is_torrent,
         max_attempts=_max_attempts_for_batch(1),
+        prefer_zero_copy=_prefer_zero_copy(prefer_zero_copy),
     )
     logger.info(f"Library {op}: {final_path}")
 
@@ -322,6 +358,7 @@ def transfer_directory_to_library(
     temp_file: Optional[Path],
     status_callback,
     use_hardlink: bool,
+    prefer_zero_copy: Optional[bool] = None,
 ) -> Optional[str]:
     content_type = task.content_type.lower() if task.content_type else None
     source_files, _, _, scan_error = scan_directory_tree(source_dir, content_type)
@@ -345,6 +382,7 @@ def transfer_directory_to_library(
     is_torrent = is_torrent_source(source_dir, task)
     transferred_paths: List[Path] = []
     max_attempts = _max_attempts_for_batch(len(source_files))
+    prefer_zero_copy = _prefer_zero_copy(prefer_zero_copy)
 
     if len(source_files) == 1:
         source_file = source_files[0]
@@ -356,18 +394,23 @@ def transfer_directory_to_library(
             use_hardlink,
             is_torrent,
             max_attempts=max_attempts,
+            prefer_zero_copy=prefer_zero_copy,
         )
         logger.debug(f"Library {op}: {source_file.name} -> {final_path}")
         transferred_paths.append(final_path)
     else:
         zero_pad_width = max(len(str(len(source_files))), 2)
         files_with_parts = assign_part_numbers(source_files, zero_pad_width)
+        # Parts usually share the base folder created above
+        created_dirs = {base_library_path.parent}
 
         for source_file, part_number in files_with_parts:
             ext = source_file.suffix.lstrip(".")
             file_metadata = {**metadata, "PartNumber": part_number}
             file_path = build_library_path(library_base, template, file_metadata, extension=ext)
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+            if file_path.parent not in created_dirs:
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(file_path.parent)
 
             final_path, op = _transfer_single_file(
                 source_file,
@@ -375,6 +418,7 @@ def transfer_directory_to_library(
                 use_hardlink,
                 is_torrent,
                 max_attempts=max_attempts,
+                prefer_zero_copy=prefer_zero_copy,
             )
             logger.debug(f"Library {op}: {source_file.name} -> {final_path}")
             transferred_paths.append(final_path)
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import errno
 import hashlib
+import os
 import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Literal
 
 from shelfmark.config import env as env_config
 from shelfmark.core.logger import setup_logger
+from shelfmark.download.fs import copy_file, copy_file_data
 
 logger = setup_logger(__name__)
 
@@ -15,6 +20,10 @@ STAGE_NONE: StageAction = "none"
 STAGE_COPY: StageAction = "copy"
 STAGE_MOVE: StageAction = "move"
 
+# Files in a staged directory are copied concurrently; the copies are I/O bound
+# and release the GIL, so a few workers hide per-file latency on slow storage.
+_COPY_WORKERS = min(4, os.cpu_count() or 1)
+
 
 def get_staging_dir() -> Path:
     """Get the staging directory for downloads."""
@@ -54,31 +63,136 @@ def stage_file(source_path: Path, task_id: str, copy: bool = False) -> Path:
     return stage_path(source_path, staging_dir, STAGE_COPY if copy else STAGE_MOVE)
 
 
-def stage_path(source: Path, staging_dir: Path, action: StageAction) -> Path:
-    """Stage a file or directory into a staging dir."""
+# Errors meaning a filesystem has no (or no writable) extended attributes;
+# shutil.copystat skips these too.
+_XATTR_IGNORED_ERRNOS = {errno.ENOTSUP, errno.ENODATA, errno.EINVAL, errno.EPERM}
+
+
+def _copy_xattrs(src_file: str, dst_file: str) -> None:
+    """Copy extended attributes, if the platform and both filesystems have them."""
+    if not hasattr(os, "listxattr"):
+        return
+    try:
+        names = os.listxattr(src_file)
+    except OSError as e:
+        if e.errno not in _XATTR_IGNORED_ERRNOS:
+            raise
+        return
+    for name in names:
+        try:
+            os.setxattr(dst_file, name, os.getxattr(src_file, name))
+        except OSError as e:
+            if e.errno not in _XATTR_IGNORED_ERRNOS:
+                raise
+
+
+def _copy_staged_file(src_file: str, dst_file: str, st: os.stat_result, prefer_zero_copy: bool) -> None:
+    copy_file_data(Path(src_file), Path(dst_file), prefer_zero_copy, st.st_size)
+    # Times and mode come from the scandir stat rather than a fresh copystat;
+    # only xattrs need another look at the source (one listxattr when none are set).
+    os.utime(dst_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+    _copy_xattrs(src_file, dst_file)
+    os.chmod(dst_file, stat.S_IMODE(st.st_mode))
+
+
+def _copytree(source: Path, dest: Path, prefer_zero_copy: bool = True) -> None:
+    """Copy a directory tree, copying its files in parallel.
+
+    Directories are created up front (parents before children, so a single mkdir
+    each), then files are copied by a small thread pool.
+    Symlinks are followed, as with shutil.copytree. Anything that isn't a regular
+    file or directory (FIFOs, sockets, devices) raises shutil.SpecialFileError
+    before any file data is copied, rather than blocking or failing on open.
+    """
+    dirs: list[tuple[str, str]] = []
+    files: list[tuple[str, str, os.stat_result]] = []
+    os.makedirs(dest.parent, exist_ok=True)
+    pending = [(str(source), str(dest))]
+    while pending:
+        src_dir, dst_dir = pending.pop()
+        os.mkdir(dst_dir)
+        dirs.append((src_dir, dst_dir))
+        with os.scandir(src_dir) as entries:
+            for entry in entries:
+                target = os.path.join(dst_dir, entry.name)
+                if entry.is_dir():
+                    pending.append((entry.path, target))
+                    continue
+                st = entry.stat()
+                if not stat.S_ISREG(st.st_mode):
+                    raise shutil.SpecialFileError(f"`{entry.path}` is not a regular file")
+                files.append((entry.path, target, st))
+
+    if len(files) <= 1 or _COPY_WORKERS <= 1:
+        for src_file, dst_file, st in files:
+            _copy_staged_file(src_file, dst_file, st, prefer_zero_copy)
+    else:
+        with ThreadPoolExecutor(max_workers=_COPY_WORKERS, thread_name_prefix="stage-copy") as executor:
+            futures = [
+                executor.submit(_copy_staged_file, src_file, dst_file, st, prefer_zero_copy)
+                for src_file, dst_file, st in files
+            ]
+            for future in futures:
+                future.result()
+
+    # Directory timestamps last, deepest first, so copying into them doesn't reset them.
+    for src_dir, dst_dir in reversed(dirs):
+        shutil.copystat(src_dir, dst_dir)
+
+
+def _move(source: Path, dest: Path, is_dir: bool, prefer_zero_copy: bool = True) -> None:
+    """Move a file or directory, renaming in place when on the same filesystem."""
+    try:
+        os.rename(source, dest)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+
+    if is_dir:
+        _copytree(source, dest, prefer_zero_copy)
+        shutil.rmtree(source)
+    else:
+        copy_file(source, dest, prefer_zero_copy)
+        source.unlink()
+
+
+def stage_path(
+    source: Path,
+    staging_dir: Path,
+    action: StageAction,
+    prefer_zero_copy: bool = True,
+) -> Path:
+    """Stage a file or directory into a staging dir.
+
+    Copies go through os.copy_file_range when prefer_zero_copy is set, so large
+    payloads can be reflinked or copied server-side instead of through a small
+    userspace buffer.
+    """
     if action == STAGE_NONE:
         return source
 
     staged_path = staging_dir / source.name
     counter = 1
+    is_dir = source.is_dir()
 
-    if source.is_dir():
+    if is_dir:
         while staged_path.exists():
             staged_path = staging_dir / f"{source.name}_{counter}"
             counter += 1
         if action == STAGE_COPY:
-            shutil.copytree(str(source), str(staged_path))
+            _copytree(source, staged_path, prefer_zero_copy)
         else:
-            shutil.move(str(source), str(staged_path))
+            _move(source, staged_path, True, prefer_zero_copy)
     else:
         while staged_path.exists():
             staged_path = staging_dir / f"{source.stem}_{counter}{source.suffix}"
             counter += 1
         if action == STAGE_COPY:
-            shutil.copy2(str(source), str(staged_path))
+            copy_file(source, staged_path, prefer_zero_copy)
         else:
-            shutil.move(str(source), str(staged_path))
+            _move(source, staged_path, False, prefer_zero_copy)
 
-    staged_kind = "directory" if source.is_dir() else "file"
+    staged_kind = "directory" if is_dir else "file"
     logger.debug("Staged %s via %s: %s -> %s", staged_kind, action, source, staged_path)
     return staged_path
@@ -1,9 +1,16 @@
 """qBittorrent download client for Prowlarr integration."""
 
+import os
+import random
+import re
 import time
-from types import SimpleNamespace
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from threading import Event, Lock, Thread
 from typing import Optional, Tuple
 
+import requests
+
 from shelfmark.core.config import config
 from shelfmark.core.logger import setup_logger
 from shelfmark.core.utils import normalize_http_url
@@ -13,76 +20,346 @@ from shelfmark.release_sources.prowlarr.clients import (
     register_client,
 )
 from shelfmark.release_sources.prowlarr.clients.torrent_utils import (
+    TorrentInfo,
     extract_torrent_info,
 )
 
 logger = setup_logger(__name__)
 
 
+class _Torrent:
+    """The fields of a `/torrents/info` entry that the client reads.
+
+    Listings stay as the raw dicts qBittorrent returns; only the entry that
+    matches a lookup is copied into one of these.
+    """
+
+    __slots__ = ("hash", "name", "state", "progress", "eta", "dlspeed", "content_path", "save_path")
+
+    def __init__(self, info: dict):
+        self.hash = info.get("hash")
+        self.name = info.get("name", "")
+        self.state = info.get("state", "unknown")
+        self.progress = info.get("progress", 0.0)
+        self.eta = info.get("eta", 0)
+        self.dlspeed = info.get("dlspeed")
+        self.content_path = info.get("content_path", "")
+        self.save_path = info.get("save_path", "")
+
+
+# get_client() builds a fresh client per task, so the listing and derived-path
+# caches live at module level and are keyed by the client's base URL.
+_LISTING_TTL_SEC = 1.5
+_DERIVED_PATH_CACHE_SIZE = 512
+_TORRENT_INFO_CACHE_SIZE = 32
+_cache_lock = Lock()
+_listing_cache: dict[tuple, tuple[float, dict[str, dict]]] = {}
+_derived_path_cache: dict[tuple[str, str], str] = {}
+# find_existing() and add_download() resolve the same URL back to back; keep the
+# parsed result (and any fetched .torrent bytes) so the second call is free.
+_torrent_info_cache: dict[str, TorrentInfo] = {}
+# Whether the server at a base URL reliably honors `torrents/info?hashes=`.
+_hash_filter_support: dict[str, bool] = {}
+# Base URLs whose API version probe failed -> monotonic time of the failure, so
+# status polls don't re-probe until _HASH_FILTER_RETRY_SEC has passed.
+_hash_filter_probe_failed: dict[str, float] = {}
+_HASH_FILTER_RETRY_SEC = 300
+# (base_url, category) pairs already created (or found to exist) on the server.
+_known_categories: set[tuple[str, str]] = set()
+# Hashes find_existing() just saw missing, so the add_download() that follows can
+# skip its own existence check: (base_url, hash) -> monotonic time of the miss.
+_recent_misses: dict[tuple[str, str], float] = {}
+
+# Optional background refresher (QBITTORRENT_BACKGROUND_REFRESH): one thread for
+# the configured server keeps the full listing warm so status polls are served
+# from memory. It follows `sync/maindata` deltas, falling back to full
+# torrents/info listings on servers without the sync API.
+_REFRESH_INTERVAL_SEC = 1.0
+_refresher: Optional["_ListingRefresher"] = None
+
+# Web API version from which an empty `hashes=` result is trusted (2.8 shipped
+# with qBittorrent 4.3); older servers keep the listing fallbacks.
+_HASH_FILTER_MIN_API_VERSION = (2, 8)
+
+# Connection pool sizing for the qbittorrent-api session. Status polling, listing
+# fallbacks and path derivation all go through the same host, so keep enough
+# idle keep-alive connections around to avoid reconnecting between calls.
+_HTTPADAPTER_ARGS = {"pool_connections": 4, "pool_maxsize": 20}
+
+# Either separator ends the top-level segment of a torrent file name.
+_PATH_SEPARATORS = re.compile(r"[\\/]")
+
+# qBittorrent's WebUI session cookie outlives this by default (1 hour); 403s
+# trigger an immediate re-login regardless.
+_AUTH_TTL_SEC = 1800
+
+# Polling schedule while waiting for a newly added torrent to register.
+_ADD_POLL_BUDGET_SEC = 5.0
+_ADD_POLL_INITIAL_DELAY = 0.05
+_ADD_POLL_MAX_DELAY = 1.0
+
+# Map qBittorrent states to our states and user-friendly messages
+_STATE_INFO: dict[str, tuple[str, Optional[str]]] = {
+    "downloading": ("downloading", None),  # None = use default progress message
+    "stalledDL": ("downloading", "Stalled"),
+    "metaDL": ("downloading", "Fetching metadata"),
+    "forcedDL": ("downloading", None),
+    "allocating": ("downloading", "Allocating space"),
+    "uploading": ("seeding", "Seeding"),
+    "stalledUP": ("seeding", "Seeding (stalled)"),
+    "forcedUP": ("seeding", "Seeding"),
+    "pausedDL": ("paused", "Paused"),
+    "pausedUP": ("paused", "Paused"),
+    "queuedDL": ("queued", "Queued"),
+    "queuedUP": ("queued", "Queued"),
+    "checkingDL": ("checking", "Checking files"),
+    "checkingUP": ("checking", "Checking files"),
+    "checkingResumeData": ("checking", "Checking resume data"),
+    "moving": ("processing", "Moving files"),
+    "error": ("error", "Error"),
+    "missingFiles": ("error", "Missing files"),
+    "unknown": ("unknown", "Unknown state"),
+}
+
+# qBittorrent reports 8640000 (100 days) when the ETA is unknown; ignore anything past a week.
+_MAX_ETA_SEC = 604800
+
+
+def _get_cached_listing(key: tuple) -> Optional[dict[str, dict]]:
+    """Return the hash index of a cached listing while it's still fresh."""
+    with _cache_lock:
+        entry = _listing_cache.get(key)
+    if entry and time.monotonic() - entry[0] < _LISTING_TTL_SEC:
+        return entry[1]
+    return None
+
+
+def _store_cached_listing(key: tuple, torrents: list[dict]) -> dict[str, dict]:
+    index = _index_by_hash(torrents)
+    with _cache_lock:
+        _listing_cache[key] = (time.monotonic(), index)
+    return index
+
+
+def _clear_listing_cache() -> None:
+    with _cache_lock:
+        _listing_cache.clear()
+
+
+def _get_torrent_info(url: str, expected_hash: Optional[str] = None) -> TorrentInfo:
+    """`extract_torrent_info()` with results cached per URL once a hash is known.
+
+    The hash is lowercased here (an `expected_hash` from Prowlarr may not be) so
+    later comparisons and returned IDs all use the same form.
+    """
+    with _cache_lock:
+        cached = _torrent_info_cache.get(url)
+    if cached is not None:
+        return cached
+
+    torrent_info = extract_torrent_info(url, expected_hash=expected_hash)
+    if torrent_info.info_hash:
+        torrent_info = torrent_info.with_info_hash(torrent_info.info_hash.lower())
+        with _cache_lock:
+            if len(_torrent_info_cache) >= _TORRENT_INFO_CACHE_SIZE:
+                _torrent_info_cache.pop(next(iter(_torrent_info_cache)))
+            _torrent_info_cache[url] = torrent_info
+    return torrent_info
+
+
+def _eta_or_none(eta) -> Optional[int]:
+    """Return the ETA in seconds when qBittorrent reports a usable value."""
+    return eta if isinstance(eta, int) and 0 < eta < _MAX_ETA_SEC else None
+
+
+def _retry_after_seconds(response) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    value = response.headers.get("Retry-After")
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+@lru_cache(maxsize=4096)
+def _canon_hash(torrent_hash: str) -> str:
+    """Canonical form of a hash; Amarr's zero-padded 40-char hashes become the 32-char ed2k hash."""
+    h = torrent_hash.lower()
+    if len(h) == 40 and h.endswith("00000000"):
+        return h[:32]
+    return h
+
+
+def _is_bittorrent_v1_hash(torrent_hash: str) -> bool:
+    """True for a 40-char info hash that isn't an Amarr zero-padded ed2k hash."""
+    return len(torrent_hash) == 40 and _canon_hash(torrent_hash) == torrent_hash.lower()
+
+
 def _hashes_match(hash1: str, hash2: str) -> bool:
     """Compare hashes, handling Amarr's 40-char zero-padded hashes vs 32-char ed2k hashes."""
-    h1, h2 = hash1.lower(), hash2.lower()
-    if h1 == h2:
-        return True
-    if len(h1) == 40 and len(h2) == 32 and h1.endswith("00000000"):
-        return h1[:32] == h2
-    if len(h2) == 40 and len(h1) == 32 and h2.endswith("00000000"):
-        return h2[:32] == h1
-    return False
+    return _canon_hash(hash1) == _canon_hash(hash2)
+
+
+def _index_by_hash(torrents: list[dict]) -> dict[str, dict]:
+    """Index torrents/info entries by canonical hash, keeping the first entry per hash."""
+    index: dict[str, dict] = {}
+    for info in torrents:
+        entry_hash = info.get("hash")
+        if isinstance(entry_hash, str) and entry_hash:
+            index.setdefault(_canon_hash(entry_hash), info)
+    return index
+
+
+def _find_torrent(torrents: list[dict], torrent_hash: str) -> Optional[_Torrent]:
+    """Return the torrent whose hash matches `torrent_hash`, if any."""
+    target = _canon_hash(torrent_hash)
+    for info in torrents:
+        entry_hash = info.get("hash")
+        if isinstance(entry_hash, str) and _canon_hash(entry_hash) == target:
+            return _Torrent(info)
+    return None
+
+
+class _ListingRefresher:
+    """Background thread that keeps one server's full torrent listing cached.
+
+    It logs in with its own qbittorrent-api client, so its HTTP session is never
+    shared with (or rebuilt by) the per-task clients. The listing it follows is
+    private to the thread and only published through `_store_cached_listing()`.
+    """
+
+    def __init__(self, client_cls, base_url: str, username: str, password: str):
+        # Identifies the server and login; a change means a new refresher.
+        self.key = (base_url, username, password)
+        self.base_url = base_url
+        self._client = client_cls(
+            host=base_url,
+            username=username,
+            password=password,
+            HTTPADAPTER_ARGS=_HTTPADAPTER_ARGS,
+        )
+        self._last_auth = 0.0
+        self._stop_event = Event()
+        self._thread = Thread(target=self._run, name="qbittorrent-refresh", daemon=True)
+
+    @property
+    def stopped(self) -> bool:
+        return self._stop_event.is_set()
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout=_REFRESH_INTERVAL_SEC + 10)
+
+    def _ensure_auth(self, force: bool = False) -> None:
+        if force or time.monotonic() - self._last_auth > _AUTH_TTL_SEC:
+            self._last_auth = 0.0
+            self._client.auth_log_in()
+            self._last_auth = time.monotonic()
+
+    def _get(self, path: str, params: Optional[dict] = None):
+        url = f"{self.base_url}{path}"
+        self._ensure_auth()
+        response = self._client._session.get(url, params=params, timeout=10)
+        if response.status_code == 403:
+            self._ensure_auth(force=True)
+            response = self._client._session.get(url, params=params, timeout=10)
+        response.raise_for_status()
+        return response.json()
+
+    def _sync_torrents(self, rid: int, torrents: dict[str, dict]) -> int:
+        """Apply one `sync/maindata` delta to `torrents` and return the next rid.
+
+        Only torrents that changed since `rid` are sent, and only their changed
+        fields, so a warm listing costs a few bytes per tick instead of the full
+        torrents/info payload. A `full_update` replaces the local state.
+
+        Changed entries are replaced rather than updated in place: the previous
+        entry dicts may already be published in `_listing_cache` and read by
+        task threads without the lock.
+        """
+        data = self._get("/api/v2/sync/maindata", {"rid": rid})
+        if data.get("full_update"):
+            torrents.clear()
+        for torrent_hash, changes in (data.get("torrents") or {}).items():
+            torrents[torrent_hash] = {**torrents.get(torrent_hash, {"hash": torrent_hash}), **changes}
+        for torrent_hash in data.get("torrents_removed") or ():
+            torrents.pop(torrent_hash, None)
+        return int(data.get("rid", 0))
+
+    def _run(self) -> None:
+        key = (self.base_url, ())
+        synced: dict[str, dict] = {}
+        rid: Optional[int] = 0
+        while not self._stop_event.is_set():
+            torrents: Optional[list[dict]] = None
+            if rid is not None:
+                try:
+                    rid = self._sync_torrents(rid, synced)
+                    torrents = list(synced.values())
+                except requests.exceptions.HTTPError as e:
+                    if getattr(e.response, "status_code", None) == 404:
+                        logger.debug("qBittorrent sync API unavailable; refreshing full listings")
+                        rid = None
+                    else:
+                        rid = 0
+                except Exception as e:
+                    logger.debug(f"qBittorrent sync failed: {type(e).__name__}: {e}")
+                    rid = 0
+
+            if torrents is None:
+                try:
+                    torrents = self._get("/api/v2/torrents/info")
+                except Exception as e:
+                    logger.debug(f"qBittorrent background refresh failed: {type(e).__name__}: {e}")
+
+            if torrents is not None:
+                _store_cached_listing(key, torrents)
+            self._stop_event.wait(_REFRESH_INTERVAL_SEC)
+
+
+def _stop_refresher() -> None:
+    """Stop the background listing refresher, if one is running."""
+    global _refresher
+    with _cache_lock:
+        current, _refresher = _refresher, None
+    if current is not None:
+        current.stop()
 
 
 @register_client("torrent")
 class QBittorrentClient(DownloadClient):
     """qBittorrent download client."""
 
-    def _is_torrent_loaded(self, torrent_hash: str) -> tuple[bool, Optional[str]]:
+    def _is_torrent_loaded(
+        self, torrent_hash: str
+    ) -> tuple[bool, Optional[str], Optional[float]]:
         """Check whether qBittorrent has registered a torrent yet.
 
-        Uses `/api/v2/torrents/properties?hash=<hash>`.
+        Uses the same `/api/v2/torrents/info?hashes=<hash>` lookup as status checks,
+        which returns a small list instead of the full properties payload.
 
         Returns:
-            (loaded, error_message)
+            (loaded, error_message, retry_after)
 
         Notes:
-            A false result with no error means "not loaded yet".
+            A false result with no error means "not loaded yet". `retry_after` is
+            set when qBittorrent (or a proxy in front of it) answered HTTP 429.
         """
-        import requests
-
-        url = f"{self._base_url}/api/v2/torrents/properties"
-        params = {"hash": torrent_hash}
-
-        try:
-            self._client.auth_log_in()
-            response = self._client._session.get(url, params=params, timeout=10)
+        torrents, error = self._get_torrents_info(torrent_hash)
+        if error:
+            return False, error, self._retry_after
 
-            # Re-authenticate and retry once on 403
-            if response.status_code == 403:
-                logger.debug("qBittorrent returned 403 for properties; re-authenticating and retrying")
-                self._client.auth_log_in()
-                response = self._client._session.get(url, params=params, timeout=10)
-
-            if response.status_code == 403:
-                return False, "qBittorrent authentication failed (HTTP 403)"
-
-            # qBittorrent returns 404/409-ish responses depending on version when missing.
-            if response.status_code == 404:
-                return False, None
-
-            response.raise_for_status()
-            return True, None
-        except requests.exceptions.HTTPError as e:
-            status = getattr(getattr(e, "response", None), "status_code", None)
-            if status == 404:
-                return False, None
-            if status:
-                return False, f"qBittorrent API request failed (HTTP {status})"
-            return False, "qBittorrent API request failed"
-        except requests.exceptions.ConnectionError:
-            return False, f"Cannot connect to qBittorrent at {self._base_url}"
-        except requests.exceptions.Timeout:
-            return False, f"qBittorrent request timed out at {self._base_url}"
-        except Exception as e:
-            return False, f"qBittorrent API error: {type(e).__name__}: {e}"
+        return _find_torrent(torrents, torrent_hash) is not None, None, None
 
     protocol = "torrent"
     name = "qbittorrent"
@@ -102,46 +379,124 @@ class QBittorrentClient(DownloadClient):
             raise ValueError("QBITTORRENT_URL is invalid")
 
         # qbittorrent-api accepts either a full URL or host:port; prefer the normalized URL
-        # for consistency.
+        # for consistency. The library rebuilds its session on every login, so pool
+        # settings go through HTTPADAPTER_ARGS rather than mounting an adapter here.
+        username = config.get("QBITTORRENT_USERNAME", "")
+        password = config.get("QBITTORRENT_PASSWORD", "")
         self._client = Client(
             host=self._base_url,
-            username=config.get("QBITTORRENT_USERNAME", ""),
-            password=config.get("QBITTORRENT_PASSWORD", ""),
+            username=username,
+            password=password,
+            HTTPADAPTER_ARGS=_HTTPADAPTER_ARGS,
         )
         self._category = config.get("QBITTORRENT_CATEGORY", "books")
+        # Retry-After delay from the last rate-limited torrents/info request.
+        self._retry_after: Optional[float] = None
+        self._last_auth = 0.0
+
+        if config.get("QBITTORRENT_BACKGROUND_REFRESH", False):
+            self._start_background_refresh(Client, username, password)
+        else:
+            self.stop()
+
+    def _start_background_refresh(self, client_cls, username: str, password: str) -> None:
+        """Start the shared listing refresher, replacing one for another server or login."""
+        global _refresher
+        key = (self._base_url, username, password)
+        with _cache_lock:
+            current = _refresher
+            if current is not None and current.key == key and not current.stopped:
+                return
+            refresher = _refresher = _ListingRefresher(client_cls, *key)
+        if current is not None:
+            # Drop whatever the old refresher fetched from the previous server/login.
+            current.stop()
+            _clear_listing_cache()
+        refresher.start()
+
+    def stop(self) -> None:
+        """Stop the background listing refresher, if running."""
+        _stop_refresher()
+
+    def _ensure_auth(self, force: bool = False) -> None:
+        """Log in unless a recent login is still valid.
+
+        qbittorrent-api rebuilds its HTTP session on every `auth_log_in()`, so
+        logging in before each direct GET also threw away the keep-alive pool.
+        """
+        if force or time.monotonic() - self._last_auth > _AUTH_TTL_SEC:
+            self._last_auth = 0.0
+            self._client.auth_log_in()
+            self._last_auth = time.monotonic()
+
+    def _supports_hash_filter(self) -> bool:
+        """Whether a hash query that comes back empty means the torrent is missing.
+
+        Probes `app.web_api_version` once per base URL. Emulators such as Amarr
+        don't always honor `hashes=`, so anything unparseable keeps the listing
+        fallbacks enabled.
+        """
+        with _cache_lock:
+            supported = _hash_filter_support.get(self._base_url)
+            failed_at = _hash_filter_probe_failed.get(self._base_url)
+        if supported is not None:
+            return supported
+        if failed_at is not None and time.monotonic() - failed_at < _HASH_FILTER_RETRY_SEC:
+            return False
+
+        try:
+            api_version = str(self._client.app.web_api_version)
+        except Exception as e:
+            logger.debug(f"qBittorrent API version probe failed: {type(e).__name__}: {e}")
+            with _cache_lock:
+                _hash_filter_probe_failed[self._base_url] = time.monotonic()
+            return False
 
+        try:
+            version = tuple(int(part) for part in api_version.split(".")[:2])
+        except ValueError:
+            version = ()
+        supported = len(version) == 2 and version >= _HASH_FILTER_MIN_API_VERSION
+
+        with _cache_lock:
+            _hash_filter_support[self._base_url] = supported
+            _hash_filter_probe_failed.pop(self._base_url, None)
+        return supported
 
     def _get_torrents_info(
         self, torrent_hash: Optional[str] = None
-    ) -> tuple[list[SimpleNamespace], Optional[str]]:
+    ) -> tuple[list[dict], Optional[str]]:
         """Get torrent info using GET.
 
         Behaviors:
         - Retry once on HTTP 403 by re-authenticating.
         - Keep "API/auth/connect" errors distinct from "torrent missing".
         - If a hash-specific query returns empty, fall back to listing by category
-          and matching locally.
+          and matching locally. The fallback listings are indexed by hash and
+          cached for `_LISTING_TTL_SEC` so repeated lookups don't refetch them.
+          Servers that honor `hashes=` skip the fallbacks for regular BitTorrent
+          hashes.
 
         Returns:
-            (torrents, error_message)
+            (torrents, error_message). For hash lookups served from a listing,
+            only the matching entries are returned.
         """
-        import requests
-
         url = f"{self._base_url}/api/v2/torrents/info"
+        self._retry_after = None
 
         def do_request(params: dict[str, str]) -> requests.Response:
             # Ensure session is authenticated before using it directly
-            self._client.auth_log_in()
+            self._ensure_auth()
             return self._client._session.get(url, params=params, timeout=10)
 
         def parse_response(
             response: requests.Response,
             *,
             request_params: dict[str, str],
-        ) -> tuple[list[SimpleNamespace], Optional[str]]:
+        ) -> tuple[list[dict], Optional[str]]:
             if response.status_code == 403:
                 logger.debug("qBittorrent returned 403; re-authenticating and retrying")
-                self._client.auth_log_in()
+                self._ensure_auth(force=True)
                 response = self._client._session.get(url, params=request_params, timeout=10)
 
             if response.status_code == 403:
@@ -149,47 +504,80 @@ class QBittorrentClient(DownloadClient):
                 return [], "qBittorrent authentication failed (HTTP 403)"
 
             response.raise_for_status()
-            torrents = response.json()
-            return [SimpleNamespace(**t) for t in torrents], None
+            return response.json(), None
+
+        def fetch(params: dict[str, str]) -> tuple[list[dict], Optional[str]]:
+            try:
+                torrents, error = parse_response(do_request(params), request_params=params)
+            except Exception:
+                _clear_listing_cache()
+                raise
+
+            if error:
+                _clear_listing_cache()
+            return torrents, error
+
+        def fetch_index(params: dict[str, str]) -> tuple[dict[str, dict], Optional[str]]:
+            key = (self._base_url, tuple(sorted(params.items())))
+            index = _get_cached_listing(key)
+            if index is not None:
+                return index, None
+
+            torrents, error = fetch(params)
+            if error:
+                return {}, error
+            return _store_cached_listing(key, torrents), None
+
+        def lookup(index: dict[str, dict]) -> list[dict]:
+            matches = (index.get(_canon_hash(h)) for h in torrent_hash.split("|"))
+            return [info for info in matches if info is not None]
+
+        refresher = _refresher
+        if torrent_hash and refresher is not None and refresher.base_url == self._base_url:
+            # The refresher keeps the full listing warm; look the hash up locally.
+            index = _get_cached_listing((self._base_url, ()))
+            if index is not None:
+                return lookup(index), None
 
         try:
             primary_params: dict[str, str] = {}
             if torrent_hash:
                 primary_params["hashes"] = torrent_hash
 
-            response = do_request(primary_params)
-            torrents, error = parse_response(response, request_params=primary_params)
+            torrents, error = fetch(primary_params)
             if error:
                 return [], error
 
-            if torrent_hash and not torrents:
+            if (
+                torrent_hash
+                and not torrents
+                and not (_is_bittorrent_v1_hash(torrent_hash) and self._supports_hash_filter())
+            ):
                 # Fallback 1: list by configured category
                 category_params: dict[str, str] = {}
                 if self._category:
                     category_params["category"] = self._category
 
-                category_response = do_request(category_params)
-                category_torrents, category_error = parse_response(
-                    category_response, request_params=category_params
-                )
+                category_index, category_error = fetch_index(category_params)
                 if category_error:
                     return [], category_error
 
-                if category_torrents:
-                    return category_torrents, None
+                if category_index:
+                    return lookup(category_index), None
 
                 # Fallback 2: list everything (handles per-task categories like audiobooks)
-                all_response = do_request({})
-                all_torrents, all_error = parse_response(all_response, request_params={})
+                all_index, all_error = fetch_index({})
                 if all_error:
                     return [], all_error
 
-                return all_torrents, None
+                return lookup(all_index), None
 
             return torrents, None
 
         except requests.exceptions.HTTPError as e:
             status = getattr(getattr(e, "response", None), "status_code", None)
+            if status == 429:
+                self._retry_after = _retry_after_seconds(e.response)
             if status:
                 logger.warning(f"qBittorrent API error (HTTP {status}): {e}")
                 return [], f"qBittorrent API request failed (HTTP {status})"
@@ -223,7 +611,7 @@ class QBittorrentClient(DownloadClient):
     def test_connection(self) -> Tuple[bool, str]:
         """Test connection to qBittorrent."""
         try:
-            self._client.auth_log_in()
+            self._ensure_auth(force=True)
             api_version = self._client.app.web_api_version
             return True, f"Connected to qBittorrent (API v{api_version})"
         except Exception as e:
@@ -256,19 +644,39 @@ class QBittorrentClient(DownloadClient):
             # Use configured category if not explicitly provided
             category = category or self._category
 
-            # Ensure category exists (may already exist, which is fine)
-            try:
-                self._client.torrents_create_category(name=category)
-            except Exception as e:
-                # Conflict409Error means category exists - that's expected
-                # Log other errors but continue since download may still work
-                if "Conflict" not in type(e).__name__ and "409" not in str(e):
-                    logger.debug(f"Could not create category '{category}': {type(e).__name__}: {e}")
-
-            torrent_info = extract_torrent_info(url, expected_hash=expected_hash)
+            torrent_info = _get_torrent_info(url, expected_hash=expected_hash)
             expected_hash = torrent_info.info_hash
             torrent_data = torrent_info.torrent_data
 
+            # Already in the client: skip category setup, the add and the poll loop.
+            if expected_hash:
+                with _cache_lock:
+                    missed_at = _recent_misses.pop((self._base_url, expected_hash), None)
+                if missed_at is None or time.monotonic() - missed_at > _LISTING_TTL_SEC:
+                    torrents, error = self._get_torrents_info(expected_hash)
+                    if not error and _find_torrent(torrents, expected_hash):
+                        logger.info(f"Torrent already in qBittorrent: {expected_hash}")
+                        return expected_hash.lower()
+
+            # Ensure category exists (may already exist, which is fine)
+            category_key = (self._base_url, category)
+            with _cache_lock:
+                category_known = category_key in _known_categories
+            if not category_known:
+                try:
+                    self._client.torrents_create_category(name=category)
+                    category_known = True
+                except Exception as e:
+                    # Conflict409Error means category exists - that's expected
+                    # Log other errors but continue since download may still work
+                    if "Conflict" not in type(e).__name__ and "409" not in str(e):
+                        logger.debug(f"Could not create category '{category}': {type(e).__name__}: {e}")
+                    else:
+                        category_known = True
+                if category_known:
+                    with _cache_lock:
+                        _known_categories.add(category_key)
+
             # Add the torrent - use file content if we have it, otherwise URL
             if torrent_data:
                 result = self._client.torrents_add(
@@ -286,22 +694,29 @@ class QBittorrentClient(DownloadClient):
                 )
 
             logger.debug(f"qBittorrent add result: {result}")
+            _clear_listing_cache()
 
             if result == "Ok.":
                 if not expected_hash:
                     raise Exception("Could not determine torrent hash from URL")
 
-                # Wait for torrent to appear in client.
-                # Use `/torrents/properties?hash=` rather than relying on `torrents/info`
-                # listing being immediately consistent.
-                for _ in range(10):
-                    loaded, error = self._is_torrent_loaded(expected_hash)
+                # Wait for torrent to appear in client. Poll with exponential backoff
+                # and jitter so quick registrations return fast.
+                deadline = time.monotonic() + _ADD_POLL_BUDGET_SEC
+                delay = _ADD_POLL_INITIAL_DELAY
+                while True:
+                    loaded, error, retry_after = self._is_torrent_loaded(expected_hash)
                     if error:
                         logger.debug(f"qBittorrent add_download: {error}")
                     if loaded:
                         logger.info(f"Added torrent: {expected_hash}")
                         return expected_hash.lower()
-                    time.sleep(0.5)
+
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    time.sleep(min(retry_after if retry_after is not None else delay, remaining))
+                    delay = min(delay * 2, _ADD_POLL_MAX_DELAY) * random.uniform(0.75, 1.25)
 
                 # Client said Ok, trust it
                 logger.warning(f"Torrent not yet visible, returning expected hash")
@@ -309,6 +724,9 @@ class QBittorrentClient(DownloadClient):
 
             raise Exception(f"Failed to add torrent: {result}")
         except Exception as e:
+            # The category may have been removed on the server; check again next time.
+            with _cache_lock:
+                _known_categories.discard((self._base_url, category))
             logger.error(f"qBittorrent add failed: {e}")
             raise
 
@@ -327,77 +745,49 @@ class QBittorrentClient(DownloadClient):
             if error:
                 return DownloadStatus.error(error)
 
-            torrent = next(
-                (
-                    t
-                    for t in torrents
-                    if isinstance(getattr(t, "hash", None), str)
-                    and _hashes_match(getattr(t, "hash"), download_id)
-                ),
-                None,
-            )
+            torrent = _find_torrent(torrents, download_id)
             if not torrent:
                 return DownloadStatus.error("Torrent not found in qBittorrent")
 
-            # Map qBittorrent states to our states and user-friendly messages
-            state_info = {
-                "downloading": ("downloading", None),  # None = use default progress message
-                "stalledDL": ("downloading", "Stalled"),
-                "metaDL": ("downloading", "Fetching metadata"),
-                "forcedDL": ("downloading", None),
-                "allocating": ("downloading", "Allocating space"),
-                "uploading": ("seeding", "Seeding"),
-                "stalledUP": ("seeding", "Seeding (stalled)"),
-                "forcedUP": ("seeding", "Seeding"),
-                "pausedDL": ("paused", "Paused"),
-                "pausedUP": ("paused", "Paused"),
-                "queuedDL": ("queued", "Queued"),
-                "queuedUP": ("queued", "Queued"),
-                "checkingDL": ("checking", "Checking files"),
-                "checkingUP": ("checking", "Checking files"),
-                "checkingResumeData": ("checking", "Checking resume data"),
-                "moving": ("processing", "Moving files"),
-                "error": ("error", "Error"),
-                "missingFiles": ("error", "Missing files"),
-                "unknown": ("unknown", "Unknown state"),
-            }
-
-            torrent_state = getattr(torrent, "state", "unknown")
-            state, message = state_info.get(torrent_state, ("unknown", str(torrent_state)))
-
-            torrent_progress = getattr(torrent, "progress", 0.0)
-            # Don't mark complete while files are being moved to final location
-            # (qBittorrent moves files from incomplete → complete folder)
-            complete = torrent_progress >= 1.0 and torrent_state != "moving"
-
-            # For active downloads without a special message, leave message as None
-            # so the handler can build the progress message
-            if complete:
-                message = "Complete"
-
-            torrent_eta = getattr(torrent, "eta", 0)
-            eta = torrent_eta if isinstance(torrent_eta, int) and 0 < torrent_eta < 604800 else None
-
-            # Get file path for completed downloads
-            file_path = None
-            if complete:
-                file_path = self._resolve_completed_download_path(torrent)
-
-            torrent_speed = getattr(torrent, "dlspeed", None)
-            torrent_speed = torrent_speed if isinstance(torrent_speed, int) else None
-
-            return DownloadStatus(
-                progress=float(torrent_progress) * 100,
-                state="complete" if complete else state,
-                message=message,
-                complete=complete,
-                file_path=file_path,
-                download_speed=torrent_speed,
-                eta=eta,
-            )
+            return self._status_from_torrent(torrent)
         except Exception as e:
             return DownloadStatus.error(self._log_error("get_status", e))
 
+    def _status_from_torrent(self, torrent: _Torrent) -> DownloadStatus:
+        """Build a DownloadStatus from a torrents/info entry."""
+        torrent_state = torrent.state
+        state, message = _STATE_INFO.get(torrent_state, ("unknown", str(torrent_state)))
+
+        torrent_progress = torrent.progress
+        # Don't mark complete while files are being moved to final location
+        # (qBittorrent moves files from incomplete → complete folder)
+        complete = torrent_progress >= 1.0 and torrent_state != "moving"
+
+        # For active downloads without a special message, leave message as None
+        # so the handler can build the progress message
+        if complete:
+            message = "Complete"
+
+        eta = _eta_or_none(torrent.eta)
+
+        # Get file path for completed downloads
+        file_path = None
+        if complete:
+            file_path = self._resolve_completed_download_path(torrent)
+
+        torrent_speed = torrent.dlspeed
+        torrent_speed = torrent_speed if isinstance(torrent_speed, int) else None
+
+        return DownloadStatus(
+            progress=float(torrent_progress) * 100,
+            state="complete" if complete else state,
+            message=message,
+            complete=complete,
+            file_path=file_path,
+            download_speed=torrent_speed,
+            eta=eta,
+        )
+
     def remove(self, download_id: str, delete_files: bool = False) -> bool:
         """
         Remove a torrent from qBittorrent.
@@ -413,6 +803,9 @@ class QBittorrentClient(DownloadClient):
             self._client.torrents_delete(
                 torrent_hashes=download_id, delete_files=delete_files
             )
+            _clear_listing_cache()
+            with _cache_lock:
+                _derived_path_cache.pop((self._base_url, download_id.lower()), None)
             logger.info(
                 f"Removed torrent from qBittorrent: {download_id}"
                 + (" (with files)" if delete_files else "")
@@ -429,27 +822,18 @@ class QBittorrentClient(DownloadClient):
 
         When `content_path` is missing (commonly with qBittorrent-like emulators such
         as Amarr), derive the path using:
-        - `/api/v2/torrents/properties?hash=<hash>` for `save_path`
+        - the listing's `save_path`, or `/api/v2/torrents/properties?hash=<hash>`
+          when the listing doesn't include it
         - `/api/v2/torrents/files?hash=<hash>` for the first file name
         - join `save_path` with the torrent's top-level directory
         """
-        import os
-
         try:
             torrents, error = self._get_torrents_info(download_id)
             if error:
                 logger.debug(f"qBittorrent get_download_path: {error}")
                 return None
 
-            torrent = next(
-                (
-                    t
-                    for t in torrents
-                    if isinstance(getattr(t, "hash", None), str)
-                    and _hashes_match(getattr(t, "hash"), download_id)
-                ),
-                None,
-            )
+            torrent = _find_torrent(torrents, download_id)
             if not torrent:
                 return None
 
@@ -458,48 +842,56 @@ class QBittorrentClient(DownloadClient):
             self._log_error("get_download_path", e, level="debug")
             return None
 
-    def _resolve_completed_download_path(self, torrent: SimpleNamespace) -> Optional[str]:
+    def _resolve_completed_download_path(self, torrent: _Torrent) -> Optional[str]:
         """Resolve the completed path for a torrent.
 
         Centralizes the logic shared by `get_status()` and `get_download_path()`:
         - accept `content_path` only when it's not equal to `save_path`
-        - otherwise derive via properties+files
+        - otherwise derive from `save_path` + the first file
         - finally fall back to `save_path + name`
         """
 
         # Prefer content_path, but treat content_path == save_path as invalid.
-        content_path = getattr(torrent, "content_path", "")
-        save_path = getattr(torrent, "save_path", "")
+        content_path = torrent.content_path
+        save_path = torrent.save_path
         if content_path and (not save_path or str(content_path) != str(save_path)):
             return str(content_path)
 
-        download_id = getattr(torrent, "hash", "")
+        download_id = torrent.hash
         if isinstance(download_id, str) and download_id:
-            derived = self._derive_download_path_from_files(download_id)
+            derived = self._derive_download_path_from_files(download_id, save_path=save_path)
             if derived:
                 return derived
 
         # Legacy fallback: save_path + name (for older clients/emulators)
         return self._build_path(
-            getattr(torrent, "save_path", ""),
-            getattr(torrent, "name", ""),
+            torrent.save_path,
+            torrent.name,
         )
 
-    def _derive_download_path_from_files(self, download_id: str) -> Optional[str]:
-        """Derive completed download path using `/torrents/properties` + `/torrents/files`.
+    def _derive_download_path_from_files(
+        self, download_id: str, save_path: str = ""
+    ) -> Optional[str]:
+        """Derive completed download path using `save_path` + `/torrents/files`.
 
         This mirrors how common automation apps derive the path when
-        `content_path` isn't provided.
+        `content_path` isn't provided. `save_path` normally comes from the
+        torrents/info listing; `/torrents/properties` is only queried without it.
+        Successful results are memoized per hash since a torrent's save path and
+        file layout don't change once resolved.
         """
-        import os
-        import requests
+        cache_key = (self._base_url, download_id.lower())
+        with _cache_lock:
+            cached = _derived_path_cache.get(cache_key)
+        if cached:
+            return cached
 
         def get_with_auth(url: str, params: dict[str, str]) -> requests.Response:
-            self._client.auth_log_in()
+            self._ensure_auth()
             resp = self._client._session.get(url, params=params, timeout=10)
             if resp.status_code == 403:
                 logger.debug("qBittorrent returned 403; re-authenticating and retrying")
-                self._client.auth_log_in()
+                self._ensure_auth(force=True)
                 resp = self._client._session.get(url, params=params, timeout=10)
             return resp
 
@@ -507,15 +899,16 @@ class QBittorrentClient(DownloadClient):
             properties_url = f"{self._base_url}/api/v2/torrents/properties"
             files_url = f"{self._base_url}/api/v2/torrents/files"
 
-            props_resp = get_with_auth(properties_url, {"hash": download_id})
-            if props_resp.status_code == 404:
-                return None
-            props_resp.raise_for_status()
-            props = props_resp.json() if isinstance(props_resp.json(), dict) else {}
-
-            save_path = props.get("save_path") or props.get("savePath") or ""
             if not isinstance(save_path, str) or not save_path:
-                return None
+                props_resp = get_with_auth(properties_url, {"hash": download_id})
+                if props_resp.status_code == 404:
+                    return None
+                props_resp.raise_for_status()
+                props = props_resp.json() if isinstance(props_resp.json(), dict) else {}
+
+                save_path = props.get("save_path") or props.get("savePath") or ""
+                if not isinstance(save_path, str) or not save_path:
+                    return None
 
             files_resp = get_with_auth(files_url, {"hash": download_id})
             if files_resp.status_code == 404:
@@ -529,13 +922,18 @@ class QBittorrentClient(DownloadClient):
             if not isinstance(first_name, str) or not first_name:
                 return None
 
-            # Get the first path segment (qBittorrent returns '/' even on Windows).
-            first_name_norm = first_name.replace("\\", "/")
-            top_level = first_name_norm.split("/", 1)[0]
+            # Get the first path segment (qBittorrent returns '/' even on Windows,
+            # but some emulators send backslashes).
+            top_level = _PATH_SEPARATORS.split(first_name, 1)[0]
             if not top_level:
                 return None
 
-            return os.path.normpath(os.path.join(save_path, top_level))
+            derived = os.path.normpath(os.path.join(save_path, top_level))
+            with _cache_lock:
+                if len(_derived_path_cache) >= _DERIVED_PATH_CACHE_SIZE:
+                    _derived_path_cache.pop(next(iter(_derived_path_cache)))
+                _derived_path_cache[cache_key] = derived
+            return derived
         except Exception as e:
             logger.debug(f"qBittorrent could not derive path from files: {type(e).__name__}: {e}")
             return None
@@ -545,29 +943,31 @@ class QBittorrentClient(DownloadClient):
     ) -> Optional[Tuple[str, DownloadStatus]]:
         """Check if a torrent for this URL already exists in qBittorrent."""
         try:
-            torrent_info = extract_torrent_info(url)
+            torrent_info = _get_torrent_info(url)
             if not torrent_info.info_hash:
                 return None
 
-            torrents, error = self._get_torrents_info(torrent_info.info_hash)
+            info_hash = torrent_info.info_hash
+            torrents, error = self._get_torrents_info(info_hash)
             if error:
                 logger.debug(f"qBittorrent find_existing: {error}")
                 return None
 
-            torrent = next(
-                (
-                    t
-                    for t in torrents
-                    if isinstance(getattr(t, "hash", None), str)
-                    and _hashes_match(getattr(t, "hash"), torrent_info.info_hash)
-                ),
-                None,
-            )
-            if torrent and isinstance(getattr(torrent, "hash", None), str):
-                torrent_hash = getattr(torrent, "hash")
-                return (torrent_hash.lower(), self.get_status(torrent_hash.lower()))
+            torrent = _find_torrent(torrents, info_hash)
+            if not torrent:
+                with _cache_lock:
+                    if len(_recent_misses) >= _TORRENT_INFO_CACHE_SIZE:
+                        _recent_misses.pop(next(iter(_recent_misses)))
+                    _recent_misses[(self._base_url, info_hash)] = time.monotonic()
+                return None
 
-            return None
+            # Build the status from the entry we already have rather than
+            # querying qBittorrent again through get_status().
+            try:
+                status = self._status_from_torrent(torrent)
+            except Exception as e:
+                status = DownloadStatus.error(self._log_error("get_status", e))
+            return (torrent.hash.lower(), status)
         except Exception as e:
             logger.debug(f"Error checking for existing torrent: {e}")
             return None
@@ -1,6 +1,7 @@
 """Prowlarr download handler - executes downloads via torrent/usenet clients."""
 
 import shutil
+from functools import lru_cache
 from pathlib import Path
 from threading import Event
 from typing import Callable, Optional
@@ -8,7 +9,13 @@ from typing import Callable, Optional
 from shelfmark.core.config import config
 from shelfmark.core.logger import setup_logger
 from shelfmark.core.models import DownloadTask
-from shelfmark.core.utils import is_audiobook
+from shelfmark.core.path_mappings import (
+    RemotePathMappingIndex,
+    get_client_host_identifier,
+    parse_remote_path_mappings,
+    remap_remote_to_local_with_match,
+)
+from shelfmark.core.settings_registry import get_config_version
 from shelfmark.release_sources import DownloadHandler, register_handler
 from shelfmark.release_sources.prowlarr.cache import get_release, remove_release
 from shelfmark.release_sources.prowlarr.clients import (
@@ -21,8 +28,33 @@ from shelfmark.release_sources.prowlarr.utils import get_preferred_download_url,
 
 logger = setup_logger(__name__)
 
-# How often to poll the download client for status (seconds)
-POLL_INTERVAL = 2
+# How often to poll the download client for status (seconds). Polling starts at
+# POLL_INTERVAL and backs off towards MAX_POLL_INTERVAL while nothing changes.
+POLL_INTERVAL = 1
+MAX_POLL_INTERVAL = 10
+
+# Client-specific audiobook category config keys
+AUDIOBOOK_CATEGORY_KEYS = {
+    "qbittorrent": "QBITTORRENT_CATEGORY_AUDIOBOOK",
+    "transmission": "TRANSMISSION_CATEGORY_AUDIOBOOK",
+    "deluge": "DELUGE_CATEGORY_AUDIOBOOK",
+    "nzbget": "NZBGET_CATEGORY_AUDIOBOOK",
+    "sabnzbd": "SABNZBD_CATEGORY_AUDIOBOOK",
+}
+
+
+@lru_cache(maxsize=8)
+def _audiobook_category(client_name: str, config_version: int) -> Optional[str]:
+    audiobook_key = AUDIOBOOK_CATEGORY_KEYS.get(client_name)
+    return config.get(audiobook_key, "") or None if audiobook_key else None
+
+
+@lru_cache(maxsize=1)
+def _remote_path_mappings(config_version: int) -> RemotePathMappingIndex:
+    """Parse PROWLARR_REMOTE_PATH_MAPPINGS into a prefix index, once per config version."""
+    return RemotePathMappingIndex(
+        parse_remote_path_mappings(config.get("PROWLARR_REMOTE_PATH_MAPPINGS", []))
+    )
 
 
 def _diagnose_path_issue(path: str) -> str:
@@ -70,19 +102,9 @@ class ProwlarrHandler(DownloadHandler):
 
     def _get_category_for_task(self, client, task: DownloadTask) -> Optional[str]:
         """Get audiobook category if configured and applicable, else None for default."""
-        if not is_audiobook(task.content_type):
+        if not task.is_audiobook:
             return None
-
-        # Client-specific audiobook category config keys
-        audiobook_keys = {
-            "qbittorrent": "QBITTORRENT_CATEGORY_AUDIOBOOK",
-            "transmission": "TRANSMISSION_CATEGORY_AUDIOBOOK",
-            "deluge": "DELUGE_CATEGORY_AUDIOBOOK",
-            "nzbget": "NZBGET_CATEGORY_AUDIOBOOK",
-            "sabnzbd": "SABNZBD_CATEGORY_AUDIOBOOK",
-        }
-        audiobook_key = audiobook_keys.get(client.name)
-        return config.get(audiobook_key, "") or None if audiobook_key else None
+        return _audiobook_category(client.name, get_config_version())
 
     def post_process_cleanup(self, task: DownloadTask, success: bool) -> None:
         if not success:
@@ -133,20 +155,13 @@ class ProwlarrHandler(DownloadHandler):
             logger.debug(f"No download path available for {client.name} {download_id}")
             return
 
-        from shelfmark.core.path_mappings import (
-            get_client_host_identifier,
-            parse_remote_path_mappings,
-            remap_remote_to_local_with_match,
-        )
-
         source_path_obj = Path(raw_path)
         host = get_client_host_identifier(client) or ""
-        mapping_value = config.get("PROWLARR_REMOTE_PATH_MAPPINGS", [])
-        mappings = parse_remote_path_mappings(mapping_value)
+        mappings = _remote_path_mappings(get_config_version())
         remapped, matched_mapping = remap_remote_to_local_with_match(
             mappings=mappings,
             host=host,
-            remote_path=source_path_obj,
+            remote_path=raw_path,
         )
 
         delete_path = remapped if matched_mapping else source_path_obj
@@ -199,17 +214,19 @@ class ProwlarrHandler(DownloadHandler):
         """Build a progress message from download status."""
         msg = f"{status.progress:.0f}%"
 
-        if status.download_speed and status.download_speed > 0:
-            speed_mb = status.download_speed / 1024 / 1024
-            msg += f" ({speed_mb:.1f} MB/s)"
+        speed = status.download_speed
+        if speed and speed > 0:
+            msg += f" ({speed / 1048576:.1f} MB/s)"
 
-        if status.eta and status.eta > 0:
-            if status.eta < 60:
-                msg += f" - {status.eta}s left"
-            elif status.eta < 3600:
-                msg += f" - {status.eta // 60}m left"
+        eta = status.eta
+        if eta and eta > 0:
+            if eta < 60:
+                msg += f" - {eta}s left"
+            elif eta < 3600:
+                msg += f" - {eta // 60}m left"
             else:
-                msg += f" - {status.eta // 3600}h {(status.eta % 3600) // 60}m left"
+                hours, remainder = divmod(eta, 3600)
+                msg += f" - {hours}h {remainder // 60}m left"
 
         return msg
 
@@ -229,14 +246,13 @@ class ProwlarrHandler(DownloadHandler):
                 status_callback("error", "Release not found in cache (may have expired)")
                 return None
 
-            # Extract download URL
-            download_url = get_preferred_download_url(prowlarr_result)
+            # Determine protocol, then the download URL preferred for it
+            protocol = get_protocol(prowlarr_result)
+            download_url = get_preferred_download_url(prowlarr_result, protocol)
             if not download_url:
                 status_callback("error", "No download URL available")
                 return None
 
-            # Determine protocol
-            protocol = get_protocol(prowlarr_result)
             if protocol == "unknown":
                 status_callback("error", "Could not determine download protocol")
                 return None
@@ -279,20 +295,13 @@ class ProwlarrHandler(DownloadHandler):
                         )
                         return None
 
-                    from shelfmark.core.path_mappings import (
-                        get_client_host_identifier,
-                        parse_remote_path_mappings,
-                        remap_remote_to_local_with_match,
-                    )
-
                     source_path_obj = Path(source_path)
                     host = get_client_host_identifier(client) or ""
-                    mapping_value = config.get("PROWLARR_REMOTE_PATH_MAPPINGS", [])
-                    mappings = parse_remote_path_mappings(mapping_value)
+                    mappings = _remote_path_mappings(get_config_version())
                     remapped, matched_mapping = remap_remote_to_local_with_match(
                         mappings=mappings,
                         host=host,
-                        remote_path=source_path_obj,
+                        remote_path=source_path,
                     )
 
                     if matched_mapping:
@@ -365,7 +374,6 @@ class ProwlarrHandler(DownloadHandler):
                 status_callback("resolving", f"Sending to {client.name}")
                 try:
                     release_name = prowlarr_result.get("title") or task.title or "Unknown"
-                    category = self._get_category_for_task(client, task)
                     expected_hash = str(prowlarr_result.get("infoHash") or "").strip() or None
                     download_id = client.add_download(
                         url=download_url,
@@ -409,11 +417,14 @@ class ProwlarrHandler(DownloadHandler):
         """Poll the download client for progress and handle completion."""
         # Track consecutive "not found" errors - torrents may take time to appear in client
         not_found_count = 0
-        max_not_found_retries = 15  # 15 retries * 2s poll = 30s grace period
+        max_not_found_retries = 30  # 30 retries * 1s poll = 30s grace period
+        poll_delay = POLL_INTERVAL
+        last_seen = None
 
         try:
             logger.debug(f"Starting poll for {download_id} (content_type={task.content_type})")
-            while not cancel_flag.is_set():
+            cancelled = cancel_flag.is_set()
+            while not cancelled:
                 status = client.get_status(download_id)
                 progress_callback(status.progress)
 
@@ -463,8 +474,7 @@ class ProwlarrHandler(DownloadHandler):
                                 f"(attempt {not_found_count}/{max_not_found_retries})"
                             )
                             status_callback("resolving", "Waiting for download client...")
-                            if cancel_flag.wait(timeout=POLL_INTERVAL):
-                                break
+                            cancelled = cancel_flag.wait(timeout=POLL_INTERVAL)
                             continue
 
                         logger.error(
@@ -489,12 +499,20 @@ class ProwlarrHandler(DownloadHandler):
                 else:
                     status_callback("downloading", msg)
 
+                # Back off while a download is stalled or queued; poll promptly again
+                # as soon as progress or state changes.
+                seen = (status.state, status.progress)
+                if seen == last_seen:
+                    poll_delay = min(poll_delay * 2, MAX_POLL_INTERVAL)
+                else:
+                    poll_delay = POLL_INTERVAL
+                last_seen = seen
+
                 # Wait for next poll (interruptible by cancel)
-                if cancel_flag.wait(timeout=POLL_INTERVAL):
-                    break
+                cancelled = cancel_flag.wait(timeout=poll_delay)
 
             # Handle cancellation
-            if cancel_flag.is_set():
+            if cancelled:
                 if protocol == "usenet":
                     logger.info(f"Download cancelled, removing from {client.name}: {download_id}")
                     try:
@@ -527,42 +545,37 @@ class ProwlarrHandler(DownloadHandler):
                 return None
 
             # Apply remote path mappings (client path -> shelfmark container path)
-            from shelfmark.core.path_mappings import (
-                get_client_host_identifier,
-                parse_remote_path_mappings,
-                remap_remote_to_local_with_match,
-            )
-
             source_path_obj = Path(source_path)
             host = get_client_host_identifier(client) or ""
-            mapping_value = config.get("PROWLARR_REMOTE_PATH_MAPPINGS", [])
-            mappings = parse_remote_path_mappings(mapping_value)
+            mappings = _remote_path_mappings(get_config_version())
 
             logger.debug(
                 "Attempting path remap: client=%s, host=%s, path=%s, mappings=%s",
                 client.name,
                 host,
                 source_path_obj,
-                [(m.host, m.remote_path, m.local_path) for m in mappings],
+                [(m.host, m.remote_path, m.local_path) for m in mappings.mappings],
             )
 
             remapped, matched_mapping = remap_remote_to_local_with_match(
                 mappings=mappings,
                 host=host,
-                remote_path=source_path_obj,
+                remote_path=source_path,
             )
+            # Stat the path we'd use once, for both the debug log and the checks below.
+            path_exists = (remapped if matched_mapping else source_path_obj).exists()
 
             logger.debug(
                 "Remap result: %s -> %s (exists=%s, changed=%s, matched=%s)",
                 source_path_obj,
                 remapped,
-                remapped.exists(),
+                path_exists,
                 remapped != source_path_obj,
                 matched_mapping,
             )
 
             if matched_mapping:
-                if remapped.exists():
+                if path_exists:
                     logger.info(
                         "Remapped download path for %s (%s): %s -> %s",
                         client.name,
@@ -584,7 +597,7 @@ class ProwlarrHandler(DownloadHandler):
                     )
                     return None
             elif mappings:
-                if source_path_obj.exists():
+                if path_exists:
                     logger.info(
                         "No remote path mapping matched for %s (%s); using client path: %s",
                         client.name,
@@ -602,7 +615,7 @@ class ProwlarrHandler(DownloadHandler):
                         f"{hint} No remote path mapping matched for client '{client.name}'.",
                     )
                     return None
-            elif not source_path_obj.exists():
+            elif not path_exists:
                 hint = _diagnose_path_issue(source_path)
                 logger.error(
                     f"Download path does not exist: {source_path}. "
@@ -649,11 +662,12 @@ class ProwlarrHandler(DownloadHandler):
         seeding data and enable hardlinking when configured.
         """
         try:
+            path = str(source_path)
             if protocol == "torrent":
-                task.original_download_path = str(source_path)
+                task.original_download_path = path
 
-            logger.debug(f"Download complete, returning original path: {source_path}")
-            return str(source_path)
+            logger.debug(f"Download complete, returning original path: {path}")
+            return path
 
         except Exception as e:
             logger.error(f"Failed to finalize completed download at {source_path}: {e}")
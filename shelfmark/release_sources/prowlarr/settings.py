@@ -542,6 +542,13 @@ def prowlarr_clients_settings():
             default="",
             show_when={"field": "PROWLARR_TORRENT_CLIENT", "value": "qbittorrent"},
         ),
+        CheckboxField(
+            key="QBITTORRENT_BACKGROUND_REFRESH",
+            label="Background Refresh",
+            description="Refresh the qBittorrent torrent list once per second in the background and answer status checks from it. Useful with many active downloads.",
+            default=False,
+            show_when={"field": "PROWLARR_TORRENT_CLIENT", "value": "qbittorrent"},
+        ),
 
         # --- Transmission Settings ---
         TextField(
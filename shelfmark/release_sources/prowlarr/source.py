@@ -180,7 +180,7 @@ def _prowlarr_result_to_release(result: dict, search_content_type: str = "ebook"
         language=_extract_language(title),
         size=_parse_size(size_bytes),
         size_bytes=size_bytes,
-        download_url=get_preferred_download_url(result),
+        download_url=get_preferred_download_url(result, protocol),
         info_url=result.get("infoUrl") or result.get("guid"),
         protocol=(
             ReleaseProtocol.TORRENT
@@ -33,13 +33,15 @@ def get_protocol(result: dict) -> str:
     return "unknown"
 
 
-def get_preferred_download_url(result: dict) -> str:
+def get_preferred_download_url(result: dict, protocol: Optional[str] = None) -> str:
     """Pick the best URL to hand to a download client.
 
     For torrent results, prefer magnetUrl when available (downloadUrl may be a
-    Prowlarr proxy URL that needs auth/headers).
+    Prowlarr proxy URL that needs auth/headers). Callers that already resolved
+    the protocol with get_protocol() can pass it to skip re-reading the result.
     """
-    protocol = str(result.get("protocol", "")).lower()
+    if protocol is None:
+        protocol = str(result.get("protocol", "")).lower()
     magnet_url = str(result.get("magnetUrl") or "").strip()
     download_url = sanitize_download_url(str(result.get("downloadUrl") or "").strip())
 
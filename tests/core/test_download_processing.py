@@ -72,6 +72,12 @@ def _mock_destination_config(ingest_dir: Path, extra=None):
     return MagicMock(side_effect=lambda key, default=None: values.get(key, default))
 
 
+def _mock_script_process(returncode=0, stdout=b"", stderr=b""):
+    process = MagicMock(returncode=returncode)
+    process.communicate.return_value = (stdout, stderr)
+    return process
+
+
 def _sync_core_config(mock_config, mock_core_config, mock_archive_config=None):
     mock_core_config.get = mock_config.get
     mock_core_config.CUSTOM_SCRIPT = getattr(mock_config, "CUSTOM_SCRIPT", None)
@@ -196,11 +202,131 @@ class TestAtomicCopy:
         # Simulate shutil.copy2 failure mid-copy
         with patch('shutil.copy2', side_effect=IOError("Disk full")):
             with pytest.raises(IOError):
-                _atomic_copy(source, dest)
+                _atomic_copy(source, dest, prefer_zero_copy=False)
 
         # No partial file should exist
         assert not dest.exists()
 
+    @pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="requires os.copy_file_range")
+    def test_zero_copy_preserves_content_and_metadata(self, tmp_path):
+        """Kernel-side copy produces the same result as shutil.copy2."""
+        from shelfmark.download.fs import atomic_copy as _atomic_copy
+
+        source = tmp_path / "source.bin"
+        source.write_bytes(os.urandom(64 * 1024) * 32)
+        os.chmod(source, 0o640)
+        dest = tmp_path / "dest.bin"
+
+        with patch('shutil.copy2') as mock_copy2:
+            result = _atomic_copy(source, dest)
+
+        mock_copy2.assert_not_called()
+        assert result.read_bytes() == source.read_bytes()
+        assert (os.stat(result).st_mode & 0o777) == 0o640
+
+    @pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="requires os.copy_file_range")
+    def test_zero_copy_unsupported_falls_back(self, tmp_path):
+        """Falls back to shutil.copy2 when copy_file_range is unsupported."""
+        import errno
+        from shelfmark.download.fs import atomic_copy as _atomic_copy
+
+        source = tmp_path / "source.txt"
+        source.write_text("content" * (1 << 18))
+        dest = tmp_path / "dest.txt"
+
+        with patch('shelfmark.download.fs._reflink_file', return_value=False), \
+             patch('shelfmark.download.fs.os.copy_file_range', side_effect=OSError(errno.EXDEV, "Cross-device link")) as copy_range:
+            result = _atomic_copy(source, dest)
+
+        copy_range.assert_called_once()
+        assert result.read_text() == source.read_text()
+
+    @pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="requires os.copy_file_range")
+    def test_zero_copy_immediate_eof_falls_back(self, tmp_path):
+        """copy_file_range returning 0 on a non-empty file falls back to shutil.copy2."""
+        from shelfmark.download.fs import atomic_copy as _atomic_copy
+
+        source = tmp_path / "source.bin"
+        source.write_bytes(os.urandom(64 * 1024) * 32)
+        dest = tmp_path / "dest.bin"
+
+        with patch('shelfmark.download.fs._reflink_file', return_value=False), \
+             patch('shelfmark.download.fs.os.copy_file_range', return_value=0) as copy_range, \
+             patch('shutil.copy2', wraps=shutil.copy2) as copy2:
+            result = _atomic_copy(source, dest)
+
+        copy_range.assert_called_once()
+        copy2.assert_called_once()
+        assert result.read_bytes() == source.read_bytes()
+
+    @pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="requires os.copy_file_range")
+    def test_zero_copy_short_copy_raises(self, tmp_path):
+        """A copy that stops before the source size is an error, not a success."""
+        from shelfmark.download import fs
+
+        source = tmp_path / "source.bin"
+        source.write_bytes(b"x" * (2 << 20))
+        dest = tmp_path / "dest.bin"
+
+        with patch.object(fs.os, "copy_file_range", side_effect=[4096, 0]):
+            with pytest.raises(OSError):
+                fs._copy_file_range(source, dest)
+
+    def test_reflink_used_before_copy_file_range(self, tmp_path):
+        """A successful FICLONE skips the data copy entirely."""
+        from shelfmark.download import fs
+
+        source = tmp_path / "source.txt"
+        source.write_text("content" * (1 << 18))
+        dest = tmp_path / "dest.txt"
+
+        def fake_reflink(src, dst):
+            shutil.copyfile(src, dst)
+            return True
+
+        with patch.object(fs, "_reflink_file", side_effect=fake_reflink), \
+             patch.object(fs, "_copy_file_range") as copy_range, \
+             patch("shutil.copy2") as copy2:
+            result = fs.atomic_copy(source, dest)
+
+        copy_range.assert_not_called()
+        copy2.assert_not_called()
+        assert result.read_text() == source.read_text()
+
+    def test_reflink_unsupported_falls_back(self, tmp_path):
+        """FICLONE errors such as EOPNOTSUPP fall through to a regular copy."""
+        import errno
+        from shelfmark.download import fs
+
+        if fs.fcntl is None:
+            pytest.skip("requires fcntl")
+
+        source = tmp_path / "source.txt"
+        source.write_text("content" * (1 << 18))
+        dest = tmp_path / "dest.txt"
+
+        with patch.object(fs.fcntl, "ioctl", side_effect=OSError(errno.EOPNOTSUPP, "Not supported")) as ioctl:
+            result = fs.atomic_copy(source, dest)
+
+        ioctl.assert_called_once()
+        assert result.read_text() == source.read_text()
+
+    def test_small_files_skip_zero_copy_probes(self, tmp_path):
+        """Files up to 1 MiB are copied with shutil.copy2 directly."""
+        from shelfmark.download import fs
+
+        source = tmp_path / "source.txt"
+        source.write_text("content")
+        dest = tmp_path / "dest.txt"
+
+        with patch.object(fs, "_reflink_file") as reflink, \
+             patch.object(fs, "_copy_file_range") as copy_range:
+            result = fs.atomic_copy(source, dest)
+
+        reflink.assert_not_called()
+        copy_range.assert_not_called()
+        assert result.read_text() == "content"
+
     def test_max_attempts_exceeded(self, tmp_path):
         """Raises after max collision attempts."""
         from shelfmark.download.fs import atomic_copy as _atomic_copy
@@ -460,6 +586,35 @@ class TestProcessDirectory:
 class TestPostProcessDownload:
     """Tests for _post_process_download() function."""
 
+    def test_output_plan_built_once(self, temp_dirs, sample_direct_task):
+        """Folder output reuses its output plan when preparing files."""
+        from shelfmark.download.postprocess.prepare import build_output_plan
+        from shelfmark.download.postprocess.router import post_process_download as _post_process_download
+
+        temp_file = temp_dirs["staging"] / "book.epub"
+        temp_file.write_bytes(b"epub content")
+
+        with patch('shelfmark.core.config.config') as mock_config, \
+             patch('shelfmark.config.env.TMP_DIR', temp_dirs["staging"]), \
+             patch('shelfmark.download.outputs.folder.build_output_plan', wraps=build_output_plan) as folder_build, \
+             patch('shelfmark.download.postprocess.prepare.build_output_plan', wraps=build_output_plan) as prepare_build:
+
+            mock_config.USE_BOOK_TITLE = False
+            mock_config.CUSTOM_SCRIPT = None
+            mock_config.get = _mock_destination_config(temp_dirs["ingest"])
+            _sync_core_config(mock_config, mock_config)
+
+            result = _post_process_download(
+                temp_file=temp_file,
+                task=sample_direct_task,
+                cancel_flag=Event(),
+                status_callback=MagicMock(),
+            )
+
+        assert result is not None
+        assert folder_build.call_count == 1
+        prepare_build.assert_not_called()
+
     def test_simple_file_move_to_ingest(self, temp_dirs, sample_direct_task):
         """Simple file is moved to ingest directory."""
         from shelfmark.download.postprocess.router import post_process_download as _post_process_download
@@ -669,6 +824,59 @@ class TestPostProcessDownload:
         assert result_path.parent == audiobook_ingest
 
 
+# =============================================================================
+# Folder Output Support Tests
+# =============================================================================
+
+class TestFolderOutputSupport:
+    """Tests for _supports_folder_output() dispatch checks."""
+
+    def test_support_cached_until_config_changes(self):
+        """Output mode is read once per content type until config changes."""
+        from shelfmark.core.settings_registry import bump_config_version
+        from shelfmark.download.outputs.folder import _folder_output_supported, _supports_folder_output
+
+        book = DownloadTask(task_id="b", source="direct_download", title="Book", content_type="book (fiction)")
+        audiobook = DownloadTask(task_id="a", source="direct_download", title="Book", content_type="audiobook")
+        values = {"BOOKS_OUTPUT_MODE": "booklore"}
+
+        _folder_output_supported.cache_clear()
+        with patch('shelfmark.core.config.config') as mock_config:
+            mock_config.get = MagicMock(side_effect=lambda key, default=None: values.get(key, default))
+
+            assert _supports_folder_output(book) is False
+            assert _supports_folder_output(book) is False
+            assert _supports_folder_output(audiobook) is True
+            assert mock_config.get.call_count == 1
+
+            values["BOOKS_OUTPUT_MODE"] = "folder"
+            bump_config_version()
+            assert _supports_folder_output(book) is True
+        _folder_output_supported.cache_clear()
+
+
+class TestCommonParent:
+    """Tests for _common_parent() custom script target resolution."""
+
+    def test_shared_folder(self):
+        from shelfmark.download.outputs.folder import _common_parent
+
+        paths = [Path("/books/Author/Title/01.mp3"), Path("/books/Author/Title/02.mp3")]
+        assert _common_parent(paths, Path("/books")) == Path("/books/Author/Title")
+
+    def test_different_folders(self):
+        from shelfmark.download.outputs.folder import _common_parent
+
+        paths = [Path("/books/Author/Title/CD1/01.mp3"), Path("/books/Author/Title/CD2/01.mp3")]
+        assert _common_parent(paths, Path("/books")) == Path("/books/Author/Title")
+
+    def test_no_common_path_uses_fallback(self):
+        from shelfmark.download.outputs.folder import _common_parent
+
+        paths = [Path("/books/a.epub"), Path("relative/b.epub")]
+        assert _common_parent(paths, Path("/books")) == Path("/books")
+
+
 # =============================================================================
 # Custom Script Execution Tests
 # =============================================================================
@@ -689,7 +897,7 @@ class TestCustomScriptExecution:
 
         with patch('shelfmark.core.config.config') as mock_config, \
              patch('shelfmark.config.env.TMP_DIR', temp_dirs["staging"]), \
-             patch('subprocess.run') as mock_run:
+             patch('subprocess.Popen') as mock_run:
 
             mock_config.USE_BOOK_TITLE = False
             mock_config.CUSTOM_SCRIPT = "/path/to/script.sh"
@@ -697,7 +905,7 @@ class TestCustomScriptExecution:
             mock_config.get = _mock_destination_config(temp_dirs["ingest"])
             _sync_core_config(mock_config, mock_config)
 
-            mock_run.return_value = MagicMock(stdout="", returncode=0)
+            mock_run.return_value = _mock_script_process()
 
             result = _post_process_download(
                 temp_file=temp_file,
@@ -725,7 +933,7 @@ class TestCustomScriptExecution:
 
         with patch('shelfmark.core.config.config') as mock_config, \
              patch('shelfmark.config.env.TMP_DIR', temp_dirs["staging"]), \
-             patch('subprocess.run') as mock_run:
+             patch('subprocess.Popen') as mock_run:
 
             mock_config.USE_BOOK_TITLE = False
             mock_config.CUSTOM_SCRIPT = "/path/to/script.sh"
@@ -736,7 +944,7 @@ class TestCustomScriptExecution:
             )
             _sync_core_config(mock_config, mock_config)
 
-            mock_run.return_value = MagicMock(stdout="", returncode=0)
+            mock_run.return_value = _mock_script_process()
 
             result = _post_process_download(
                 temp_file=temp_file,
@@ -777,7 +985,7 @@ class TestCustomScriptExecution:
 
         with patch('shelfmark.core.config.config') as mock_config, \
              patch('shelfmark.config.env.TMP_DIR', temp_dirs["staging"]), \
-             patch('subprocess.run') as mock_run:
+             patch('subprocess.Popen') as mock_run:
 
             mock_config.USE_BOOK_TITLE = False
             mock_config.CUSTOM_SCRIPT = "/path/to/script.sh"
@@ -785,7 +993,7 @@ class TestCustomScriptExecution:
             mock_config.get = _mock_destination_config(temp_dirs["ingest"], {"FILE_ORGANIZATION_AUDIOBOOK": "none"})
             _sync_core_config(mock_config, mock_config)
 
-            mock_run.return_value = MagicMock(stdout="", returncode=0)
+            mock_run.return_value = _mock_script_process()
 
             result = _post_process_download(
                 temp_file=download_dir,
@@ -812,7 +1020,7 @@ class TestCustomScriptExecution:
 
         with patch('shelfmark.core.config.config') as mock_config, \
              patch('shelfmark.config.env.TMP_DIR', temp_dirs["staging"]), \
-             patch('subprocess.run', side_effect=FileNotFoundError("not found")):
+             patch('subprocess.Popen', side_effect=FileNotFoundError("not found")):
 
             mock_config.USE_BOOK_TITLE = False
             mock_config.CUSTOM_SCRIPT = "/nonexistent/script.sh"
@@ -842,7 +1050,7 @@ class TestCustomScriptExecution:
 
         with patch('shelfmark.core.config.config') as mock_config, \
              patch('shelfmark.config.env.TMP_DIR', temp_dirs["staging"]), \
-             patch('subprocess.run', side_effect=PermissionError("not executable")):
+             patch('subprocess.Popen', side_effect=PermissionError("not executable")):
 
             mock_config.USE_BOOK_TITLE = False
             mock_config.CUSTOM_SCRIPT = "/path/to/script.sh"
@@ -873,7 +1081,8 @@ class TestCustomScriptExecution:
 
         with patch('shelfmark.core.config.config') as mock_config, \
              patch('shelfmark.config.env.TMP_DIR', temp_dirs["staging"]), \
-             patch('subprocess.run', side_effect=subprocess.TimeoutExpired("script", 300)):
+             patch('shelfmark.download.outputs.folder.CUSTOM_SCRIPT_TIMEOUT', 0), \
+             patch('subprocess.Popen') as mock_run:
 
             mock_config.USE_BOOK_TITLE = False
             mock_config.CUSTOM_SCRIPT = "/path/to/script.sh"
@@ -881,6 +1090,9 @@ class TestCustomScriptExecution:
             mock_config.get = _mock_destination_config(temp_dirs["ingest"])
             _sync_core_config(mock_config, mock_config)
 
+            process = mock_run.return_value
+            process.communicate.side_effect = subprocess.TimeoutExpired("script", 0.1)
+
             result = _post_process_download(
                 temp_file=temp_file,
                 task=sample_direct_task,
@@ -889,8 +1101,49 @@ class TestCustomScriptExecution:
             )
 
         assert result is None
+        process.terminate.assert_called_once()
         status_cb.assert_called_with("error", "Custom script timed out")
 
+    def test_script_stopped_when_cancelled(self, temp_dirs, sample_direct_task):
+        """Stops a running script as soon as the task is cancelled."""
+        from shelfmark.download.postprocess.router import post_process_download as _post_process_download
+        import subprocess
+
+        temp_file = temp_dirs["staging"] / "book.epub"
+        temp_file.write_bytes(b"content")
+
+        status_cb = MagicMock()
+        cancel_flag = Event()
+
+        def still_running(timeout=None):
+            cancel_flag.set()
+            raise subprocess.TimeoutExpired("script", timeout)
+
+        with patch('shelfmark.core.config.config') as mock_config, \
+             patch('shelfmark.config.env.TMP_DIR', temp_dirs["staging"]), \
+             patch('subprocess.Popen') as mock_run:
+
+            mock_config.USE_BOOK_TITLE = False
+            mock_config.CUSTOM_SCRIPT = "/path/to/script.sh"
+            _sync_core_config(mock_config, mock_config)
+            mock_config.get = _mock_destination_config(temp_dirs["ingest"])
+            _sync_core_config(mock_config, mock_config)
+
+            process = mock_run.return_value
+            process.communicate.side_effect = still_running
+
+            result = _post_process_download(
+                temp_file=temp_file,
+                task=sample_direct_task,
+                cancel_flag=cancel_flag,
+                status_callback=status_cb,
+            )
+
+        assert result is None
+        assert process.communicate.call_count == 1
+        process.terminate.assert_called_once()
+        assert ("error", "Custom script timed out") not in [c.args for c in status_cb.call_args_list]
+
     def test_script_nonzero_exit_error(self, temp_dirs, sample_direct_task):
         """Returns error when script exits non-zero."""
         from shelfmark.download.postprocess.router import post_process_download as _post_process_download
@@ -904,7 +1157,7 @@ class TestCustomScriptExecution:
 
         with patch('shelfmark.core.config.config') as mock_config, \
              patch('shelfmark.config.env.TMP_DIR', temp_dirs["staging"]), \
-             patch('subprocess.run') as mock_run:
+             patch('subprocess.Popen') as mock_run:
 
             mock_config.USE_BOOK_TITLE = False
             mock_config.CUSTOM_SCRIPT = "/path/to/script.sh"
@@ -912,8 +1165,7 @@ class TestCustomScriptExecution:
             mock_config.get = _mock_destination_config(temp_dirs["ingest"])
             _sync_core_config(mock_config, mock_config)
 
-            error = subprocess.CalledProcessError(1, "script", stderr="Something failed")
-            mock_run.side_effect = error
+            mock_run.return_value = _mock_script_process(returncode=1, stderr=b"Something failed")
 
             result = _post_process_download(
                 temp_file=temp_file,
@@ -106,6 +106,93 @@ class TestStageFile:
 
         assert staged.name == "book_1.epub"
 
+    def test_copy_directory_uses_zero_copy(self, tmp_path):
+        """Directory copies go through the zero-copy data helper per file."""
+        from shelfmark.download import staging
+
+        source = tmp_path / "downloads" / "Audiobook"
+        (source / "disc1").mkdir(parents=True)
+        (source / "disc1" / "01.mp3").write_bytes(b"one")
+        (source / "02.mp3").write_bytes(b"two")
+
+        with patch.object(staging, "copy_file_data", wraps=staging.copy_file_data) as copy_file, \
+             patch("shutil.copystat", wraps=shutil.copystat) as copystat:
+            staged = staging.stage_path(source, tmp_path / "staging", staging.STAGE_COPY)
+
+        assert (staged / "disc1" / "01.mp3").read_bytes() == b"one"
+        assert (staged / "02.mp3").read_bytes() == b"two"
+        assert (source / "02.mp3").exists()
+        assert copy_file.call_count == 2
+        # Files take mode and times from the scandir stat; only directories use copystat.
+        assert copystat.call_count == 2
+
+    def test_copy_directory_preserves_mtimes(self, tmp_path):
+        """Parallel directory copies keep file and directory timestamps."""
+        from shelfmark.download import staging
+
+        source = tmp_path / "downloads" / "Audiobook"
+        source.mkdir(parents=True)
+        for i in range(5):
+            (source / f"{i:02d}.mp3").write_bytes(b"x" * i)
+            os.utime(source / f"{i:02d}.mp3", (1_000_000 + i, 1_000_000 + i))
+        os.utime(source, (2_000_000, 2_000_000))
+
+        staged = staging.stage_path(source, tmp_path / "staging", staging.STAGE_COPY)
+
+        assert sorted(p.name for p in staged.iterdir()) == [f"{i:02d}.mp3" for i in range(5)]
+        for i in range(5):
+            assert (staged / f"{i:02d}.mp3").stat().st_mtime == 1_000_000 + i
+            assert (staged / f"{i:02d}.mp3").stat().st_mode == (source / f"{i:02d}.mp3").stat().st_mode
+        assert staged.stat().st_mtime == 2_000_000
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires os.mkfifo")
+    def test_copy_directory_rejects_special_files(self, tmp_path):
+        """FIFOs and other special files raise instead of blocking on open."""
+        from shelfmark.download import staging
+
+        source = tmp_path / "downloads" / "Release"
+        source.mkdir(parents=True)
+        (source / "book.epub").write_bytes(b"content")
+        os.mkfifo(source / "pipe")
+
+        with patch.object(staging, "copy_file_data") as copy_file:
+            with pytest.raises(shutil.SpecialFileError):
+                staging.stage_path(source, tmp_path / "staging", staging.STAGE_COPY)
+
+        copy_file.assert_not_called()
+
+    def test_copy_directory_preserves_xattrs(self, tmp_path):
+        """Extended attributes are copied along with file data, as with copy2."""
+        from shelfmark.download import staging
+
+        source = tmp_path / "downloads" / "Release"
+        source.mkdir(parents=True)
+        book = source / "book.epub"
+        book.write_bytes(b"content")
+        try:
+            os.setxattr(book, "user.shelfmark", b"tagged")
+        except (AttributeError, OSError):
+            pytest.skip("user xattrs not supported here")
+
+        staged = staging.stage_path(source, tmp_path / "staging", staging.STAGE_COPY)
+
+        assert os.getxattr(staged / "book.epub", "user.shelfmark") == b"tagged"
+
+    def test_move_directory_across_filesystems(self, tmp_path):
+        """EXDEV from rename falls back to copy + delete."""
+        import errno
+        from shelfmark.download import staging
+
+        source = tmp_path / "downloads" / "Release"
+        source.mkdir(parents=True)
+        (source / "book.epub").write_bytes(b"content")
+
+        with patch.object(staging.os, "rename", side_effect=OSError(errno.EXDEV, "Cross-device link")):
+            staged = staging.stage_path(source, tmp_path / "staging", staging.STAGE_MOVE)
+
+        assert (staged / "book.epub").read_bytes() == b"content"
+        assert not source.exists()
+
 
 class TestSameFilesystem:
     """Tests for same_filesystem() detection."""
@@ -149,6 +236,35 @@ class TestSameFilesystem:
 
         assert same_filesystem(str(file1), str(tmp_path)) is True
 
+    def test_repeated_checks_reuse_device_lookup(self, tmp_path):
+        """Devices of already-checked paths are not stat'ed again."""
+        dir1 = tmp_path / "dir1"
+        dir1.mkdir()
+
+        assert same_filesystem(dir1, tmp_path) is True
+        with patch('os.stat', side_effect=AssertionError("unexpected stat")):
+            assert same_filesystem(dir1, tmp_path) is True
+
+    def test_device_lookup_refreshed_after_config_change(self, tmp_path):
+        """A config bump drops cached devices, e.g. after a path is remounted."""
+        from shelfmark.core.settings_registry import bump_config_version
+
+        dir1 = tmp_path / "dir1"
+        dir1.mkdir()
+        real_stat = os.stat
+
+        assert same_filesystem(dir1, tmp_path) is True
+
+        def remounted_stat(path, *args, **kwargs):
+            result = real_stat(path, *args, **kwargs)
+            if str(path) == str(dir1):
+                return MagicMock(st_dev=result.st_dev + 1)
+            return result
+
+        bump_config_version()
+        with patch('os.stat', side_effect=remounted_stat):
+            assert same_filesystem(dir1, tmp_path) is False
+
     def test_permission_error_returns_false(self, tmp_path):
         """Returns False when permission denied (safe fallback)."""
         with patch('os.stat', side_effect=PermissionError("denied")):
@@ -336,7 +452,7 @@ class TestAtomicMove:
 
         with patch("shelfmark.download.fs.shutil.copy2", side_effect=PermissionError("no")) as mock_copy, \
              patch("shelfmark.download.fs._perform_nfs_fallback", side_effect=_fallback_copy) as mock_fallback:
-            result = _atomic_move(source, dest)
+            result = _atomic_move(source, dest, prefer_zero_copy=False)
 
         assert result == dest
         assert not source.exists()
@@ -445,6 +561,34 @@ class TestHardlinkWithLibraryMode:
         assert not source.exists()
         status_cb.assert_called_with("complete", "Complete")
 
+    def test_transfer_file_honors_prefer_zero_copy_setting(self, tmp_path, sample_task):
+        """Disabling PREFER_ZERO_COPY reaches the library transfer."""
+        import shelfmark.core.config as core_config
+        from shelfmark.download.postprocess import transfer
+        from shelfmark.download.postprocess.pipeline import transfer_file_to_library
+
+        library = tmp_path / "library"
+        library.mkdir()
+        source = tmp_path / "staging" / "book.epub"
+        source.parent.mkdir()
+        source.write_bytes(b"epub content")
+        values = {"PREFER_ZERO_COPY": False}
+
+        with patch.object(core_config.config, "get", side_effect=lambda key, default=None: values.get(key, default)), \
+             patch.object(transfer, "atomic_move", wraps=transfer.atomic_move) as move:
+            transfer_file_to_library(
+                source_path=source,
+                library_base=str(library),
+                template="{Author}/{Title}",
+                metadata={"Author": "Brandon Sanderson", "Title": "Mistborn"},
+                task=sample_task,
+                temp_file=source,
+                status_callback=MagicMock(),
+                use_hardlink=False,
+            )
+
+        assert move.call_args.kwargs["prefer_zero_copy"] is False
+
     def test_transfer_directory_hardlink_multifile(self, tmp_path, sample_task):
         """Directory with multiple files transferred via hardlinks."""
         from shelfmark.download.postprocess.pipeline import transfer_directory_to_library
@@ -502,6 +646,45 @@ class TestHardlinkWithLibraryMode:
         # Temp dir should be cleaned up
         assert not temp_dir.exists()
 
+    def test_transfer_directory_creates_part_folder_once(self, tmp_path, sample_task):
+        """Parts landing in the same folder create it with a single mkdir."""
+        from shelfmark.download.postprocess.pipeline import transfer_directory_to_library
+
+        library = tmp_path / "library"
+        # Existing author folder, so mkdir(parents=True) doesn't recurse
+        (library / "Brandon Sanderson").mkdir(parents=True)
+        source_dir = tmp_path / "staging" / "audiobook"
+        source_dir.mkdir(parents=True)
+        for i in range(1, 6):
+            (source_dir / f"Part {i}.mp3").write_bytes(b"audio")
+
+        sample_task.content_type = "audiobook"
+        real_mkdir = Path.mkdir
+        created = []
+
+        def tracking_mkdir(self, *args, **kwargs):
+            created.append(self)
+            return real_mkdir(self, *args, **kwargs)
+
+        with patch('shelfmark.download.postprocess.scan.get_supported_formats', return_value=["mp3"]), \
+             patch('shelfmark.config.env.TMP_DIR', source_dir.parent), \
+             patch.object(Path, "mkdir", tracking_mkdir):
+            result = transfer_directory_to_library(
+                source_dir=source_dir,
+                library_base=str(library),
+                template="{Author}/{Title}/{Title}{ - PartNumber}",
+                metadata={"Author": "Brandon Sanderson", "Title": "The Way of Kings"},
+                task=sample_task,
+                temp_file=source_dir,
+                status_callback=MagicMock(),
+                use_hardlink=False,
+            )
+
+        assert result is not None
+        book_dir = library / "Brandon Sanderson" / "The Way of Kings"
+        assert len(list(book_dir.glob("*.mp3"))) == 5
+        assert created.count(book_dir) == 1
+
     def test_transfer_directory_move(self, tmp_path, sample_task):
         """Directory transferred via move (non-torrent)."""
         from shelfmark.download.postprocess.pipeline import transfer_directory_to_library
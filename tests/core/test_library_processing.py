@@ -146,6 +146,14 @@ class TestContentTypeDetection:
 
         assert not is_audiobook(task.content_type)
 
+    def test_task_is_audiobook_follows_content_type(self):
+        """DownloadTask.is_audiobook reflects the current content_type."""
+        task = DownloadTask(task_id="test-4", source="prowlarr", title="Dune", content_type="book (fiction)")
+        assert task.is_audiobook is False
+
+        task.content_type = "audiobook"
+        assert task.is_audiobook is True
+
 
 class TestLibraryPathBuilding:
     """Test library path construction for different content types."""
@@ -4,9 +4,7 @@ Tests for the naming module - template parsing and library path building.
 
 import pytest
 from pathlib import Path
-import tempfile
 import os
-import shutil
 
 from shelfmark.core.naming import (
     natural_sort_key,
@@ -16,6 +14,7 @@ from shelfmark.core.naming import (
     sanitize_filename,
     sanitize_path_component,
     format_series_position,
+    normalize_metadata,
 )
 
 
@@ -31,6 +30,12 @@ class TestNaturalSortAndAssignment:
             "CD1_Track2.mp3", "CD1_Track10.mp3", "CD2_Track1.mp3", "CD2_Track10.mp3"
         ]
 
+    def test_natural_sort_long_numbers(self):
+        files = ["Disc 20240102.mp3", "Disc 1000000000.mp3", "Disc 9.mp3"]
+        assert sorted(files, key=natural_sort_key) == [
+            "Disc 9.mp3", "Disc 20240102.mp3", "Disc 1000000000.mp3"
+        ]
+
     def test_assign_part_numbers_empty(self):
         assert assign_part_numbers([]) == []
 
@@ -184,10 +189,30 @@ class TestParseNamingTemplate:
         assert ":" not in result
         assert "?" not in result
 
+    def test_values_sanitized_individually(self):
+        """Test that each value is trimmed on its own while literals are kept."""
+        result = parse_naming_template(
+            "{Author}/{Vol. SeriesPosition - }{Title}",
+            {"Author": "Smith Jr.", "SeriesPosition": 2, "Title": "What?"}
+        )
+        assert result == "Smith Jr/Vol. 2 - What"
+
     def test_empty_template(self):
         """Test empty template."""
         assert parse_naming_template("", {"Title": "Book"}) == ""
 
+    def test_template_without_tokens(self):
+        """Test that a literal template is returned cleaned up."""
+        assert parse_naming_template("Unsorted/ Books - ", {"Title": "Book"}) == "Unsorted/ Books"
+
+    def test_literal_template_skips_compile(self):
+        """Test that a template without braces is not compiled or cached."""
+        from shelfmark.core.naming import _compile_template
+
+        _compile_template.cache_clear()
+        assert parse_naming_template("Unsorted//Books/", {"Title": "Book"}) == "Unsorted/Books"
+        assert _compile_template.cache_info().currsize == 0
+
     def test_empty_metadata(self):
         """Test with no metadata values."""
         result = parse_naming_template("{Author}/{Title}", {})
@@ -215,6 +240,67 @@ class TestParseNamingTemplate:
         })
         assert result == "Brandon Sanderson/The Way of Kings"
 
+    def test_repeated_dash_separators_collapsed(self):
+        """Test that empty tokens between dashes collapse to a single separator."""
+        result = parse_naming_template(
+            "{Title} - {Subtitle} - {Year}",
+            {"Title": "Book", "Year": 2010}
+        )
+        assert result == "Book - 2010"
+
+    def test_empty_brackets_removed(self):
+        """Test that brackets around empty tokens are dropped."""
+        result = parse_naming_template(
+            "{Title} ({Year}) [{Series}]",
+            {"Title": "Book"}
+        )
+        assert result == "Book"
+
+    def test_orphaned_slashes_and_separators_trimmed(self):
+        """Test that leftover slashes and separators are trimmed."""
+        result = parse_naming_template(
+            "/{Author}//{Series}/{Title} - {Year}/",
+            {"Author": "Sanderson", "Title": "Book"}
+        )
+        assert result == "Sanderson/Book"
+
+    def test_template_reused_across_metadata(self):
+        """Test that rendering the same template repeatedly uses fresh values."""
+        template = "{Author}/{Series/}{Title}"
+
+        first = parse_naming_template(template, {"Author": "A", "Series": "S", "Title": "One"})
+        second = parse_naming_template(template, {"Author": "B", "Title": "Two"})
+
+        assert first == "A/S/One"
+        assert second == "B/Two"
+
+    def test_template_compiled_once(self):
+        """Test that repeated renders reuse the compiled template."""
+        from shelfmark.core.naming import _compile_template
+
+        _compile_template.cache_clear()
+        template = "{Author}/{Vol. SeriesPosition - }{Title}"
+        for title in ("One", "Two", "Three"):
+            parse_naming_template(template, {"Author": "A", "Title": title})
+
+        info = _compile_template.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
+    def test_normalize_metadata_keeps_only_token_keys(self):
+        """Test that metadata keys are lowercased and unknown keys dropped."""
+        normalized = normalize_metadata({"Title": "Book", "AUTHOR": "A", "Narrator": "N"})
+        assert normalized == {"title": "Book", "author": "A"}
+
+    def test_prenormalized_metadata_used(self):
+        """Test that a caller-supplied normalized view takes precedence."""
+        result = parse_naming_template(
+            "{Author}/{Title}",
+            {},
+            normalized={"author": "Sanderson", "title": "Book"}
+        )
+        assert result == "Sanderson/Book"
+
 
 class TestArbitraryPrefixSuffix:
     """Tests for enhanced template syntax with arbitrary prefix/suffix text."""
@@ -332,6 +418,15 @@ class TestArbitraryPrefixSuffix:
         )
         assert result == "1 - Stormlight"
 
+    def test_block_with_several_tokens_uses_token_priority(self):
+        """Test that a block naming several tokens resolves by token priority, not position."""
+        result = parse_naming_template(
+            "{Title - Author}",
+            {"Title": "Mistborn", "Author": "Sanderson"}
+        )
+        # "author" ranks ahead of "title"; the rest of the block is literal text
+        assert result == "Title - Sanderson"
+
     def test_arbitrary_prefix_float_position(self):
         """Test arbitrary prefix with float series position."""
         result = parse_naming_template(
@@ -406,6 +501,16 @@ class TestBuildLibraryPath:
         )
         assert path == Path("/books/etc/passwd.txt")
 
+    def test_dot_segments_normalized(self):
+        """Test that '.' segments in the template don't leak into the path."""
+        path = build_library_path(
+            "/books",
+            "{Author}/./{Title}",
+            {"Author": "Sanderson", "Title": "Book"},
+            extension="epub"
+        )
+        assert path == Path("/books/Sanderson/Book.epub")
+
     def test_fallback_to_title(self):
         """Test fallback when template produces empty result."""
         path = build_library_path(
@@ -439,6 +544,8 @@ class TestSanitizeFilename:
         ("file<with>angles", "file_with_angles"),
         ("file|with|pipes", "file_with_pipes"),
         ("file/with/slash", "file_with_slash"),
+        ("file\\with\\backslash", "file_with_backslash"),
+        ('a:*?"<>|/\\b', "a_b"),
     ])
     def test_invalid_chars_replaced(self, input_name, expected):
         """Test that invalid characters are replaced."""
@@ -488,6 +595,11 @@ class TestFormatSeriesPosition:
         """Test None handling."""
         assert format_series_position(None) == ""
 
+    def test_string_position_passed_through(self):
+        """Test that string positions are kept verbatim, not reparsed."""
+        assert format_series_position("1.50") == "1.50"
+        assert format_series_position("2a") == "2a"
+
 
 class TestIntegration:
     """Integration tests for complete library path workflows."""
@@ -557,11 +669,9 @@ class TestFilesystemOperations:
     """Tests for actual filesystem operations - folder creation and file handling."""
 
     @pytest.fixture
-    def temp_library(self):
+    def temp_library(self, tmp_path):
         """Create a temporary library directory."""
-        temp_dir = tempfile.mkdtemp(prefix="test_library_")
-        yield Path(temp_dir)
-        shutil.rmtree(temp_dir, ignore_errors=True)
+        return tmp_path
 
     def test_creates_new_folder_structure(self, temp_library):
         """Test that new folder structure is created correctly."""
@@ -584,7 +694,7 @@ class TestFilesystemOperations:
         author_dir = temp_library / "Brandon Sanderson"
         author_dir.mkdir(parents=True)
         existing_book = author_dir / "Elantris.epub"
-        existing_book.write_text("existing book content")
+        existing_book.touch()
 
         # Add a new book to the same author folder
         metadata = {"Author": "Brandon Sanderson", "Title": "Mistborn"}
@@ -592,7 +702,7 @@ class TestFilesystemOperations:
 
         path = build_library_path(str(temp_library), template, metadata, extension="epub")
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text("new book content")
+        path.touch()
 
         # Both books should exist
         assert existing_book.exists()
@@ -615,7 +725,7 @@ class TestFilesystemOperations:
             file_metadata = {**base_metadata, "PartNumber": part_num}
             path = build_library_path(str(temp_library), template, file_metadata, extension="mp3")
             path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text(f"part {part_num} content")
+            path.touch()
             created_files.append(path)
 
         # All files should exist in the same folder
@@ -638,7 +748,7 @@ class TestFilesystemOperations:
 
         path = build_library_path(str(temp_library), template, metadata, extension="epub")
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text("content")
+        path.touch()
 
         assert path.exists()
         # Check the nested structure
@@ -655,7 +765,7 @@ class TestFilesystemOperations:
         path.parent.mkdir(parents=True, exist_ok=True)
 
         # Create first file
-        path.write_text("original content")
+        path.touch()
         assert path.exists()
 
         # Build same path again - path building should still work
@@ -675,7 +785,7 @@ class TestFilesystemOperations:
 
         path = build_library_path(str(temp_library), template, metadata, extension="epub")
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text("content")
+        path.touch()
 
         assert path.exists()
         # Verify no invalid characters in path
@@ -694,7 +804,7 @@ class TestFilesystemOperations:
 
         path = build_library_path(str(temp_library), template, metadata, extension="epub")
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text("content")
+        path.touch()
 
         # Should be Author/Title.epub, not Author//Title.epub or Author/None/Title.epub
         assert path.exists()
@@ -711,7 +821,7 @@ class TestFilesystemOperations:
 
         path = build_library_path(str(temp_library), template, metadata, extension="epub")
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text("content")
+        path.touch()
 
         assert path.exists()
         assert "Андрей Сапковский" in str(path)
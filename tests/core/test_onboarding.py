@@ -0,0 +1,197 @@
+"""
+Tests for onboarding status and settings persistence.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+import shelfmark.core.onboarding as onboarding
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    with patch("shelfmark.config.env.CONFIG_DIR", tmp_path):
+        onboarding._onboarding_status_cache = None
+        onboarding.clear_onboarding_cache()
+        yield tmp_path
+        onboarding._onboarding_status_cache = None
+        onboarding.clear_onboarding_cache()
+
+
+class TestOnboardingStatus:
+
+    def test_missing_settings_file(self, config_dir):
+        assert onboarding.is_onboarding_complete() is False
+
+    def test_mark_complete(self, config_dir):
+        assert onboarding.is_onboarding_complete() is False
+        (config_dir / "settings.json").write_text("{}")
+        assert onboarding.is_onboarding_complete() is False
+
+        assert onboarding.mark_onboarding_complete() is True
+        assert onboarding.is_onboarding_complete() is True
+
+    def test_repeated_checks_parse_once(self, config_dir):
+        (config_dir / "settings.json").write_text(json.dumps({"onboarding_complete": True}))
+
+        with patch("shelfmark.core.onboarding.json.load", wraps=json.load) as load:
+            assert onboarding.is_onboarding_complete() is True
+            assert onboarding.is_onboarding_complete() is True
+
+        assert load.call_count == 1
+
+    def test_external_change_detected(self, config_dir):
+        settings_file = config_dir / "settings.json"
+        settings_file.write_text(json.dumps({"onboarding_complete": True}))
+        assert onboarding.is_onboarding_complete() is True
+
+        settings_file.write_text(json.dumps({"onboarding_complete": False, "other": 1}))
+        assert onboarding.is_onboarding_complete() is False
+
+    def test_invalid_json(self, config_dir):
+        (config_dir / "settings.json").write_text("{not json")
+        assert onboarding.is_onboarding_complete() is False
+
+
+class TestOnboardingSteps:
+
+    @pytest.fixture(autouse=True)
+    def fresh_step_cache(self):
+        onboarding.clear_onboarding_cache()
+        yield
+        onboarding.clear_onboarding_cache()
+
+    def test_step_fields_built_once(self, config_dir):
+        calls = []
+
+        def get_fields():
+            calls.append(1)
+            return []
+
+        with patch.dict(onboarding.ONBOARDING_STEPS[0], {"get_fields": get_fields}):
+            onboarding.get_onboarding_config()
+            onboarding.get_onboarding_config()
+
+        assert len(calls) == 1
+
+    def test_config_reused_until_settings_saved(self, config_dir):
+        import shelfmark.config.settings  # noqa: F401 - registers the core tabs
+        from shelfmark.core.settings_registry import save_config_file
+
+        with patch("shelfmark.core.onboarding.serialize_field", wraps=onboarding.serialize_field) as serialize:
+            first = onboarding.get_onboarding_config()
+            calls_after_first = serialize.call_count
+            second = onboarding.get_onboarding_config()
+            assert serialize.call_count == calls_after_first
+
+            save_config_file("search_mode", {"SEARCH_MODE": "universal"})
+            third = onboarding.get_onboarding_config()
+            assert serialize.call_count > calls_after_first
+
+        assert second["values"] == first["values"]
+        assert third["values"]["SEARCH_MODE"] == "universal"
+
+    def test_cache_hit_returns_shared_steps(self, config_dir):
+        first = onboarding.get_onboarding_config()
+        second = onboarding.get_onboarding_config()
+
+        assert second is not first
+        assert second["steps"] is first["steps"]
+        assert second["values"] is first["values"]
+
+    def test_config_rebuilt_after_ttl(self, config_dir):
+        with patch("shelfmark.core.onboarding.serialize_field", wraps=onboarding.serialize_field) as serialize, \
+             patch("shelfmark.core.onboarding.time.monotonic", return_value=1000.0) as now:
+            onboarding.get_onboarding_config()
+            calls_after_first = serialize.call_count
+
+            now.return_value = 1000.0 + onboarding._ONBOARDING_CONFIG_TTL + 1
+            onboarding.get_onboarding_config()
+
+        assert serialize.call_count > calls_after_first
+
+    def test_complete_flag_always_fresh(self, config_dir):
+        assert onboarding.get_onboarding_config()["complete"] is False
+        onboarding.mark_onboarding_complete()
+        assert onboarding.get_onboarding_config()["complete"] is True
+
+    def test_step_fields_rebuilt_after_registration(self):
+        with patch("shelfmark.core.onboarding.get_registry_version", return_value=1):
+            before = onboarding._fields_for_step("search_mode")
+        with patch("shelfmark.core.onboarding.get_registry_version", return_value=2):
+            after = onboarding._fields_for_step("search_mode")
+
+        assert after == before
+        assert after is not before
+
+
+class TestFieldLookup:
+
+    def test_tab_indexes_fields_by_key(self):
+        from shelfmark.core.settings_registry import HeadingField, SettingsTab, TextField
+
+        first = TextField(key="API_KEY", label="API key")
+        duplicate = TextField(key="API_KEY", label="Other")
+        heading = HeadingField(key="intro", title="Intro")
+        tab = SettingsTab(name="example", display_name="Example", fields=[heading, first, duplicate])
+
+        assert tab.fields_by_key == {"intro": heading, "API_KEY": first}
+
+    def test_get_field_from_tab(self):
+        import shelfmark.config.settings  # noqa: F401 - registers the core tabs
+
+        field = onboarding._get_field_from_tab("search_mode", "SEARCH_MODE")
+        assert field is not None
+        assert field.key == "SEARCH_MODE"
+
+        assert onboarding._get_field_from_tab("search_mode", "MISSING") is None
+        assert onboarding._get_field_from_tab("missing_tab", "SEARCH_MODE") is None
+
+
+class TestSaveOnboardingSettings:
+
+    def test_each_config_file_written_once(self, config_dir):
+        import shelfmark.config.settings  # noqa: F401 - registers the core tabs
+
+        values = {
+            "SEARCH_MODE": "universal",
+            "METADATA_PROVIDER": "hardcover",
+            "HARDCOVER_API_KEY": "secret",
+        }
+
+        with patch("shelfmark.core.config.config.refresh"), \
+             patch("shelfmark.core.settings_registry.json.dump", wraps=json.dump) as dump:
+            result = onboarding.save_onboarding_settings(values)
+
+        assert result["success"] is True
+        # settings.json (search_mode + general) and plugins/hardcover.json
+        assert dump.call_count == 2
+
+        settings = json.loads((config_dir / "settings.json").read_text())
+        assert settings["SEARCH_MODE"] == "universal"
+        assert settings["METADATA_PROVIDER"] == "hardcover"
+        assert settings["onboarding_complete"] is True
+
+        hardcover = json.loads((config_dir / "plugins" / "hardcover.json").read_text())
+        assert hardcover == {"HARDCOVER_ENABLED": True, "HARDCOVER_API_KEY": "secret"}
+
+        assert onboarding.is_onboarding_complete() is True
+
+    def test_values_routed_by_field_key(self, config_dir):
+        import shelfmark.config.settings  # noqa: F401 - registers the core tabs
+
+        with patch("shelfmark.core.config.config.refresh"):
+            result = onboarding.save_onboarding_settings({
+                "SEARCH_MODE": "direct",
+                "welcome_heading": "ignored",
+                "NOT_AN_ONBOARDING_FIELD": "ignored",
+            })
+
+        assert result["success"] is True
+        settings = json.loads((config_dir / "settings.json").read_text())
+        assert settings["SEARCH_MODE"] == "direct"
+        assert "welcome_heading" not in settings
+        assert "NOT_AN_ONBOARDING_FIELD" not in settings
+        assert not (config_dir / "plugins").exists()
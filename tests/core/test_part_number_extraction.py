@@ -2,6 +2,9 @@
 
 import pytest
 from pathlib import Path
+from unittest.mock import patch
+
+from shelfmark.core import naming
 from shelfmark.core.naming import natural_sort_key, assign_part_numbers
 
 
@@ -73,6 +76,17 @@ class TestAssignPartNumbers:
         assert result[0] == (Path("track_1.mp3"), "001")
         assert result[-1] == (Path("track_100.mp3"), "100")
 
+    def test_sort_key_built_once_per_file(self):
+        files = [Path(f"track_{i}.mp3") for i in range(50, 0, -1)]
+        with patch.object(naming, "natural_sort_key", wraps=natural_sort_key) as key:
+            assign_part_numbers(files)
+        assert key.call_count == len(files)
+
+    def test_equal_keys_keep_input_order(self):
+        files = [Path("/dir2/Track 1.mp3"), Path("/dir1/track 1.mp3")]
+        result = assign_part_numbers(files)
+        assert [r[0] for r in result] == files
+
 
 class TestRealWorldScenarios:
 
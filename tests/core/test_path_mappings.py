@@ -0,0 +1,133 @@
+"""
+Tests for remote path mapping parsing and remapping.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from shelfmark.core.path_mappings import (
+    RemotePathMapping,
+    RemotePathMappingIndex,
+    parse_remote_path_mappings,
+    remap_remote_to_local,
+    remap_remote_to_local_with_match,
+)
+
+
+class TestRemotePathMapping:
+
+    def test_fields_normalized_on_construction(self):
+        mapping = RemotePathMapping(
+            host="  QBittorrent ",
+            remote_path="D:\\Torrents\\",
+            local_path="/data/torrents/",
+        )
+        assert mapping.host == "qbittorrent"
+        assert mapping.remote_path == "D:/Torrents"
+        assert mapping.local_path == "/data/torrents"
+
+    def test_root_prefix_kept(self):
+        mapping = RemotePathMapping(host="sab", remote_path="/", local_path="/mnt")
+        assert mapping.remote_path == "/"
+
+
+class TestParseRemotePathMappings:
+
+    def test_invalid_rows_skipped(self):
+        mappings = parse_remote_path_mappings([
+            {"host": "qbittorrent", "remotePath": "/downloads", "localPath": "/data"},
+            {"host": "", "remotePath": "/downloads", "localPath": "/data"},
+            {"host": "sabnzbd", "remotePath": "  ", "localPath": "/data"},
+            "not-a-row",
+        ])
+        assert mappings == [
+            RemotePathMapping(host="qbittorrent", remote_path="/downloads", local_path="/data")
+        ]
+
+    def test_longest_remote_path_first(self):
+        mappings = parse_remote_path_mappings([
+            {"host": "qbittorrent", "remotePath": "/downloads", "localPath": "/data"},
+            {"host": "qbittorrent", "remotePath": "/downloads/books", "localPath": "/books"},
+        ])
+        assert [m.remote_path for m in mappings] == ["/downloads/books", "/downloads"]
+
+    def test_non_list_value(self):
+        assert parse_remote_path_mappings(None) == []
+        assert parse_remote_path_mappings({"host": "qbittorrent"}) == []
+
+
+class TestRemapRemoteToLocal:
+    """Remapping behaves the same with a plain mapping list or a prefix index."""
+
+    @pytest.fixture(params=["list", "index"])
+    def mappings(self, request):
+        mappings = parse_remote_path_mappings([
+            {"host": "qbittorrent", "remotePath": "/downloads", "localPath": "/data"},
+            {"host": "qbittorrent", "remotePath": "/downloads/books", "localPath": "/books"},
+            {"host": "sabnzbd", "remotePath": "D:\\Usenet", "localPath": "/usenet"},
+        ])
+        if request.param == "index":
+            return RemotePathMappingIndex(mappings)
+        return mappings
+
+    def test_most_specific_prefix_wins(self, mappings):
+        remapped = remap_remote_to_local(
+            mappings=mappings,
+            host="qbittorrent",
+            remote_path="/downloads/books/Title/book.epub",
+        )
+        assert remapped == Path("/books/Title/book.epub")
+
+    def test_exact_prefix_match(self, mappings):
+        remapped = remap_remote_to_local(
+            mappings=mappings,
+            host="QBittorrent",
+            remote_path="/downloads/",
+        )
+        assert remapped == Path("/data")
+
+    def test_partial_segment_not_matched(self, mappings):
+        remapped, matched = remap_remote_to_local_with_match(
+            mappings=mappings,
+            host="qbittorrent",
+            remote_path="/downloads-other/book.epub",
+        )
+        assert matched is False
+        assert remapped == Path("/downloads-other/book.epub")
+
+    def test_other_host_not_matched(self, mappings):
+        remapped, matched = remap_remote_to_local_with_match(
+            mappings=mappings,
+            host="transmission",
+            remote_path="/downloads/book.epub",
+        )
+        assert matched is False
+        assert remapped == Path("/downloads/book.epub")
+
+    def test_windows_path_case_insensitive(self, mappings):
+        remapped = remap_remote_to_local(
+            mappings=mappings,
+            host="sabnzbd",
+            remote_path="d:\\usenet\\Complete\\Book",
+        )
+        assert remapped == Path("/usenet/Complete/Book")
+
+
+class TestRemotePathMappingIndex:
+
+    def test_deepest_prefix_wins_regardless_of_order(self):
+        index = RemotePathMappingIndex([
+            RemotePathMapping(host="qbittorrent", remote_path="/downloads", local_path="/data"),
+            RemotePathMapping(host="qbittorrent", remote_path="/downloads/books", local_path="/books"),
+        ])
+        mapping = index.find("qbittorrent", "/downloads/books/Title")
+        assert mapping is not None
+        assert mapping.local_path == "/books"
+
+    def test_no_match(self):
+        index = RemotePathMappingIndex([
+            RemotePathMapping(host="qbittorrent", remote_path="/downloads", local_path="/data"),
+        ])
+        assert index.find("qbittorrent", "/other/file") is None
+        assert index.find("sabnzbd", "/downloads/file") is None
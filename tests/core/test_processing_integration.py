@@ -787,12 +787,13 @@ def test_custom_script_external_source_stages_copy_and_preserves_source(tmp_path
 
     with patch("shelfmark.core.config.config") as mock_config, \
          patch("shelfmark.config.env.TMP_DIR", staging), \
-         patch("subprocess.run") as mock_run:
+         patch("subprocess.Popen") as mock_run:
         mock_config.get = _build_config(ingest, organization="none")
         mock_config.CUSTOM_SCRIPT = "/path/to/script.sh"
         _sync_config(mock_config, mock_config)
 
-        mock_run.return_value = MagicMock(stdout="", returncode=0)
+        mock_run.return_value.communicate.return_value = (b"", b"")
+        mock_run.return_value.returncode = 0
 
         result = _post_process_download(original, task, Event(), lambda *_args: None)
 
@@ -814,6 +815,54 @@ def test_custom_script_external_source_stages_copy_and_preserves_source(tmp_path
 
 
 
+def test_staging_cleaned_before_complete_status(tmp_path):
+    """The complete status is only reported once staged files are gone."""
+
+    from shelfmark.download.postprocess.router import post_process_download as _post_process_download
+
+    downloads = tmp_path / "downloads"
+    staging = tmp_path / "staging"
+    ingest = tmp_path / "ingest"
+    downloads.mkdir()
+    staging.mkdir()
+    ingest.mkdir()
+
+    original = downloads / "Seed.epub"
+    original.write_text("content")
+
+    task = DownloadTask(
+        task_id="usenet-complete-order",
+        source="prowlarr",
+        title="Seed",
+        author="Seeder",
+        format="epub",
+        search_mode=SearchMode.UNIVERSAL,
+        original_download_path=None,
+    )
+
+    staged_at_complete = []
+
+    def status_cb(status, message=None):
+        if status == "complete":
+            staged_at_complete.extend(staging.iterdir())
+
+    with patch("shelfmark.core.config.config") as mock_config, \
+         patch("shelfmark.config.env.TMP_DIR", staging), \
+         patch("subprocess.Popen") as mock_run:
+        mock_config.get = _build_config(ingest, organization="none")
+        mock_config.CUSTOM_SCRIPT = "/path/to/script.sh"
+        _sync_config(mock_config, mock_config)
+
+        mock_run.return_value.communicate.return_value = (b"", b"")
+        mock_run.return_value.returncode = 0
+
+        result = _post_process_download(original, task, Event(), status_cb)
+
+    assert result is not None
+    assert staged_at_complete == []
+    assert list(staging.iterdir()) == []
+
+
 @pytest.mark.parametrize("content_kind", ["book", "audiobook"])
 
 def test_external_directory_multiple_archives_extracts_all_and_keeps_source(tmp_path, content_kind: str):
@@ -77,6 +77,19 @@ class TestGetProtocol:
         assert get_protocol({"protocol": "Usenet"}) == "usenet"
         assert get_protocol({"protocol": "USENET"}) == "usenet"
 
+    def test_preferred_url_with_resolved_protocol(self):
+        """A resolved protocol gives the same URL as reading it from the result."""
+        from shelfmark.release_sources.prowlarr.utils import get_preferred_download_url
+
+        results = [
+            {"protocol": "torrent", "magnetUrl": "magnet:?xt=urn:btih:abc", "downloadUrl": "http://p/1"},
+            {"protocol": "usenet", "magnetUrl": "", "downloadUrl": "http://p/2.nzb"},
+            {"magnetUrl": "magnet:?xt=urn:btih:def", "downloadUrl": "http://p/3.torrent"},
+            {"downloadUrl": "http://p/4.nzb"},
+        ]
+        for result in results:
+            assert get_preferred_download_url(result, get_protocol(result)) == get_preferred_download_url(result)
+
 
 class TestProwlarrHandlerDownloadErrors:
     """Tests for error handling in ProwlarrHandler.download()."""
@@ -554,6 +567,79 @@ class TestProwlarrHandlerPolling:
                 assert poll_count[0] >= 3
                 assert len(recorder.progress_values) >= 3
 
+    def test_backs_off_while_stalled(self):
+        """Poll delay doubles while nothing changes and resets on progress."""
+        statuses = [
+            DownloadStatus(progress=10, state=DownloadState.DOWNLOADING, message=None, complete=False, file_path=None),
+            DownloadStatus(progress=10, state=DownloadState.DOWNLOADING, message=None, complete=False, file_path=None),
+            DownloadStatus(progress=10, state=DownloadState.DOWNLOADING, message=None, complete=False, file_path=None),
+            DownloadStatus(progress=10, state=DownloadState.DOWNLOADING, message=None, complete=False, file_path=None),
+            DownloadStatus(progress=20, state=DownloadState.DOWNLOADING, message=None, complete=False, file_path=None),
+        ]
+        mock_client = MagicMock()
+        mock_client.name = "test_client"
+        mock_client.get_status.side_effect = statuses
+
+        cancel_flag = MagicMock()
+        cancel_flag.is_set.return_value = False
+        delays = []
+
+        def wait(timeout):
+            delays.append(timeout)
+            if len(delays) == len(statuses):
+                cancel_flag.is_set.return_value = True
+                return True
+            return False
+
+        cancel_flag.wait.side_effect = wait
+        recorder = ProgressRecorder()
+
+        with patch("shelfmark.release_sources.prowlarr.handler.POLL_INTERVAL", 1), \
+             patch("shelfmark.release_sources.prowlarr.handler.MAX_POLL_INTERVAL", 4):
+            result = ProwlarrHandler()._poll_and_complete(
+                client=mock_client,
+                download_id="download_id",
+                protocol="torrent",
+                task=DownloadTask(task_id="backoff-test", source="prowlarr", title="Test Book"),
+                cancel_flag=cancel_flag,
+                progress_callback=recorder.progress_callback,
+                status_callback=recorder.status_callback,
+            )
+
+        assert result is None
+        assert delays == [1, 2, 4, 4, 1]
+        # Cancellation is read from wait(); the flag is only checked before the first poll.
+        assert cancel_flag.is_set.call_count == 1
+        assert recorder.last_status == "cancelled"
+
+    def test_completed_path_checked_once(self):
+        """The completed download path is stat'ed once, not again for logging."""
+        mock_client = MagicMock()
+        mock_client.name = "test_client"
+        mock_client.get_status.return_value = DownloadStatus(
+            progress=100,
+            state=DownloadState.COMPLETE,
+            message="Complete",
+            complete=True,
+            file_path="/downloads/book.epub",
+        )
+        mock_client.get_download_path.return_value = "/downloads/book.epub"
+
+        with patch("shelfmark.release_sources.prowlarr.handler.remove_release"), \
+             patch.object(Path, "exists", autospec=True, return_value=True) as exists:
+            result = ProwlarrHandler()._poll_and_complete(
+                client=mock_client,
+                download_id="download_id",
+                protocol="usenet",
+                task=DownloadTask(task_id="stat-test", source="prowlarr", title="Test Book"),
+                cancel_flag=Event(),
+                progress_callback=lambda progress: None,
+                status_callback=lambda status, message: None,
+            )
+
+        assert result == "/downloads/book.epub"
+        assert exists.call_count == 1
+
     def test_handles_error_during_download(self):
         """Test that handler handles error state during download."""
         mock_client = MagicMock()
@@ -655,6 +741,120 @@ class TestProwlarrHandlerCancellation:
             assert "cancelled" in recorder.statuses
             mock_client.remove.assert_not_called()
 
+    def test_cancel_interrupts_poll_wait_immediately(self):
+        """Setting cancel_flag wakes the poll wait; removal doesn't wait for the next poll."""
+        import threading
+        import time
+
+        polled = threading.Event()
+
+        def get_status(download_id):
+            polled.set()
+            return DownloadStatus(
+                progress=50,
+                state=DownloadState.DOWNLOADING,
+                message="Downloading",
+                complete=False,
+                file_path=None,
+            )
+
+        mock_client = MagicMock()
+        mock_client.name = "nzbget"
+        mock_client.get_status.side_effect = get_status
+        mock_client.get_download_path.return_value = None
+        cancel_flag = Event()
+        recorder = ProgressRecorder()
+        results = []
+
+        with patch("shelfmark.release_sources.prowlarr.handler.POLL_INTERVAL", 30), \
+             patch("shelfmark.release_sources.prowlarr.handler.MAX_POLL_INTERVAL", 30):
+            thread = threading.Thread(
+                target=lambda: results.append(
+                    ProwlarrHandler()._poll_and_complete(
+                        client=mock_client,
+                        download_id="nzb-1",
+                        protocol="usenet",
+                        task=DownloadTask(task_id="cancel-now", source="prowlarr", title="Test Book"),
+                        cancel_flag=cancel_flag,
+                        progress_callback=recorder.progress_callback,
+                        status_callback=recorder.status_callback,
+                    )
+                )
+            )
+            thread.start()
+            assert polled.wait(timeout=5)
+
+            started = time.monotonic()
+            cancel_flag.set()
+            thread.join(timeout=5)
+
+        assert not thread.is_alive()
+        assert time.monotonic() - started < 5
+        assert results == [None]
+        assert recorder.last_status == "cancelled"
+        mock_client.remove.assert_called_once_with("nzb-1", delete_files=True)
+
+
+class TestProwlarrHandlerConcurrency:
+    """Downloads are dispatched concurrently by the orchestrator's worker pool."""
+
+    def test_concurrent_downloads_submit_in_parallel(self):
+        import threading
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source_file = Path(tmp_dir) / "book.epub"
+            source_file.write_text("test content")
+
+            # Both add_download calls must be in flight at once to pass the barrier.
+            barrier = threading.Barrier(2, timeout=5)
+
+            def add_download(**kwargs):
+                barrier.wait()
+                return kwargs["url"].rsplit(":", 1)[-1]
+
+            mock_client = MagicMock()
+            mock_client.name = "test_client"
+            mock_client.find_existing.return_value = None
+            mock_client.add_download.side_effect = add_download
+            mock_client.get_status.return_value = DownloadStatus(
+                progress=100,
+                state=DownloadState.COMPLETE,
+                message="Complete",
+                complete=True,
+                file_path=str(source_file),
+            )
+            mock_client.get_download_path.return_value = str(source_file)
+            releases = {
+                f"task-{n}": {"protocol": "torrent", "magnetUrl": f"magnet:?xt=urn:btih:hash{n}"}
+                for n in range(2)
+            }
+            results = {}
+
+            def run(task_id):
+                results[task_id] = ProwlarrHandler().download(
+                    task=DownloadTask(task_id=task_id, source="prowlarr", title="Test Book"),
+                    cancel_flag=Event(),
+                    progress_callback=lambda progress: None,
+                    status_callback=lambda status, message: None,
+                )
+
+            with patch(
+                "shelfmark.release_sources.prowlarr.handler.get_release",
+                side_effect=releases.get,
+            ), patch(
+                "shelfmark.release_sources.prowlarr.handler.get_client",
+                return_value=mock_client,
+            ), patch(
+                "shelfmark.release_sources.prowlarr.handler.remove_release",
+            ):
+                threads = [threading.Thread(target=run, args=(task_id,)) for task_id in releases]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join(timeout=10)
+
+            assert results == {task_id: str(source_file) for task_id in releases}
+
 
 class TestProwlarrHandlerCancel:
     """Tests for ProwlarrHandler.cancel()."""
@@ -877,6 +1077,66 @@ class TestProwlarrHandlerFileStaging:
                 assert returned_file.read_text() == "new content"
 
 
+class TestProwlarrHandlerCategory:
+    """Tests for audiobook category selection."""
+
+    def test_audiobook_category_cached_until_config_changes(self):
+        from shelfmark.release_sources.prowlarr import handler as handler_module
+
+        handler_module._audiobook_category.cache_clear()
+        client = MagicMock()
+        client.name = "qbittorrent"
+        task = DownloadTask(task_id="cat", source="prowlarr", title="Book", content_type="audiobook")
+        values = {"QBITTORRENT_CATEGORY_AUDIOBOOK": "audiobooks"}
+
+        with patch.object(handler_module.config, "get", side_effect=lambda key, default=None: values.get(key, default)) as get, \
+             patch.object(handler_module, "get_config_version", return_value=1):
+            handler = ProwlarrHandler()
+            assert handler._get_category_for_task(client, task) == "audiobooks"
+            assert handler._get_category_for_task(client, task) == "audiobooks"
+            assert get.call_count == 1
+
+            values["QBITTORRENT_CATEGORY_AUDIOBOOK"] = "abooks"
+            handler_module.get_config_version.return_value = 2
+            assert handler._get_category_for_task(client, task) == "abooks"
+
+        handler_module._audiobook_category.cache_clear()
+
+    def test_non_audiobook_uses_default_category(self):
+        client = MagicMock()
+        client.name = "qbittorrent"
+        task = DownloadTask(task_id="cat", source="prowlarr", title="Book", content_type="ebook")
+
+        assert ProwlarrHandler()._get_category_for_task(client, task) is None
+
+
+class TestProwlarrHandlerProgressMessage:
+    """Tests for progress message formatting."""
+
+    @pytest.mark.parametrize(
+        "speed,eta,expected",
+        [
+            (None, None, "42%"),
+            (0, 0, "42%"),
+            (5 * 1024 * 1024, None, "42% (5.0 MB/s)"),
+            (None, 45, "42% - 45s left"),
+            (1536 * 1024, 600, "42% (1.5 MB/s) - 10m left"),
+            (None, 3 * 3600 + 25 * 60 + 10, "42% - 3h 25m left"),
+        ],
+    )
+    def test_progress_message(self, speed, eta, expected):
+        status = DownloadStatus(
+            progress=42.4,
+            state=DownloadState.DOWNLOADING,
+            message=None,
+            complete=False,
+            file_path=None,
+            download_speed=speed,
+            eta=eta,
+        )
+        assert ProwlarrHandler()._build_progress_message(status) == expected
+
+
 class TestProwlarrHandlerPostProcessCleanup:
     def test_usenet_move_triggers_client_cleanup(self):
         handler = ProwlarrHandler()
@@ -8,6 +8,7 @@ without requiring a running qBittorrent instance.
 import sys
 from unittest.mock import MagicMock, patch
 import pytest
+import requests
 
 from shelfmark.release_sources.prowlarr.clients import DownloadStatus
 from shelfmark.release_sources.prowlarr.clients.torrent_utils import TorrentInfo
@@ -111,6 +112,34 @@ class TestQBittorrentClientIsConfigured:
         assert QBittorrentClient.is_configured() is False
 
 
+class TestQBittorrentClientInit:
+    """Tests for QBittorrentClient construction."""
+
+    def test_client_uses_pooled_adapter(self, monkeypatch):
+        config_values = {
+            "QBITTORRENT_URL": "localhost:8080",
+            "QBITTORRENT_USERNAME": "admin",
+            "QBITTORRENT_PASSWORD": "password",
+        }
+        monkeypatch.setattr(
+            "shelfmark.release_sources.prowlarr.clients.qbittorrent.config.get",
+            lambda key, default="": config_values.get(key, default),
+        )
+
+        mock_client_class = MagicMock()
+
+        with patch.dict('sys.modules', {'qbittorrentapi': MagicMock(Client=mock_client_class)}):
+            import importlib
+            import shelfmark.release_sources.prowlarr.clients.qbittorrent as qb_module
+            importlib.reload(qb_module)
+
+            qb_module.QBittorrentClient()
+
+            kwargs = mock_client_class.call_args.kwargs
+            assert kwargs["host"] == "http://localhost:8080"
+            assert kwargs["HTTPADAPTER_ARGS"] == {"pool_connections": 4, "pool_maxsize": 20}
+
+
 class TestQBittorrentClientTestConnection:
     """Tests for QBittorrentClient.test_connection()."""
 
@@ -450,8 +479,8 @@ class TestQBittorrentClientAddDownload:
         mock_client_instance = MagicMock()
         mock_client_instance.torrents_add.return_value = "Ok."
         mock_client_instance.torrents_info.return_value = [mock_torrent]
-        # Used by the properties check
-        mock_client_instance._session.get.return_value = create_mock_session_response({}, status_code=200)
+        # Used by the registration check
+        mock_client_instance._session.get.return_value = create_mock_session_response([mock_torrent], status_code=200)
         mock_client_class = MagicMock(return_value=mock_client_instance)
 
         with patch.dict('sys.modules', {'qbittorrentapi': MagicMock(Client=mock_client_class)}):
@@ -484,7 +513,7 @@ class TestQBittorrentClientAddDownload:
         mock_client_instance = MagicMock()
         mock_client_instance.torrents_add.return_value = "Ok."
         mock_client_instance.torrents_info.return_value = [mock_torrent]
-        mock_client_instance._session.get.return_value = create_mock_session_response({}, status_code=200)
+        mock_client_instance._session.get.return_value = create_mock_session_response([mock_torrent], status_code=200)
         mock_client_class = MagicMock(return_value=mock_client_instance)
 
         with patch.dict('sys.modules', {'qbittorrentapi': MagicMock(Client=mock_client_class)}):
@@ -535,8 +564,12 @@ class TestQBittorrentClientAddDownload:
         mock_client_instance = MagicMock()
         mock_client_instance.torrents_add.return_value = "Ok."
         mock_client_instance.torrents_info.return_value = [mock_torrent]
-        # Used by the properties check
-        mock_client_instance._session.get.return_value = create_mock_session_response({}, status_code=200)
+        mock_client_instance.app.web_api_version = "2.9.3"
+        # Not present before the add, then visible to the registration check
+        mock_client_instance._session.get.side_effect = [
+            create_mock_session_response([], status_code=200),
+            create_mock_session_response([mock_torrent], status_code=200),
+        ]
         mock_client_class = MagicMock(return_value=mock_client_instance)
 
         with patch.dict('sys.modules', {'qbittorrentapi': MagicMock(Client=mock_client_class)}):
@@ -550,6 +583,86 @@ class TestQBittorrentClientAddDownload:
 
             mock_client_instance.torrents_create_category.assert_called_once_with(name="books")
 
+    VALID_HASH = "a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f6a1b2"
+
+    def _poll_until_loaded(self, monkeypatch, responses):
+        config_values = {
+            "QBITTORRENT_URL": "http://localhost:8080",
+            "QBITTORRENT_CATEGORY": "books",
+        }
+        monkeypatch.setattr(
+            "shelfmark.release_sources.prowlarr.clients.qbittorrent.config.get",
+            lambda key, default="": config_values.get(key, default),
+        )
+
+        valid_hash = self.VALID_HASH
+        mock_client_instance = MagicMock()
+        mock_client_instance.torrents_add.return_value = "Ok."
+        mock_client_instance.app.web_api_version = "2.9.3"
+        mock_client_instance._session.get.side_effect = responses
+        mock_client_class = MagicMock(return_value=mock_client_instance)
+
+        with patch.dict('sys.modules', {'qbittorrentapi': MagicMock(Client=mock_client_class)}):
+            import importlib
+            import shelfmark.release_sources.prowlarr.clients.qbittorrent as qb_module
+            importlib.reload(qb_module)
+
+            client = qb_module.QBittorrentClient()
+            with patch.object(qb_module.time, "sleep") as mock_sleep, \
+                 patch.object(qb_module.random, "uniform", return_value=1.0):
+                result = client.add_download(f"magnet:?xt=urn:btih:{valid_hash}&dn=test", "Test")
+
+        assert result == valid_hash
+        return [c.args[0] for c in mock_sleep.call_args_list]
+
+    def test_add_download_polls_with_backoff(self, monkeypatch):
+        """Registration polling starts short and doubles between attempts."""
+        missing = create_mock_session_response([])
+        loaded = create_mock_session_response([MockTorrent(hash_val=self.VALID_HASH)])
+        # The first miss is the pre-add existence check.
+        delays = self._poll_until_loaded(
+            monkeypatch,
+            [missing, missing, missing, missing, loaded],
+        )
+
+        assert delays == pytest.approx([0.05, 0.1, 0.2])
+
+    def test_add_download_skips_existing_torrent(self, monkeypatch):
+        config_values = {"QBITTORRENT_URL": "http://localhost:8080"}
+        monkeypatch.setattr(
+            "shelfmark.release_sources.prowlarr.clients.qbittorrent.config.get",
+            lambda key, default="": config_values.get(key, default),
+        )
+
+        mock_client_instance = MagicMock()
+        mock_client_instance._session.get.return_value = create_mock_session_response(
+            [MockTorrent(hash_val=self.VALID_HASH)]
+        )
+        mock_client_class = MagicMock(return_value=mock_client_instance)
+
+        with patch.dict('sys.modules', {'qbittorrentapi': MagicMock(Client=mock_client_class)}):
+            import importlib
+            import shelfmark.release_sources.prowlarr.clients.qbittorrent as qb_module
+            importlib.reload(qb_module)
+
+            client = qb_module.QBittorrentClient()
+            result = client.add_download(f"magnet:?xt=urn:btih:{self.VALID_HASH}&dn=test", "Test")
+
+        assert result == self.VALID_HASH
+        assert mock_client_instance._session.get.call_count == 1
+        mock_client_instance.torrents_create_category.assert_not_called()
+        mock_client_instance.torrents_add.assert_not_called()
+
+    def test_add_download_honors_retry_after(self, monkeypatch):
+        limited = create_mock_session_response([], status_code=429)
+        limited.headers = {"Retry-After": "2"}
+        limited.raise_for_status.side_effect = requests.exceptions.HTTPError(response=limited)
+        loaded = create_mock_session_response([MockTorrent(hash_val=self.VALID_HASH)])
+        missing = create_mock_session_response([])
+        delays = self._poll_until_loaded(monkeypatch, [missing, limited, loaded])
+
+        assert delays == pytest.approx([2.0])
+
 
 class TestQBittorrentClientRemove:
     """Tests for QBittorrentClient.remove()."""
@@ -862,6 +975,519 @@ class TestQBittorrentClientFindExisting:
             assert result is None
 
 
+class TestQBittorrentClientCaching:
+    """Tests for the listing and derived-path caches."""
+
+    CONFIG = {
+        "QBITTORRENT_URL": "http://localhost:8080",
+        "QBITTORRENT_USERNAME": "admin",
+        "QBITTORRENT_PASSWORD": "password",
+        "QBITTORRENT_CATEGORY": "test",
+    }
+
+    def _make_client(self, monkeypatch, mock_client_instance):
+        monkeypatch.setattr(
+            "shelfmark.release_sources.prowlarr.clients.qbittorrent.config.get",
+            lambda key, default="": self.CONFIG.get(key, default),
+        )
+        mock_client_class = MagicMock(return_value=mock_client_instance)
+        with patch.dict('sys.modules', {'qbittorrentapi': MagicMock(Client=mock_client_class)}):
+            import importlib
+            import shelfmark.release_sources.prowlarr.clients.qbittorrent as qb_module
+            importlib.reload(qb_module)
+            return qb_module, qb_module.QBittorrentClient()
+
+    def test_fallback_listing_reused_within_ttl(self, monkeypatch):
+        """A hash miss only refetches the hash query, not the fallback listings."""
+        listed = MockTorrent(hash_val="other", progress=0.2)
+        mock_client_instance = MagicMock()
+
+        def get_side_effect(url, params=None, timeout=None):
+            if params and "hashes" in params:
+                return create_mock_session_response([])
+            return create_mock_session_response([listed])
+
+        mock_client_instance._session.get.side_effect = get_side_effect
+        qb_module, client = self._make_client(monkeypatch, mock_client_instance)
+
+        client.get_status("abc123")
+        client.get_status("abc123")
+
+        params = [c.kwargs["params"] for c in mock_client_instance._session.get.call_args_list]
+        assert params == [{"hashes": "abc123"}, {"category": "test"}, {"hashes": "abc123"}]
+
+    def test_fallback_lookup_returns_only_matches(self, monkeypatch):
+        mock_client_instance = MagicMock()
+
+        def get_side_effect(url, params=None, timeout=None):
+            if params and "hashes" in params:
+                return create_mock_session_response([])
+            return create_mock_session_response([
+                MockTorrent(hash_val="other"),
+                MockTorrent(hash_val="abc123", name="Wanted"),
+            ])
+
+        mock_client_instance._session.get.side_effect = get_side_effect
+        qb_module, client = self._make_client(monkeypatch, mock_client_instance)
+
+        torrents, error = client._get_torrents_info("ABC123")
+
+        assert error is None
+        assert [t["name"] for t in torrents] == ["Wanted"]
+
+    def test_listing_cache_cleared_on_remove(self, monkeypatch):
+        mock_client_instance = MagicMock()
+        mock_client_instance._session.get.side_effect = [
+            create_mock_session_response([]),
+            create_mock_session_response([MockTorrent(hash_val="other")]),
+        ]
+        qb_module, client = self._make_client(monkeypatch, mock_client_instance)
+
+        client.get_status("abc123")
+        assert qb_module._listing_cache
+
+        client.remove("other")
+        assert not qb_module._listing_cache
+
+    def test_listing_cache_cleared_on_error(self, monkeypatch):
+        mock_client_instance = MagicMock()
+        mock_client_instance._session.get.side_effect = [
+            create_mock_session_response([]),
+            create_mock_session_response([MockTorrent(hash_val="other")]),
+            create_mock_session_response([], status_code=403),
+            create_mock_session_response([], status_code=403),
+        ]
+        qb_module, client = self._make_client(monkeypatch, mock_client_instance)
+
+        client.get_status("abc123")
+        assert qb_module._listing_cache
+
+        status = client.get_status("abc123")
+        assert status.state_value == "error"
+        assert not qb_module._listing_cache
+
+    def test_hash_miss_skips_fallbacks_on_modern_api(self, monkeypatch):
+        mock_client_instance = MagicMock()
+        mock_client_instance.app.web_api_version = "2.9.3"
+        mock_client_instance._session.get.return_value = create_mock_session_response([])
+        qb_module, client = self._make_client(monkeypatch, mock_client_instance)
+
+        torrents, error = client._get_torrents_info("3b245504cf5f11bbdbe1201cea6a6bf45aee1bc0")
+        client._get_torrents_info("a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f6a1b2")
+
+        assert (torrents, error) == ([], None)
+        assert mock_client_instance._session.get.call_count == 2
+        assert qb_module._hash_filter_support == {"http://localhost:8080": True}
+
+    def test_amarr_hash_keeps_fallbacks_on_modern_api(self, monkeypatch):
+        mock_client_instance = MagicMock()
+        mock_client_instance.app.web_api_version = "2.9.3"
+        mock_client_instance._session.get.return_value = create_mock_session_response([])
+        qb_module, client = self._make_client(monkeypatch, mock_client_instance)
+
+        client._get_torrents_info("0320c47b3baa01f8d5f42cd7c05ce28d00000000")
+
+        assert mock_client_instance._session.get.call_count == 3
+
+    def test_hash_miss_keeps_fallbacks_on_old_api(self, monkeypatch):
+        mock_client_instance = MagicMock()
+        mock_client_instance.app.web_api_version = "2.2"
+        mock_client_instance._session.get.return_value = create_mock_session_response([])
+        qb_module, client = self._make_client(monkeypatch, mock_client_instance)
+
+        client._get_torrents_info("3b245504cf5f11bbdbe1201cea6a6bf45aee1bc0")
+
+        assert mock_client_instance._session.get.call_count == 3
+        assert qb_module._hash_filter_support == {"http://localhost:8080": False}
+
+    def test_failed_version_probe_not_retried_every_poll(self, monkeypatch):
+        import time
+
+        mock_client_instance = MagicMock()
+        type(mock_client_instance.app).web_api_version = property(
+            MagicMock(side_effect=RuntimeError("unreachable"))
+        )
+        mock_client_instance._session.get.return_value = create_mock_session_response([])
+        qb_module, client = self._make_client(monkeypatch, mock_client_instance)
+        probe = type(mock_client_instance.app).web_api_version.fget
+
+        assert client._supports_hash_filter() is False
+        assert client._supports_hash_filter() is False
+        assert probe.call_count == 1
+        assert qb_module._hash_filter_support == {}
+
+        # Probed again once the negative result expires.
+        qb_module._hash_filter_probe_failed["http://localhost:8080"] = (
+            time.monotonic() - qb_module._HASH_FILTER_RETRY_SEC - 1
+        )
+        client._supports_hash_filter()
+        assert probe.call_count == 2
+
+    def test_torrent_info_reused_between_find_and_add(self, monkeypatch):
+        torrent_hash = "3b245504cf5f11bbdbe1201cea6a6bf45aee1bc0"
+        mock_client_instance = MagicMock()
+        mock_client_instance.torrents_add.return_value = "Ok."
+        mock_client_instance.app.web_api_version = "2.9.3"
+        mock_client_instance._session.get.side_effect = [
+            create_mock_session_response([]),
+            create_mock_session_response([]),
+            create_mock_session_response([MockTorrent(hash_val=torrent_hash)]),
+        ]
+        qb_module, client = self._make_client(monkeypatch, mock_client_instance)
+        info = TorrentInfo(info_hash=torrent_hash, torrent_data=b"d4:infoe", is_magnet=False)
+
+        with patch.object(qb_module, "extract_torrent_info", return_value=info) as mock_extract:
+            client.find_existing("http://example.com/test.torrent")
+            client.add_download("http://example.com/test.torrent", "Test", expected_hash=torrent_hash)
+
+        mock_extract.assert_called_once_with("http://example.com/test.torrent", expected_hash=None)
+        mock_client_instance.torrents_add.assert_called_once()
+        assert mock_client_instance.torrents_add.call_args.kwargs["torrent_files"] == b"d4:infoe"
+
+    def test_find_existing_reuses_matched_entry(self, monkeypatch):
+        torrent_hash = "3b245504cf5f11bbdbe1201cea6a6bf45aee1bc0"
+        mock_client_instance = MagicMock()
+        mock_client_instance._session.get.return_value = create_mock_session_response(
+            [MockTorrent(hash_val=torrent_hash, progress=0.4)]
+        )
+        qb_module, client = self._make_client(monkeypatch, mock_client_instance)
+
+        download_id, status = client.find_existing(f"magnet:?xt=urn:btih:{torrent_hash}")
+
+        assert download_id == torrent_hash
+        assert status.progress == 40.0
+        assert mock_client_instance._session.get.call_count == 1
+
+    def test_expected_hash_lowercased_once(self, monkeypatch):
+        qb_module, client = self._make_client(monkeypatch, MagicMock())
+        info = TorrentInfo(info_hash="3B245504CF5F11BBDBE1201CEA6A6BF45AEE1BC0", torrent_data=None, is_magnet=False)
+
+        with patch.object(qb_module, "extract_torrent_info", return_value=info):
+            first = qb_module._get_torrent_info("http://example.com/test.torrent")
+            second = qb_module._get_torrent_info("http://example.com/test.torrent")
+
+        assert first.info_hash == "3b245504cf5f11bbdbe1201cea6a6bf45aee1bc0"
+        assert second is first
+
+    def test_torrent_info_without_hash_not_cached(self, monkeypatch):
+        qb_module, client = self._make_client(monkeypatch, MagicMock())
+        info = TorrentInfo(info_hash=None, torrent_data=None, is_magnet=False)
+
+        with patch.object(qb_module, "extract_torrent_info", return_value=info) as mock_extract:
+            assert client.find_existing("http://example.com/test.torrent") is None
+            assert client.find_existing("http://example.com/test.torrent") is None
+
+        assert mock_extract.call_count == 2
+
+    def test_login_reused_across_requests(self, monkeypatch):
+        mock_client_instance = MagicMock()
+        mock_client_instance._session.get.return_value = create_mock_session_response(
+            [MockTorrent(hash_val="abc123")]
+        )
+        qb_module, client = self._make_client(monkeypatch, mock_client_instance)
+
+        client.get_status("abc123")
+        client.get_status("abc123")
+
+        assert mock_client_instance.auth_log_in.call_count == 1
+
+    def test_forbidden_forces_login(self, monkeypatch):
+        mock_client_instance = MagicMock()
+        mock_client_instance._session.get.side_effect = [
+            create_mock_session_response([MockTorrent(hash_val="abc123")]),
+            create_mock_session_response([], status_code=403),
+            create_mock_session_response([MockTorrent(hash_val="abc123")]),
+        ]
+        qb_module, client = self._make_client(monkeypatch, mock_client_instance)
+
+        client.get_status("abc123")
+        status = client.get_status("abc123")
+
+        assert status.state_value == "downloading"
+        assert mock_client_instance.auth_log_in.call_count == 2
+
+    def test_derived_path_uses_listing_save_path(self, monkeypatch):
+        mock_client_instance = MagicMock()
+        files_response = MagicMock(status_code=200)
+        files_response.json.return_value = [{"name": "Some Torrent/book.epub"}]
+        mock_client_instance._session.get.return_value = files_response
+        qb_module, client = self._make_client(monkeypatch, mock_client_instance)
+
+        path = client._derive_download_path_from_files("abc123", save_path="/downloads")
+
+        assert path == "/downloads/Some Torrent"
+        urls = [c.args[0] for c in mock_client_instance._session.get.call_args_list]
+        assert urls == ["http://localhost:8080/api/v2/torrents/files"]
+
+    def test_add_after_find_existing_miss_skips_recheck(self, monkeypatch):
+        torrent_hash = "3b245504cf5f11bbdbe1201cea6a6bf45aee1bc0"
+        mock_client_instance = MagicMock()
+        mock_client_instance.app.web_api_version = "2.9.3"
+        mock_client_instance.torrents_add.return_value = "Ok."
+        mock_client_instance._session.get.side_effect = [
+            create_mock_session_response([]),
+            create_mock_session_response([MockTorrent(hash_val=torrent_hash)]),
+        ]
+        qb_module, client = self._make_client(monkeypatch, mock_client_instance)
+        url = f"magnet:?xt=urn:btih:{torrent_hash}"
+
+        assert client.find_existing(url) is None
+        assert client.add_download(url, "Test") == torrent_hash
+
+        # One lookup for find_existing, one poll after the add; no pre-add recheck.
+        assert mock_client_instance._session.get.call_count == 2
+        mock_client_instance.torrents_add.assert_called_once()
+        assert qb_module._recent_misses == {}
+
+    def test_category_created_once(self, monkeypatch):
+        first_hash = "a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f6a1b2"
+        second_hash = "3b245504cf5f11bbdbe1201cea6a6bf45aee1bc0"
+        mock_client_instance = MagicMock()
+        mock_client_instance.app.web_api_version = "2.9.3"
+        mock_client_instance.torrents_add.return_value = "Ok."
+        mock_client_instance._session.get.side_effect = [
+            create_mock_session_response([]),
+            create_mock_session_response([MockTorrent(hash_val=first_hash)]),
+            create_mock_session_response([]),
+            create_mock_session_response([MockTorrent(hash_val=second_hash)]),
+        ]
+        qb_module, client = self._make_client(monkeypatch, mock_client_instance)
+
+        client.add_download(f"magnet:?xt=urn:btih:{first_hash}", "First")
+        client.add_download(f"magnet:?xt=urn:btih:{second_hash}", "Second")
+
+        mock_client_instance.torrents_create_category.assert_called_once_with(name="test")
+
+    def test_category_rechecked_after_failed_add(self, monkeypatch):
+        torrent_hash = "a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f6a1b2"
+        mock_client_instance = MagicMock()
+        mock_client_instance.app.web_api_version = "2.9.3"
+        mock_client_instance.torrents_add.return_value = "Fails."
+        mock_client_instance._session.get.return_value = create_mock_session_response([])
+        qb_module, client = self._make_client(monkeypatch, mock_client_instance)
+
+        for _ in range(2):
+            with pytest.raises(Exception):
+                client.add_download(f"magnet:?xt=urn:btih:{torrent_hash}", "Test")
+
+        assert mock_client_instance.torrents_create_category.call_count == 2
+
+    def test_background_refresh_serves_status_from_memory(self, monkeypatch):
+        import time
+
+        monkeypatch.setitem(self.CONFIG, "QBITTORRENT_BACKGROUND_REFRESH", True)
+        mock_client_instance = MagicMock()
+        mock_client_instance._session.get.return_value = create_mock_session_response(
+            [MockTorrent(hash_val="abc123", progress=0.5)]
+        )
+        qb_module, client = self._make_client(monkeypatch, mock_client_instance)
+        try:
+            deadline = time.monotonic() + 2
+            while not qb_module._listing_cache and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert ("http://localhost:8080", ()) in qb_module._listing_cache
+
+            # Park the refresher so it can't fetch while we count requests.
+            qb_module._refresher.stop()
+
+            calls_before = mock_client_instance._session.get.call_count
+            status = client.get_status("ABC123")
+            assert mock_client_instance._session.get.call_count == calls_before
+            assert status.progress == 50.0
+        finally:
+            client.stop()
+
+        assert qb_module._refresher is None
+
+    def test_background_refresh_follows_sync_deltas(self, monkeypatch):
+        monkeypatch.setitem(self.CONFIG, "QBITTORRENT_BACKGROUND_REFRESH", False)
+        mock_client_instance = MagicMock()
+        qb_module, _ = self._make_client(monkeypatch, mock_client_instance)
+        refresher = qb_module._ListingRefresher(
+            MagicMock(return_value=mock_client_instance), "http://localhost:8080", "admin", "password"
+        )
+
+        def maindata(payload):
+            response = MagicMock(status_code=200)
+            response.json.return_value = payload
+            return response
+
+        mock_client_instance._session.get.side_effect = [
+            maindata({
+                "rid": 1,
+                "full_update": True,
+                "torrents": {
+                    "abc123": {"name": "Book", "state": "downloading", "progress": 0.25},
+                    "def456": {"name": "Other", "state": "uploading", "progress": 1.0},
+                },
+            }),
+            maindata({"rid": 2, "torrents": {"abc123": {"progress": 0.75}}, "torrents_removed": ["def456"]}),
+        ]
+        synced: dict = {}
+
+        rid = refresher._sync_torrents(0, synced)
+        rid = refresher._sync_torrents(rid, synced)
+
+        assert rid == 2
+        assert synced == {
+            "abc123": {"hash": "abc123", "name": "Book", "state": "downloading", "progress": 0.75},
+        }
+        params = [c.kwargs["params"] for c in mock_client_instance._session.get.call_args_list]
+        assert params == [{"rid": 0}, {"rid": 1}]
+
+    def test_sync_deltas_leave_published_entries_untouched(self, monkeypatch):
+        monkeypatch.setitem(self.CONFIG, "QBITTORRENT_BACKGROUND_REFRESH", False)
+        mock_client_instance = MagicMock()
+        qb_module, _ = self._make_client(monkeypatch, mock_client_instance)
+        refresher = qb_module._ListingRefresher(
+            MagicMock(return_value=mock_client_instance), "http://localhost:8080", "admin", "password"
+        )
+
+        def maindata(payload):
+            response = MagicMock(status_code=200)
+            response.json.return_value = payload
+            return response
+
+        mock_client_instance._session.get.side_effect = [
+            maindata({"rid": 1, "full_update": True, "torrents": {"abc123": {"state": "downloading", "progress": 0.25}}}),
+            maindata({"rid": 2, "torrents": {"abc123": {"progress": 0.75}}}),
+        ]
+        synced: dict = {}
+        key = ("http://localhost:8080", ())
+
+        rid = refresher._sync_torrents(0, synced)
+        published = qb_module._store_cached_listing(key, list(synced.values()))
+        refresher._sync_torrents(rid, synced)
+
+        # A task thread reading the published listing never sees a half-applied delta.
+        assert published["abc123"]["progress"] == 0.25
+        assert synced["abc123"]["progress"] == 0.75
+
+    def test_background_refresh_falls_back_without_sync_api(self, monkeypatch):
+        import time
+
+        monkeypatch.setitem(self.CONFIG, "QBITTORRENT_BACKGROUND_REFRESH", True)
+        mock_client_instance = MagicMock()
+        not_found = MagicMock(status_code=404)
+        not_found.raise_for_status.side_effect = requests.exceptions.HTTPError(response=not_found)
+        listing = create_mock_session_response([MockTorrent(hash_val="abc123", progress=0.5)])
+
+        def get(url, params=None, timeout=None):
+            return not_found if url.endswith("/sync/maindata") else listing
+
+        mock_client_instance._session.get.side_effect = get
+        qb_module, client = self._make_client(monkeypatch, mock_client_instance)
+        try:
+            deadline = time.monotonic() + 2
+            while not qb_module._listing_cache and time.monotonic() < deadline:
+                time.sleep(0.01)
+            qb_module._refresher.stop()
+        finally:
+            client.stop()
+
+        assert ("http://localhost:8080", ()) in qb_module._listing_cache
+        urls = [c.args[0] for c in mock_client_instance._session.get.call_args_list]
+        assert urls.count("http://localhost:8080/api/v2/sync/maindata") == 1
+
+    def test_refresher_stopped_when_disabled(self, monkeypatch):
+        monkeypatch.setitem(self.CONFIG, "QBITTORRENT_BACKGROUND_REFRESH", True)
+        mock_client_instance = MagicMock()
+        mock_client_instance._session.get.return_value = create_mock_session_response([])
+        qb_module, client = self._make_client(monkeypatch, mock_client_instance)
+        refresher = qb_module._refresher
+
+        monkeypatch.setitem(self.CONFIG, "QBITTORRENT_BACKGROUND_REFRESH", False)
+        with patch.dict('sys.modules', {'qbittorrentapi': MagicMock()}):
+            qb_module.QBittorrentClient()
+
+        assert qb_module._refresher is None
+        assert not refresher._thread.is_alive()
+
+    def test_refresher_uses_its_own_client(self, monkeypatch):
+        import time
+
+        monkeypatch.setitem(self.CONFIG, "QBITTORRENT_BACKGROUND_REFRESH", True)
+        task_client = MagicMock()
+        refresher_client = MagicMock()
+        refresher_client._session.get.return_value = create_mock_session_response([])
+        monkeypatch.setattr(
+            "shelfmark.release_sources.prowlarr.clients.qbittorrent.config.get",
+            lambda key, default="": self.CONFIG.get(key, default),
+        )
+        client_class = MagicMock(side_effect=[task_client, refresher_client])
+        with patch.dict('sys.modules', {'qbittorrentapi': MagicMock(Client=client_class)}):
+            import importlib
+            import shelfmark.release_sources.prowlarr.clients.qbittorrent as qb_module
+            importlib.reload(qb_module)
+            client = qb_module.QBittorrentClient()
+        try:
+            deadline = time.monotonic() + 2
+            while not refresher_client._session.get.called and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            client.stop()
+
+        assert client_class.call_count == 2
+        refresher_client.auth_log_in.assert_called()
+        refresher_client._session.get.assert_called()
+        task_client.auth_log_in.assert_not_called()
+        task_client._session.get.assert_not_called()
+
+    def test_refresher_restarted_when_login_changes(self, monkeypatch):
+        monkeypatch.setitem(self.CONFIG, "QBITTORRENT_BACKGROUND_REFRESH", True)
+        mock_client_instance = MagicMock()
+        mock_client_instance._session.get.return_value = create_mock_session_response([])
+        qb_module, client = self._make_client(monkeypatch, mock_client_instance)
+        first = qb_module._refresher
+
+        try:
+            with patch.dict('sys.modules', {'qbittorrentapi': MagicMock()}):
+                qb_module.QBittorrentClient()
+            assert qb_module._refresher is first
+
+            monkeypatch.setitem(self.CONFIG, "QBITTORRENT_PASSWORD", "changed")
+            with patch.dict('sys.modules', {'qbittorrentapi': MagicMock()}):
+                qb_module.QBittorrentClient()
+            second = qb_module._refresher
+        finally:
+            client.stop()
+
+        assert second is not first
+        assert second.key == ("http://localhost:8080", "admin", "changed")
+        assert first.stopped
+        assert not first._thread.is_alive()
+
+    def test_derived_path_handles_backslash_names(self, monkeypatch):
+        mock_client_instance = MagicMock()
+        files_response = MagicMock(status_code=200)
+        files_response.json.return_value = [{"name": "Some Torrent\\book.epub"}]
+        mock_client_instance._session.get.return_value = files_response
+        qb_module, client = self._make_client(monkeypatch, mock_client_instance)
+
+        path = client._derive_download_path_from_files("abc123", save_path="/downloads")
+
+        assert path == "/downloads/Some Torrent"
+
+    def test_derived_path_memoized(self, monkeypatch):
+        mock_client_instance = MagicMock()
+
+        def get_side_effect(url, params=None, timeout=None):
+            r = MagicMock()
+            r.status_code = 200
+            if url.endswith("/api/v2/torrents/properties"):
+                r.json.return_value = {"save_path": "/downloads"}
+            else:
+                r.json.return_value = [{"name": "Some Torrent/book.epub"}]
+            return r
+
+        mock_client_instance._session.get.side_effect = get_side_effect
+        qb_module, client = self._make_client(monkeypatch, mock_client_instance)
+
+        assert client._derive_download_path_from_files("ABC123") == "/downloads/Some Torrent"
+        assert client._derive_download_path_from_files("abc123") == "/downloads/Some Torrent"
+        assert mock_client_instance._session.get.call_count == 2
+
+
 class TestHashesMatch:
     """Tests for _hashes_match() - Amarr compatibility."""
 
@@ -897,3 +1523,53 @@ class TestHashesMatch:
         from shelfmark.release_sources.prowlarr.clients.qbittorrent import _hashes_match
         assert _hashes_match("a" * 40, "b" * 30) is False
         assert _hashes_match("a" * 38, "b" * 32) is False
+
+    def test_canonical_hash_strips_amarr_padding(self):
+        from shelfmark.release_sources.prowlarr.clients.qbittorrent import _canon_hash
+        assert _canon_hash("0320C47B3BAA01F8D5F42CD7C05CE28D00000000") == "0320c47b3baa01f8d5f42cd7c05ce28d"
+        assert _canon_hash("3B245504CF5F11BBDBE1201CEA6A6BF45AEE1BC0") == "3b245504cf5f11bbdbe1201cea6a6bf45aee1bc0"
+
+    def test_index_by_hash_keeps_first_entry(self):
+        from shelfmark.release_sources.prowlarr.clients.qbittorrent import _index_by_hash
+        first = {"hash": "0320C47B3BAA01F8D5F42CD7C05CE28D00000000"}
+        duplicate = {"hash": "0320c47b3baa01f8d5f42cd7c05ce28d"}
+        index = _index_by_hash([{"hash": ""}, {"name": "no hash"}, first, duplicate])
+        assert index == {"0320c47b3baa01f8d5f42cd7c05ce28d": first}
+
+    def test_find_torrent_matches_padded_hash(self):
+        from shelfmark.release_sources.prowlarr.clients.qbittorrent import _find_torrent
+        padded = {"hash": "0320c47b3baa01f8d5f42cd7c05ce28d00000000", "name": "Padded"}
+        torrents = [{"hash": None}, {"hash": "abc123"}, padded]
+        torrent = _find_torrent(torrents, "0320C47B3BAA01F8D5F42CD7C05CE28D")
+        assert torrent is not None
+        assert torrent.name == "Padded"
+        assert _find_torrent(torrents, "def456") is None
+
+
+class TestTorrentView:
+    """Tests for the slotted torrents/info entry."""
+
+    def test_reads_known_fields_only(self):
+        from shelfmark.release_sources.prowlarr.clients.qbittorrent import _Torrent
+        torrent = _Torrent({"hash": "abc123", "state": "uploading", "progress": 1.0, "tracker": "x"})
+        assert torrent.hash == "abc123"
+        assert torrent.state == "uploading"
+        assert torrent.progress == 1.0
+        assert not hasattr(torrent, "tracker")
+
+    def test_missing_fields_use_defaults(self):
+        from shelfmark.release_sources.prowlarr.clients.qbittorrent import _Torrent
+        torrent = _Torrent({})
+        assert torrent.hash is None
+        assert torrent.state == "unknown"
+        assert torrent.progress == 0.0
+        assert torrent.eta == 0
+        assert torrent.dlspeed is None
+        assert torrent.content_path == ""
+
+    def test_unknown_eta_ignored(self):
+        from shelfmark.release_sources.prowlarr.clients.qbittorrent import _eta_or_none
+        assert _eta_or_none(3600) == 3600
+        assert _eta_or_none(8640000) is None
+        assert _eta_or_none(0) is None
+        assert _eta_or_none("3600") is None
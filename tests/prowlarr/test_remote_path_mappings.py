@@ -8,11 +8,22 @@ from pathlib import Path
 from threading import Event
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from shelfmark.core.models import DownloadTask
+from shelfmark.release_sources.prowlarr import handler as handler_module
 from shelfmark.release_sources.prowlarr.clients import DownloadState, DownloadStatus
 from shelfmark.release_sources.prowlarr.handler import ProwlarrHandler
 
 
+@pytest.fixture(autouse=True)
+def fresh_mapping_index():
+    # Each test patches config.get without bumping the config version
+    handler_module._remote_path_mappings.cache_clear()
+    yield
+    handler_module._remote_path_mappings.cache_clear()
+
+
 class ProgressRecorder:
     def __init__(self):
         self.progress_values = []
@@ -376,3 +387,24 @@ def test_windows_path_case_insensitive_matching():
 
             assert result == str(local_file)
             assert task.original_download_path == str(local_file)
+
+
+def test_mapping_index_cached_until_config_changes():
+    values = {
+        "PROWLARR_REMOTE_PATH_MAPPINGS": [
+            {"host": "qbittorrent", "remotePath": "/remote", "localPath": "/local"},
+        ]
+    }
+
+    with patch.object(
+        handler_module.config, "get", side_effect=lambda key, default=None: values.get(key, default)
+    ) as get:
+        first = handler_module._remote_path_mappings(1)
+        assert handler_module._remote_path_mappings(1) is first
+        assert get.call_count == 1
+
+        values["PROWLARR_REMOTE_PATH_MAPPINGS"] = []
+        second = handler_module._remote_path_mappings(2)
+
+    assert first.find("qbittorrent", "/remote/book.epub").local_path == "/local"
+    assert len(second) == 0